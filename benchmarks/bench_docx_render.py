@@ -0,0 +1,69 @@
+"""
+Benchmark per-resume DOCX rendering: the in-process renderer vs a pandoc subprocess.
+Run with: python benchmarks/bench_docx_render.py [--projects 4 8 16] [--repeat 10]
+
+Resumes come from benchmarks.synthetic.resume_markdown and are styled with the default
+template's pandoc_template.docx. Reports best-of-N and median latency per document; the
+pandoc rows are skipped when pandoc is not installed.
+"""
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def _measure(fn, repeat: int) -> tuple[float, float]:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times), statistics.median(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--projects", type=int, nargs="+", default=[4, 8, 16])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    import contextlib
+    import io
+
+    from benchmarks.synthetic import resume_markdown
+    from resume_helper.config import resolve_template
+    from resume_helper.output.md2docx import _pandoc_executable, render_docx
+
+    _, reference = resolve_template(None)
+    engines = ["native"] + (["pandoc"] if _pandoc_executable() else [])
+    if len(engines) == 1:
+        print("pandoc not found on PATH: timing the native renderer only\n")
+
+    print(f"{'projects':>8}  {'md KB':>6}  {'engine':<6}  {'best ms':>8}  {'median ms':>9}  {'docx KB':>7}  {'speedup':>7}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in args.projects:
+            md = Path(tmp) / f"resume_{n}.md"
+            md.write_text(resume_markdown(n), encoding="utf-8")
+            baseline = None
+            for engine in reversed(engines):  # pandoc first, as the baseline
+                out = Path(tmp) / f"resume_{n}_{engine}.docx"
+
+                def _render() -> None:
+                    with contextlib.redirect_stderr(io.StringIO()):
+                        render_docx(md, out, reference, engine)
+
+                best, median = _measure(_render, args.repeat)
+                baseline = baseline or best
+                speedup = f"{baseline / best:>6.1f}x" if engine == "native" and len(engines) > 1 else ""
+                print(
+                    f"{n:>8}  {md.stat().st_size / 1024:>6.1f}  {engine:<6}  {best * 1000:>8.2f}  "
+                    f"{median * 1000:>9.2f}  {out.stat().st_size / 1024:>7.1f}  {speedup:>7}"
+                )
+
+
+if __name__ == "__main__":
+    main()
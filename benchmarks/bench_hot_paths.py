@@ -0,0 +1,206 @@
+"""
+Benchmark the local hot paths of build and import runs against synthetic projects.json files.
+Run with: python benchmarks/bench_hot_paths.py [--sizes 10 100 1000 10000 100000] [--repeat 5]
+                                               [--backend json|sqlite]
+                                               [--out results.json] [--baseline baseline.json]
+
+Each size is a projects.json with that many records. The stub provider stands in for the
+LLM, so the resume handed to format_and_write is what it answers to the full prompt.
+_extract_project_titles reads a resume listing every project; _preflight_coverage_check
+checks a fixed 20-title resume (half of the titles missing) against all n projects.
+load_projects is timed cold, with its in-process cache cleared before every call;
+search_projects warm, on the index kept with that cache (built once before timing).
+--backend sqlite stores the projects in a SQLite store (data/projects_sqlite.py) instead,
+and merges into a fresh copy of it on every repetition.
+
+--out writes the results as JSON. --baseline compares against an earlier --out file and
+exits 1, listing every case whose best time grew by more than --tolerance (and by more
+than --floor-ms, to ignore noise on sub-millisecond cases).
+"""
+import argparse
+import contextlib
+import io
+import json
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+CASES = [
+    "load_projects",
+    "filter_by_role_tag",
+    "search_projects",
+    "merge_projects",
+    "build_prompt",
+    "format_and_write",
+    "_extract_project_titles",
+    "_preflight_coverage_check",
+]
+
+# Titles in the resume used by the coverage check, whatever the projects.json size
+_COVERAGE_TITLES = 20
+
+# Two skills from benchmarks/synthetic.py's vocabulary, each on about a third of the projects
+_SEARCH_QUERY = "spark airflow"
+
+
+def _measure(fn, repeat: int, setup=None) -> tuple[float, float]:
+    times = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times), statistics.median(times)
+
+
+def _cases(tmp: Path, n: int, backend: str = "json") -> dict:
+    """Return {case: (setup or None, timed callable)} over a synthetic database of n records."""
+    from benchmarks.synthetic import projects, resume_text, write_projects_json
+    from resume_helper.builder.prompt_builder import build_prompt
+    from resume_helper.builder.resume_builder import _extract_project_titles, _preflight_coverage_check
+    from resume_helper.config import resolve_template
+    from resume_helper.data.projects_db import (
+        clear_cache, filter_by_role_tag, load_projects, merge_projects, search_projects,
+    )
+    from resume_helper.data.projects_sqlite import import_json
+    from resume_helper.llm.stub_provider import StubProvider
+    from resume_helper.output.formatter import format_and_write
+
+    projects_path = write_projects_json(tmp / f"projects_{n}.json", n)
+    merge_path = tmp / "merged.json"
+    merge_setup = None
+    if backend == "sqlite":
+        json_path, projects_path, merge_path = projects_path, tmp / f"projects_{n}.db", tmp / "merged.db"
+        projects_path.unlink(missing_ok=True)
+        import_json(json_path, projects_path)
+
+        def merge_setup() -> None:
+            shutil.copy(projects_path, merge_path)
+            for suffix in ("-wal", "-shm"):
+                Path(f"{merge_path}{suffix}").unlink(missing_ok=True)
+    loaded = load_projects(str(projects_path))
+    search_projects(str(projects_path), _SEARCH_QUERY)
+
+    # An import that brings n/10 new projects and n/10 already on file
+    k = max(1, n // 10)
+    incoming = projects(k, seed=1, start=n + 1) + [dict(p) for p in loaded[:k]]
+
+    system_prompt, _ = resolve_template(None)
+    base_resume = resume_text([p["title"] for p in loaded[:8]])
+    job = "Senior Data Scientist\nAcme Corp\nBuild forecasting models in Python and SQL."
+    _, user_prompt = build_prompt(base_resume, job, loaded, system_prompt)
+    raw_output = StubProvider().complete(system_prompt, user_prompt)
+
+    full_resume = resume_text([p["title"] for p in loaded])
+    half = _COVERAGE_TITLES // 2
+    coverage_resume = resume_text(
+        [p["title"] for p in loaded[:half]] + [f"Unlisted Side Project {i}" for i in range(half)]
+    )
+
+    return {
+        "load_projects": (clear_cache, lambda: load_projects(str(projects_path))),  # cold load
+        "filter_by_role_tag": (None, lambda: filter_by_role_tag(loaded, "data_scientist")),
+        "search_projects": (None, lambda: search_projects(str(projects_path), _SEARCH_QUERY)),
+        "merge_projects": (merge_setup, lambda: merge_projects(loaded, incoming, str(merge_path))),
+        "build_prompt": (None, lambda: build_prompt(base_resume, job, loaded, system_prompt)),
+        "format_and_write": (None, lambda: format_and_write(raw_output, str(tmp / "resume.md"))),
+        "_extract_project_titles": (None, lambda: _extract_project_titles(full_resume)),
+        "_preflight_coverage_check": (None, lambda: _preflight_coverage_check(coverage_resume, loaded)),
+    }
+
+
+def run(sizes: list[int], repeat: int, only: list[str] | None = None, backend: str = "json") -> dict:
+    """Time every case at every size; return the JSON-ready results document."""
+    results: dict[str, dict[str, dict]] = {case: {} for case in CASES if not only or case in only}
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in sizes:
+            cases = _cases(Path(tmp), n, backend)
+            for case in results:
+                setup, fn = cases[case]
+                # format_and_write and the coverage check report on stdout/stderr
+                with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+                    best, median = _measure(fn, repeat, setup)
+                results[case][str(n)] = {"best_s": round(best, 7), "median_s": round(median, 7)}
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "backend": backend,
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, tolerance: float, floor_s: float) -> list[str]:
+    """Return a line per case/size whose best time regressed past tolerance and floor_s.
+
+    Cases or sizes missing from either side are not compared.
+    """
+    regressions = []
+    for case, by_size in current["results"].items():
+        for n, timing in by_size.items():
+            before = baseline.get("results", {}).get(case, {}).get(n)
+            if before is None:
+                continue
+            now, was = timing["best_s"], before["best_s"]
+            if now > was * tolerance and now - was > floor_s:
+                regressions.append(
+                    f"{case} n={n}: {was * 1000:.3f} ms -> {now * 1000:.3f} ms ({now / was:.2f}x)"
+                )
+    return regressions
+
+
+def _print_table(current: dict, baseline: dict | None) -> None:
+    print(f"{'case':<27} {'n':>7}  {'best ms':>10}  {'median ms':>10}  {'base ms':>10}  {'ratio':>6}")
+    for case, by_size in current["results"].items():
+        for n, timing in by_size.items():
+            line = f"{case:<27} {n:>7}  {timing['best_s'] * 1000:>10.3f}  {timing['median_s'] * 1000:>10.3f}"
+            before = (baseline or {}).get("results", {}).get(case, {}).get(n)
+            if before:
+                line += f"  {before['best_s'] * 1000:>10.3f}  {timing['best_s'] / before['best_s']:>5.2f}x"
+            print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--backend", choices=["json", "sqlite"], default="json",
+                        help="Projects database backend (default: json)")
+    parser.add_argument("--cases", nargs="+", choices=CASES, metavar="CASE",
+                        help=f"Only run these cases (default: all of {', '.join(CASES)})")
+    parser.add_argument("--out", metavar="PATH", help="Write the results JSON here")
+    parser.add_argument("--baseline", metavar="PATH", help="Compare against an earlier --out file")
+    parser.add_argument("--tolerance", type=float, default=1.25,
+                        help="Allowed best-time ratio over the baseline (default: 1.25)")
+    parser.add_argument("--floor-ms", type=float, default=1.0,
+                        help="Ignore regressions smaller than this many milliseconds (default: 1.0)")
+    args = parser.parse_args()
+
+    baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8")) if args.baseline else None
+    current = run(args.sizes, args.repeat, args.cases, args.backend)
+    _print_table(current, baseline)
+
+    if args.out:
+        Path(args.out).write_text(json.dumps(current, indent=2) + "\n", encoding="utf-8")
+        print(f"\nResults written to {args.out}")
+
+    if baseline is not None:
+        regressions = compare(current, baseline, args.tolerance, args.floor_ms / 1000)
+        if regressions:
+            print(f"\nREGRESSION: {len(regressions)} case(s) slower than {args.baseline} "
+                  f"by more than {args.tolerance:.2f}x:", file=sys.stderr)
+            for line in regressions:
+                print(f"  {line}", file=sys.stderr)
+            sys.exit(1)
+        print(f"\nNo regressions against {args.baseline} (tolerance {args.tolerance:.2f}x).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Benchmark job-page text extraction: lxml engine vs the BeautifulSoup reference.
+Run with: python benchmarks/bench_html_extract.py [--sizes-kb 50 500 2000 5000] [--repeat 3]
+
+Pages come from benchmarks.synthetic.job_page_html. Reports best-of-N wall time and
+tracemalloc peak per engine — Python heap only, libxml2's own allocations are not
+traced — and asserts both engines produce identical text.
+"""
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def _measure(fn, html: str, repeat: int) -> tuple[str, float, float]:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        text = fn(html)
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    fn(html)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return text, best, peak / 2**20
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes-kb", type=int, nargs="+", default=[50, 500, 2000, 5000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    from benchmarks.synthetic import job_page_html
+    from resume_helper.parsers.job_parser import _html_to_text, _html_to_text_bs4
+
+    print(f"{'page KB':>8}  {'container':<9}  {'engine':<6} {'wall s':>8}  {'py peak MB':>10}  {'speedup':>7}")
+    for kb in args.sizes_kb:
+        for with_main in (True, False):
+            html = job_page_html(kb * 1024, with_main=with_main)
+            ref, ref_s, ref_mb = _measure(_html_to_text_bs4, html, args.repeat)
+            text, s, mb = _measure(_html_to_text, html, args.repeat)
+            assert text == ref, "lxml and bs4 output differ"
+            container = "main" if with_main else "class"
+            print(f"{len(html) // 1024:>8}  {container:<9}  {'bs4':<6} {ref_s:>8.3f}  {ref_mb:>10.1f}")
+            print(f"{'':>8}  {'':<9}  {'lxml':<6} {s:>8.3f}  {mb:>10.1f}  {ref_s / s:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
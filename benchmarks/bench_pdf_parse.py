@@ -0,0 +1,76 @@
+"""
+Benchmark parse_pdf: wall time and peak RSS vs page count, per engine, serial vs process pool.
+Run with: python benchmarks/bench_pdf_parse.py [--pages 1 5 10 20 50 100] [--workers 4]
+                                               [--engines pdfplumber pypdfium2]
+
+Each measurement runs in a fresh subprocess so peak RSS (ru_maxrss) is per run.
+"""
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def _child(pdf: str, workers: int, engine: str) -> None:
+    from resume_helper.parsers.pdf_parser import parse_pdf
+
+    start = time.perf_counter()
+    text = parse_pdf(pdf, workers=workers, engine=engine)
+    elapsed = time.perf_counter() - start
+    print(json.dumps({
+        "seconds": elapsed,
+        "chars": len(text),
+        # ru_maxrss is KiB on Linux
+        "parent_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "worker_rss_mb": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024,
+    }))
+
+
+def _measure(pdf: Path, workers: int, engine: str) -> dict:
+    out = subprocess.run(
+        [sys.executable, __file__, "--child", str(pdf), str(workers), engine],
+        check=True, capture_output=True, text=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 5, 10, 20, 50, 100])
+    parser.add_argument("--workers", type=int, default=4, help="Process-pool size for the parallel run")
+    parser.add_argument("--engines", nargs="+", default=["pdfplumber", "pypdfium2"])
+    parser.add_argument("--child", nargs=3, metavar=("PDF", "WORKERS", "ENGINE"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        _child(args.child[0], int(args.child[1]), args.child[2])
+        return
+
+    from benchmarks.synthetic import write_pdf
+
+    print(
+        f"{'pages':>6}  {'engine':<11} {'mode':<10} {'wall s':>8}  "
+        f"{'parent RSS MB':>14}  {'worker RSS MB':>14}"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in args.pages:
+            pdf = write_pdf(Path(tmp) / f"bench_{n}.pdf", n)
+            for engine in args.engines:
+                serial = _measure(pdf, 1, engine)
+                parallel = _measure(pdf, args.workers, engine)
+                assert serial["chars"] == parallel["chars"], "serial and parallel output differ"
+                for mode, r in (("serial", serial), (f"pool x{args.workers}", parallel)):
+                    print(
+                        f"{n:>6}  {engine:<11} {mode:<10} {r['seconds']:>8.3f}  "
+                        f"{r['parent_rss_mb']:>14.1f}  {r['worker_rss_mb']:>14.1f}"
+                    )
+
+
+if __name__ == "__main__":
+    main()
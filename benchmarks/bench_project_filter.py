@@ -0,0 +1,62 @@
+"""
+Benchmark project filtering by role tags and skills: list scan vs the role-mask index.
+Run with: python benchmarks/bench_project_filter.py [--sizes 10000 100000] [--repeat 5]
+
+"scan" is filter_projects over a plain list (one mask test per project); "index" is
+ProjectIndex.positions on an index built once, as load_projects keeps for each file
+(the index build itself is reported separately). Both return the same projects.
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+QUERIES = {
+    "1 tag": {"any_tags": ["data_scientist"]},
+    "any of 2 tags": {"any_tags": ["data_scientist", "ai_engineer"]},
+    "all of 2 tags": {"all_tags": ["data_scientist", "ai_engineer"]},
+    "all of 2 skills": {"all_skills": ["python", "sql"]},
+    "tag + skill": {"any_tags": ["data_engineer"], "any_skills": ["spark"]},
+}
+
+
+def _measure(fn, repeat: int) -> tuple[float, float]:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times), statistics.median(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    from benchmarks.synthetic import projects
+    from resume_helper.data.projects_db import ProjectIndex, filter_projects
+
+    print(f"{'projects':>8}  {'query':<16}  {'matches':>7}  {'scan ms':>8}  {'index ms':>8}  {'speedup':>7}")
+    for n in args.sizes:
+        records = projects(n)
+        build, _ = _measure(lambda: ProjectIndex(records)._skill_index(), args.repeat)
+        index = ProjectIndex(records)
+        print(f"{n:>8}  {'(index build)':<16}  {'':>7}  {'':>8}  {build * 1000:>8.2f}")
+        for name, query in QUERIES.items():
+            matches = filter_projects(records, **query)
+            assert matches == [records[i] for i in index.positions(**query)], name
+            scan, _ = _measure(lambda: filter_projects(records, **query), args.repeat)
+            indexed, _ = _measure(lambda: index.positions(**query), args.repeat)
+            print(
+                f"{n:>8}  {name:<16}  {len(matches):>7}  {scan * 1000:>8.2f}  "
+                f"{indexed * 1000:>8.2f}  {scan / indexed:>6.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark the resident memory of loaded projects: model_dump() dicts vs ProjectViews.
+Run with: python benchmarks/bench_project_memory.py [--sizes 10000 100000] [--repeat 3]
+
+"dicts" is what the projects cache held before (one model_dump() dict per project);
+"views" is what it holds now (data/project_view.py). Memory is what tracemalloc still
+sees allocated once the list is built and everything else is freed. build_prompt is
+timed over every project in each form, to show both are accepted at similar cost.
+"""
+import argparse
+import gc
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def _measure(fn, repeat: int) -> tuple[float, float]:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times), statistics.median(times)
+
+
+def _resident(build) -> tuple[object, int]:
+    """Return (build(), bytes still allocated by it once its temporaries are freed)."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        gc.collect()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    from benchmarks.synthetic import write_projects_json
+    from resume_helper.builder.prompt_builder import build_prompt
+    from resume_helper.data.project_view import ProjectView
+    from resume_helper.data.projects_db import _validate_file
+
+    print(f"{'projects':>8}  {'form':<6}  {'MB':>8}  {'B/project':>9}  {'vs dicts':>8}  {'build_prompt ms':>15}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in args.sizes:
+            path = write_projects_json(Path(tmp) / f"projects_{n}.json", n).resolve()
+            dicts, dicts_size = _resident(lambda: [p.model_dump() for p in _validate_file(path)])
+            views, views_size = _resident(lambda: [ProjectView.from_record(p) for p in _validate_file(path)])
+            assert [v.to_dict() for v in views] == dicts
+            for name, projects, size in (("dicts", dicts, dicts_size), ("views", views, views_size)):
+                best, _ = _measure(lambda: build_prompt(None, "Data Scientist", projects, ""), args.repeat)
+                print(
+                    f"{n:>8}  {name:<6}  {size / 2**20:>8.1f}  {size / n:>9.0f}  "
+                    f"{dicts_size / size:>7.2f}x  {best * 1000:>15.1f}"
+                )
+            assert build_prompt(None, "job", dicts, "") == build_prompt(None, "job", views, "")
+            del dicts, views
+
+
+if __name__ == "__main__":
+    main()
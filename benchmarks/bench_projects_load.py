@@ -0,0 +1,73 @@
+"""
+Benchmark load_projects on synthetic projects.json files: cold and warm (memoized) loads.
+Run with: python benchmarks/bench_projects_load.py [--sizes 1000 10000] [--repeat 5]
+
+"reference" is the previous loader (json.load, ProjectsFile.model_validate, then
+model_dump per project); "cold" is load_projects with its cache cleared before each
+call (single-pass TypeAdapter validation); "warm" is a repeat call on the unchanged file,
+and "warm views" the same through load_project_views, which returns the cached
+ProjectViews without copying them to dicts.
+"""
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def _measure(fn, repeat: int, setup=None) -> tuple[float, float]:
+    times = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times), statistics.median(times)
+
+
+def _reference_load(path: Path) -> list:
+    from resume_helper.models import ProjectsFile
+
+    with path.open() as f:
+        data = json.load(f)
+    validated = ProjectsFile.model_validate(data)
+    return [p.model_dump() for p in validated.projects if p.enabled]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    from benchmarks.synthetic import write_projects_json
+    from resume_helper.data.projects_db import clear_cache, load_project_views, load_projects
+
+    print(f"{'projects':>8}  {'MB':>5}  {'load':<10}  {'best ms':>9}  {'median ms':>9}  {'speedup':>7}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in args.sizes:
+            path = write_projects_json(Path(tmp) / f"projects_{n}.json", n)
+            assert load_projects(str(path)) == _reference_load(path)
+            rows = [
+                ("reference", lambda: _reference_load(path), None),
+                ("cold", lambda: load_projects(str(path)), clear_cache),
+                ("warm", lambda: load_projects(str(path)), None),
+                ("warm views", lambda: load_project_views(str(path)), None),
+            ]
+            baseline = None
+            for name, fn, setup in rows:
+                best, median = _measure(fn, args.repeat, setup)
+                baseline = baseline or best
+                print(
+                    f"{n:>8}  {path.stat().st_size / 2**20:>5.1f}  {name:<10}  {best * 1000:>9.2f}  "
+                    f"{median * 1000:>9.2f}  {baseline / best:>6.1f}x"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""Synthetic inputs for benchmarks — generated on the fly so nothing large is committed."""
+import random
+from pathlib import Path
+
+_WORDS = (
+    "pipeline model feature forecast warehouse dashboard experiment latency churn revenue "
+    "python sql spark airflow dbt pandas pytorch kubernetes terraform snowflake bigquery "
+    "built designed deployed reduced improved automated migrated scaled partnered led"
+).split()
+
+
+def write_pdf(path: Path, n_pages: int, lines_per_page: int = 45, seed: int = 0) -> Path:
+    """Write a text-only PDF with n_pages pages of resume-like lines; return path."""
+    rng = random.Random(seed)
+    pages = []
+    for page_no in range(n_pages):
+        lines = [f"Page {page_no + 1} Project Experience"]
+        lines += [" ".join(rng.choice(_WORDS) for _ in range(12)) for _ in range(lines_per_page)]
+        pages.append(lines)
+    return write_text_pdf(path, pages)
+
+
+def write_text_pdf(path: Path, pages: list[list[str]]) -> Path:
+    """Write a PDF with one text line per entry, one list of lines per page; return path.
+
+    Hand-assembled (Type1 Helvetica, one content stream per page) so benchmarks
+    need no PDF-writing dependency. The first line of each page is set larger,
+    like a heading. Lines must be plain ASCII without parentheses or backslashes.
+    """
+    bodies: dict[int, bytes] = {
+        1: b"<< /Type /Catalog /Pages 2 0 R >>",
+        3: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    }
+    page_ids = []
+    next_id = 4
+    for lines in pages:
+        page_id, content_id = next_id, next_id + 1
+        next_id += 2
+        ops = []
+        for line_no, line in enumerate(lines):
+            size = 14 if line_no == 0 else 10
+            ops.append(f"BT /F1 {size} Tf 50 {760 - line_no * 15} Td ({line}) Tj ET")
+        stream = "\n".join(ops).encode("latin-1")
+        bodies[content_id] = b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream"
+        bodies[page_id] = (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_id} 0 R >>"
+        ).encode()
+        page_ids.append(page_id)
+    kids = " ".join(f"{pid} 0 R" for pid in page_ids)
+    bodies[2] = f"<< /Type /Pages /Kids [{kids}] /Count {len(pages)} >>".encode()
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = {}
+    for oid in range(1, next_id):
+        offsets[oid] = len(out)
+        out += f"{oid} 0 obj\n".encode() + bodies[oid] + b"\nendobj\n"
+    xref_pos = len(out)
+    out += f"xref\n0 {next_id}\n0000000000 65535 f \n".encode()
+    for oid in range(1, next_id):
+        out += f"{offsets[oid]:010d} 00000 n \n".encode()
+    out += f"trailer\n<< /Size {next_id} /Root 1 0 R >>\nstartxref\n{xref_pos}\n%%EOF\n".encode()
+
+    path = Path(path)
+    path.write_bytes(bytes(out))
+    return path
+
+
+def job_page_html(target_bytes: int, seed: int = 0, with_main: bool = True) -> str:
+    """Return an ATS-style job page of roughly target_bytes.
+
+    Mostly chrome — an inline JS bundle, JSON state, nav / footer link farms and
+    nested layout divs — around a short posting, which sits in <main> or, with
+    with_main=False, a div with a job-description class.
+    """
+    rng = random.Random(seed)
+
+    def sentence(n: int = 12) -> str:
+        return " ".join(rng.choice(_WORDS) for _ in range(n)).capitalize() + "."
+
+    posting = "".join(
+        f"<h2>{sentence(3)}</h2><ul>" + "".join(f"<li>{sentence()}</li>" for _ in range(6)) + "</ul>"
+        for _ in range(4)
+    )
+    container = (
+        f'<main id="main"><h1>Senior Data Scientist</h1>{posting}</main>' if with_main
+        else f'<div class="job-description__body"><h1>Senior Data Scientist</h1>{posting}</div>'
+    )
+    nav = "<nav><ul>" + "".join(f'<li><a href="/l/{i}">{rng.choice(_WORDS)}</a></li>' for i in range(60)) + "</ul></nav>"
+    footer = "<footer>" + "".join(f'<a href="/f/{i}">{sentence(4)}</a>' for i in range(60)) + "</footer>"
+    head = (
+        "<head><meta charset='utf-8'><title>Senior Data Scientist</title>"
+        f"<meta name='description' content='{sentence()}'><style>body{{margin:0}}</style></head>"
+    )
+
+    # Layout filler (related jobs, cards) and inline script make up the bulk of real pages
+    fixed = len(head) + len(nav) + len(footer) + len(container) + 200
+    filler, script, size = [], [], fixed
+    while size < target_bytes:
+        card = (
+            f'<div class="card"><div class="card__inner"><span class="tag">{rng.choice(_WORDS)}</span>'
+            f'<a href="/jobs/{rng.randrange(10**6)}">{sentence(5)}</a><p>{sentence()}</p></div></div>'
+        )
+        chunk = f"window.__s{len(script)}={{k:'{rng.choice(_WORDS)}',v:[{','.join(str(rng.randrange(999)) for _ in range(30))}]}};"
+        filler.append(card)
+        script.append(chunk)
+        size += len(card) + len(chunk)
+
+    return (
+        f"<!DOCTYPE html><html>{head}<body><header><div class='logo'>Acme</div></header>{nav}"
+        f"<div class='layout'><div class='col'>{container}</div>"
+        f"<aside class='related'>{''.join(filler)}</aside></div>{footer}"
+        f"<script>{''.join(script)}</script></body></html>"
+    )
+
+
+def resume_markdown(n_projects: int = 6, seed: int = 0) -> str:
+    """Return a resume in the Markdown shape the templates ask the LLM for."""
+    rng = random.Random(seed)
+
+    def sentence(n: int) -> str:
+        return " ".join(rng.choice(_WORDS) for _ in range(n)).capitalize() + "."
+
+    parts = [
+        "# Jane Doe",
+        "##### jane@example.com | 555-555-5555 | [github.com/jane](https://github.com/jane)",
+        "---",
+        "## Professional Experience",
+    ]
+    for i in range(3):
+        parts.append(f"#### **Data Engineer {i + 1}, Example Corp** | 2020 - 2024 | Remote")
+        parts.append("\n".join(f"- **{rng.choice(_WORDS).title()}:** {sentence(18)}" for _ in range(4)))
+    parts += ["---", "## Key Technical Projects"]
+    for i in range(n_projects):
+        parts.append(f"### Project {i + 1}: {rng.choice(_WORDS).title()} {rng.choice(_WORDS).title()}")
+        parts.append(" ".join(sentence(20) for _ in range(4)) + f" *Relevant:* {sentence(12)}")
+    parts += [
+        "---",
+        "## Supporting Experience",
+        "#### **Technologies & Skills:** " + ", ".join(rng.sample(_WORDS, 12)),
+        "---",
+    ]
+    return "\n\n".join(parts) + "\n"
+
+
+def projects(n: int, seed: int = 0, start: int = 1) -> list[dict]:
+    """Return n valid project dicts shaped like a real projects.json, ids proj_{start:06d} onward."""
+    from resume_helper.models import ROLE_TAGS
+
+    rng = random.Random(seed)
+
+    def sentence(k: int) -> str:
+        return " ".join(rng.choice(_WORDS) for _ in range(k)).capitalize() + "."
+
+    records = []
+    for i in range(start, start + n):
+        records.append({
+            "id": f"proj_{i:06d}",
+            "title": f"{rng.choice(_WORDS).title()} {rng.choice(_WORDS).title()} {i}",
+            "organization": f"Org {rng.randrange(50)}",
+            "role": "Data Scientist",
+            "dates": {"start": "2021-01", "end": "2023-06"},
+            "summary": sentence(25),
+            "description_long": " ".join(sentence(20) for _ in range(3)),
+            "skills": rng.sample(_WORDS, 6),
+            "keywords": rng.sample(_WORDS, 4),
+            "role_tags": rng.sample(ROLE_TAGS, rng.randint(1, 3)),
+            "impact": [sentence(10) for _ in range(2)],
+            "include_by_default": i % 20 == 0,
+            "enabled": True,
+            "notes": "",
+        })
+    return records
+
+
+def write_projects_json(path: Path, n: int, seed: int = 0) -> Path:
+    """Write a projects.json with n synthetic projects; return path."""
+    import json
+
+    path = Path(path)
+    path.write_text(json.dumps({"projects": projects(n, seed)}, indent=2) + "\n", encoding="utf-8")
+    return path
+
+
+def resume_text(titles: list[str], seed: int = 0) -> str:
+    """Return plain resume text, as parse_pdf would extract it, with titles under Project Experience."""
+    rng = random.Random(seed)
+
+    def sentence(k: int) -> str:
+        return " ".join(rng.choice(_WORDS) for _ in range(k)).capitalize() + "."
+
+    lines = ["Jane Doe", "jane@example.com | 555-555-5555", "", "Work Experience", ""]
+    lines += [f"Data Engineer {i + 1}, Example Corp" for i in range(3)]
+    lines += ["", "Project Experience", ""]
+    for title in titles:
+        lines += [title, sentence(18), sentence(14)]
+    lines += ["", "Education", "", "BSc Statistics, Example University"]
+    return "\n".join(lines) + "\n"
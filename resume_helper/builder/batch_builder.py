@@ -0,0 +1,161 @@
+"""Batch orchestrator — tailor one resume per job posting over a bounded thread pool.
+
+The resume, projects, template and LLM client are loaded once and shared by every job.
+Jobs are I/O-bound (scraping + LLM round-trips), so threads are enough to overlap them.
+"""
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import NamedTuple
+
+from resume_helper.config import CACHE_DIR, MAX_INPUT_TOKENS, TOP_K, UserPaths
+from resume_helper.builder.resume_builder import build_resume, load_build_inputs, _get_provider
+from resume_helper.output.md2docx import wait_for_docx
+from resume_helper.parsers.job_parser import _is_url, parse_job_inputs
+from resume_helper.timing import collect, span
+
+# Files picked up when a directory of job postings is given
+_JOB_FILE_SUFFIXES = {".txt", ".md", ".url"}
+
+
+class BatchResult(NamedTuple):
+    label: str
+    md_path: Path | None
+    docx_path: Path | None
+    error: str | None
+
+
+def read_job_inputs(path: str) -> list[tuple[str, str]]:
+    """Return (label, job_input) pairs from a file or directory of job postings.
+
+    File: one URL per line; blank lines and lines starting with '#' are ignored.
+    Directory: one job per .txt/.md/.url file, containing either a URL or the
+    pasted posting text.
+    Raises FileNotFoundError if path does not exist, ValueError if it holds no jobs.
+    """
+    resolved = Path(path)
+    if not resolved.exists():
+        raise FileNotFoundError(f"Job inputs not found: {resolved}")
+
+    jobs = []
+    if resolved.is_dir():
+        for f in sorted(resolved.iterdir()):
+            if f.is_file() and f.suffix.lower() in _JOB_FILE_SUFFIXES:
+                text = f.read_text(encoding="utf-8").strip()
+                if text:
+                    jobs.append((f.name, text))
+    else:
+        for line in resolved.read_text(encoding="utf-8").splitlines():
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if not _is_url(line):
+                raise ValueError(
+                    f"Not a URL: '{line[:60]}'. Job list files hold one URL per line; "
+                    "put pasted job descriptions in a directory, one file per job."
+                )
+            jobs.append((line, line))
+
+    if not jobs:
+        raise ValueError(f"No job inputs found in {resolved}")
+    return jobs
+
+
+def build_batch(
+    jobs: list[tuple[str, str]],
+    resume_path: str | None,
+    projects_path: str | None,
+    role_tag: str | list[str] | None,
+    provider: str,
+    template: str | None = None,
+    user_paths: UserPaths | None = None,
+    max_workers: int = 4,
+    llm=None,
+    llm_cache: bool = False,
+    refresh_cache: bool = False,
+    record_llm: bool = False,
+    pdf_engine: str | None = None,
+    top_k: int = TOP_K,
+    max_input_tokens: int = MAX_INPUT_TOKENS,
+    dry_run: bool = False,
+    docx_engine: str | None = None,
+    match_all_roles: bool = False,
+) -> list[BatchResult]:
+    """Build one tailored resume per (label, job_input) pair; return results in input order.
+
+    A failing job is recorded in its BatchResult and does not stop the others.
+    Errors loading the shared inputs (resume, projects, template) propagate.
+    With dry_run no LLM is called and successful results carry no paths.
+    """
+    with collect("batch setup"):
+        with span("load inputs"):
+            inputs = load_build_inputs(
+                resume_path, projects_path, role_tag, template, user_paths, pdf_engine, match_all_roles,
+            )
+        if llm is None and not dry_run:
+            cache_dir = user_paths.cache_dir if user_paths else CACHE_DIR
+            llm = _get_provider(provider, llm_cache, refresh_cache, cache_dir, record_llm)
+
+        # Fetch every posting up front: concurrent, per-host rate limited, retried
+        n_urls = sum(1 for _, job_input in jobs if _is_url(job_input))
+        if n_urls:
+            print(f"[resume-helper] Fetching {n_urls} job posting(s)...", file=sys.stderr)
+        with span("fetch jobs"):
+            job_texts = parse_job_inputs([job_input for _, job_input in jobs], return_exceptions=True)
+
+    def _run(index: int, label: str, job_input: str, job_text) -> BatchResult:
+        if isinstance(job_text, Exception):
+            print(f"[resume-helper] ERROR: job {index} ({label}) could not be fetched — {job_text}", file=sys.stderr)
+            return BatchResult(label, None, None, f"fetch failed: {job_text}")
+        try:
+            paths = build_resume(
+                resume_path=resume_path,
+                job_input=job_input,
+                projects_path=projects_path,
+                role_tag=role_tag,
+                provider=provider,
+                output_path=None,
+                template=template,
+                user_paths=user_paths,
+                inputs=inputs,
+                llm=llm,
+                job_index=index,
+                job_text=job_text,
+                top_k=top_k,
+                max_input_tokens=max_input_tokens,
+                dry_run=dry_run,
+                background_docx=True,
+                docx_engine=docx_engine,
+            )
+        except Exception as exc:
+            print(f"[resume-helper] ERROR: job {index} ({label}) failed — {exc}", file=sys.stderr)
+            return BatchResult(label, None, None, str(exc) or type(exc).__name__)
+        if paths is None:  # dry run
+            return BatchResult(label, None, None, None)
+        md_path, docx_path = paths
+        return BatchResult(label, md_path, docx_path, None)
+
+    print(
+        f"[resume-helper] Building {len(jobs)} resume(s) with up to {max_workers} worker(s)...",
+        file=sys.stderr,
+    )
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        futures = [
+            pool.submit(_run, i, label, job_input, job_text)
+            for i, ((label, job_input), job_text) in enumerate(zip(jobs, job_texts), start=1)
+        ]
+        results = [f.result() for f in futures]
+
+    # DOCX conversions were queued as each resume was written; collect them last
+    return [r._replace(docx_path=wait_for_docx(r.docx_path)) if r.docx_path else r for r in results]
+
+
+def print_batch_summary(results: list[BatchResult]) -> None:
+    """Print a per-job success/failure summary to stderr."""
+    n_ok = sum(1 for r in results if r.error is None)
+    print(f"\n[resume-helper] Batch complete: {n_ok}/{len(results)} succeeded.", file=sys.stderr)
+    for i, r in enumerate(results, start=1):
+        if r.error is None:
+            print(f"[resume-helper]   OK    {i:>3}. {r.label} -> {r.md_path or '(dry run)'}", file=sys.stderr)
+        else:
+            print(f"[resume-helper]   FAIL  {i:>3}. {r.label} — {r.error}", file=sys.stderr)
@@ -0,0 +1,96 @@
+"""Rank candidate projects against a job posting with BM25, locally and without an LLM."""
+import math
+import re
+import sys
+from collections import Counter
+
+# BM25 term-frequency saturation and document-length normalisation
+_K1 = 1.5
+_B = 0.75
+
+# Project fields scored against the posting, with repeat weights: a skill or title term
+# is stronger evidence of fit than the same word in a summary.
+_FIELD_WEIGHTS = {"title": 2, "summary": 1, "skills": 2, "keywords": 1, "impact": 1}
+
+# Keeps c++, c#, node.js, ci/cd as single tokens
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#./-]*")
+
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or our that the this "
+    "to was we were will with you your".split()
+)
+
+# Dropped projects listed in the audit log after the kept ones
+_LOG_DROPPED = 5
+
+
+def rank_projects(projects: list, job_text: str) -> list[tuple[float, dict]]:
+    """Return (score, project) pairs, best match first; ties keep input order."""
+    docs = [_project_terms(p) for p in projects]
+    n_docs = len(docs)
+    if not n_docs:
+        return []
+    avg_len = sum(sum(d.values()) for d in docs) / n_docs or 1.0
+    doc_freq = Counter(term for d in docs for term in d)
+    query = set(_tokenize(job_text))
+
+    scored = []
+    for project, terms in zip(projects, docs):
+        length = sum(terms.values())
+        score = 0.0
+        for term in query & terms.keys():
+            idf = math.log(1 + (n_docs - doc_freq[term] + 0.5) / (doc_freq[term] + 0.5))
+            tf = terms[term]
+            score += idf * tf * (_K1 + 1) / (tf + _K1 * (1 - _B + _B * length / avg_len))
+        scored.append((score, project))
+    scored.sort(key=lambda pair: pair[0], reverse=True)
+    return scored
+
+
+def select_top_projects(projects: list, job_text: str, top_k: int) -> list:
+    """Keep the top_k best-matching projects plus every include_by_default one.
+
+    top_k <= 0, or no more projects than top_k, keeps everything. The result keeps
+    the original projects.json order; scores are logged to stderr for auditing.
+    """
+    if top_k <= 0 or len(projects) <= top_k:
+        return projects
+
+    ranked = rank_projects(projects, job_text)
+    kept_ids = {id(p) for _, p in ranked[:top_k]}
+    kept_ids |= {id(p) for p in projects if p.get("include_by_default")}
+    selected = [p for p in projects if id(p) in kept_ids]
+
+    print(
+        f"[resume-helper] Ranked {len(projects)} project(s); sending {len(selected)} "
+        f"(top {top_k} + include_by_default):",
+        file=sys.stderr,
+    )
+    dropped = 0
+    for rank, (score, p) in enumerate(ranked, start=1):
+        if id(p) in kept_ids:
+            status = "keep" if rank <= top_k else "keep (include_by_default)"
+        else:
+            dropped += 1
+            if dropped > _LOG_DROPPED:
+                continue
+            status = "drop"
+        print(f"[resume-helper]   {rank:>4}. {score:7.3f}  {status:<4}  {p.get('title', 'Untitled')}", file=sys.stderr)
+    if dropped > _LOG_DROPPED:
+        print(f"[resume-helper]   ... {dropped - _LOG_DROPPED} more dropped", file=sys.stderr)
+    return selected
+
+
+def _project_terms(p: dict, weights: dict = _FIELD_WEIGHTS) -> Counter:
+    terms: Counter = Counter()
+    for field, weight in weights.items():
+        value = p.get(field) or ""
+        text = " ".join(value) if isinstance(value, (list, tuple)) else value
+        for token in _tokenize(text):
+            terms[token] += weight
+    return terms
+
+
+def _tokenize(text: str) -> list[str]:
+    tokens = (t.rstrip("./-") for t in _TOKEN_RE.findall(text.lower()))
+    return [t for t in tokens if t and t not in _STOPWORDS]
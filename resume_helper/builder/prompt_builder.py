@@ -1,4 +1,28 @@
 """Assemble LLM prompts from all inputs."""
+import sys
+from typing import NamedTuple
+
+from resume_helper.builder.project_ranker import rank_projects
+
+# Offline token estimate: ~4 characters per token for English prose
+CHARS_PER_TOKEN = 4
+
+# description_long is cut to each of these lengths in turn until the prompt fits
+_DESCRIPTION_CAPS = (1000, 500, 250, 0)
+
+
+class PromptPlan(NamedTuple):
+    """A prompt fitted to a token budget, with its per-section estimates."""
+    system_prompt: str
+    user_prompt: str
+    projects: list          # projects as sent, after any trimming
+    tokens: dict            # section name -> estimated tokens, in prompt order, plus "total"
+    degraded: list          # what was cut to fit the budget, in order applied
+    prefix_chars: int       # length of user_prompt's job-independent, cacheable prefix
+
+
+def estimate_tokens(text: str) -> int:
+    return -(-len(text) // CHARS_PER_TOKEN)
 
 
 def build_prompt(
@@ -12,6 +36,16 @@ def build_prompt(
     system_prompt is loaded from the active template's system_prompt.md.
     Returns a 2-tuple of strings ready to pass to an LLMProvider.
     """
+    return system_prompt, _build_user_prompt(base_resume_text, job_text, projects)[0]
+
+
+def _build_user_prompt(base_resume_text: str | None, job_text: str, projects: list) -> tuple[str, int]:
+    """Return (user_prompt, prefix_chars).
+
+    The job posting goes last, so the first prefix_chars characters (base resume and
+    candidate projects) are identical for every posting a user builds against and can
+    be cached by the provider.
+    """
     sections = []
 
     # --- Base resume ---
@@ -26,15 +60,98 @@ def build_prompt(
             "section containing the selected projects in the format described."
         )
 
-    # --- Job posting ---
-    sections.append(_section("JOB POSTING", job_text))
-
     # --- Candidate projects ---
     project_blocks = "\n\n".join(_format_project(p) for p in projects)
     sections.append(_section("CANDIDATE PROJECTS", project_blocks))
 
-    user_prompt = "\n\n" + "\n\n".join(sections) + "\n"
-    return system_prompt, user_prompt
+    # --- Job posting ---
+    prefix = "\n\n" + "\n\n".join(sections) + "\n\n"
+    return prefix + _section("JOB POSTING", job_text) + "\n", len(prefix)
+
+
+def assemble_prompt(
+    base_resume_text: str | None,
+    job_text: str,
+    projects: list,
+    system_prompt: str,
+    max_input_tokens: int = 0,
+) -> PromptPlan:
+    """build_prompt() held to an estimated input budget of max_input_tokens (0 = no limit).
+
+    Over budget, the prompt degrades in steps, stopping as soon as it fits: drop every
+    project's notes, then keywords; cut description_long shorter and shorter; finally
+    drop projects in order of increasing BM25 match to the posting, never touching
+    include_by_default ones. The caller's project dicts are left unmodified: a project
+    is copied only when one of its fields is trimmed.
+    """
+    projects = list(projects)
+    degraded: list[str] = []
+
+    def _fits() -> bool:
+        if not max_input_tokens:
+            return True
+        user = build_prompt(base_resume_text, job_text, projects, "")[1]
+        return estimate_tokens(system_prompt) + estimate_tokens(user) <= max_input_tokens
+
+    for field in ("notes", "keywords"):
+        if _fits():
+            break
+        if any(p.get(field) for p in projects):
+            projects = [{k: v for k, v in p.items() if k != field} if p.get(field) else p for p in projects]
+            degraded.append(f"dropped project {field}")
+
+    for cap in _DESCRIPTION_CAPS:
+        if _fits():
+            break
+        cut = 0
+        for i, p in enumerate(projects):
+            desc = p.get("description_long") or ""
+            if len(desc) > cap:
+                projects[i] = {**p, "description_long": _truncate(desc, cap)}
+                cut += 1
+        if cut:
+            degraded.append(f"cut description_long to {cap} chars" if cap else "dropped description_long")
+
+    if not _fits():
+        # Each block costs its own length plus the blank line that joins it to the next
+        allowed_chars = (max_input_tokens - estimate_tokens(system_prompt)) * CHARS_PER_TOKEN
+        excess_chars = len(build_prompt(base_resume_text, job_text, projects, "")[1]) - allowed_chars
+        dropped = set()
+        for _score, p in reversed(rank_projects(projects, job_text)):
+            if excess_chars <= 0:
+                break
+            if p.get("include_by_default"):
+                continue
+            dropped.add(id(p))
+            excess_chars -= len(_format_project(p)) + 2
+        if dropped:
+            projects = [p for p in projects if id(p) not in dropped]
+            degraded.append(f"dropped {len(dropped)} lowest-ranked project(s)")
+
+    user, prefix_chars = _build_user_prompt(base_resume_text, job_text, projects)
+    tokens = {
+        "system prompt": estimate_tokens(system_prompt),
+        "base resume": estimate_tokens(base_resume_text or ""),
+        f"projects ({len(projects)})": estimate_tokens("\n\n".join(_format_project(p) for p in projects)),
+        "job posting": estimate_tokens(job_text),
+    }
+    tokens["total"] = estimate_tokens(system_prompt) + estimate_tokens(user)
+    if max_input_tokens and tokens["total"] > max_input_tokens:
+        print(
+            f"[resume-helper] WARNING: prompt is ~{tokens['total']:,} tokens, over the "
+            f"{max_input_tokens:,}-token budget even after trimming projects.",
+            file=sys.stderr,
+        )
+    return PromptPlan(system_prompt, user, projects, tokens, degraded, prefix_chars)
+
+
+def _truncate(text: str, max_chars: int) -> str:
+    """Cut text to at most max_chars at a word boundary, marking the cut with '...'."""
+    if len(text) <= max_chars:
+        return text
+    if max_chars <= 3:
+        return ""
+    return text[: max_chars - 3].rsplit(" ", 1)[0].rstrip(" ,;:") + "..."
 
 
 def _section(title: str, content: str) -> str:
@@ -2,42 +2,61 @@
 import sys
 from datetime import datetime
 from pathlib import Path
+from typing import NamedTuple
 
 from resume_helper.config import (
-    DEFAULT_RESUME_PATH, DEFAULT_PROJECTS_PATH, OUTPUT_DIR,
-    OUTPUT_DIR_MD, OUTPUT_DIR_DOCX,
+    DEFAULT_RESUME_PATH, DEFAULT_PROJECTS_PATH,
+    OUTPUT_DIR_MD, OUTPUT_DIR_DOCX, CACHE_DIR, MAX_INPUT_TOKENS, TOP_K,
     UserPaths, resolve_template,
 )
-from resume_helper.output.md2docx import check_pandoc_installed, convert_markdown_to_docx
+from resume_helper.output.md2docx import submit_conversion
 from resume_helper.parsers.pdf_parser import parse_pdf
 from resume_helper.parsers.job_parser import parse_job_input
-from resume_helper.data.projects_db import load_projects, filter_by_role_tag
-from resume_helper.builder.prompt_builder import build_prompt
+from resume_helper.data.projects_db import load_project_views, role_tags_of
+from resume_helper.builder.project_ranker import select_top_projects
+from resume_helper.builder.prompt_builder import CHARS_PER_TOKEN, PromptPlan, assemble_prompt
 from resume_helper.output.formatter import format_and_write
+from resume_helper.timing import collect, span
 
+# First line of a response that rejects the job posting; the reason follows on that line
+_JOB_CONTENT_SENTINEL = "JOB_CONTENT_ERROR:"
 
-def build_resume(
+
+class BuildInputs(NamedTuple):
+    """Per-user inputs that are identical across every job in a run."""
+    base_resume_text: str | None
+    projects: list          # read-only ProjectViews, shared with the projects cache
+    system_prompt_text: str
+    pandoc_path: Path
+
+
+def load_build_inputs(
     resume_path: str | None,
-    job_input: str,
     projects_path: str | None,
-    role_tag: str | None,
-    provider: str,
-    output_path: str | None,
+    role_tag: str | list[str] | None,
     template: str | None = None,
     user_paths: UserPaths | None = None,
-) -> tuple[Path, Path]:
+    pdf_engine: str | None = None,
+    match_all_roles: bool = False,
+) -> BuildInputs:
+    """Parse the resume, load and filter projects, and resolve the template.
+
+    Split out of build_resume() so batch runs can do this work once and share it.
+    role_tag may be one tag or several: projects with any of them are kept, or only
+    those with all of them when match_all_roles.
+    """
     # --- Resolve defaults ---
     _p = user_paths
     resolved_resume   = Path(resume_path)   if resume_path   else (_p.resume    if _p else DEFAULT_RESUME_PATH)
     resolved_projects = Path(projects_path) if projects_path else (_p.projects  if _p else DEFAULT_PROJECTS_PATH)
-    _out_md           = _p.output_dir_md   if _p else OUTPUT_DIR_MD
-    _out_docx         = _p.output_dir_docx if _p else OUTPUT_DIR_DOCX
-    _job_reqs_dir     = _p.job_reqs_dir    if _p else None
 
     # --- Parse base resume (optional) ---
     if resolved_resume.exists():
         print(f"[resume-helper] Parsing resume: {resolved_resume}", file=sys.stderr)
-        base_resume_text = parse_pdf(str(resolved_resume))
+        with span("parse resume"):
+            base_resume_text = parse_pdf(
+                str(resolved_resume), cache_dir=_p.cache_dir if _p else CACHE_DIR, engine=pdf_engine,
+            )
     else:
         if resume_path:
             # Explicit path was given but not found — hard error
@@ -51,58 +70,140 @@ def build_resume(
         )
         base_resume_text = None
 
-    # --- Parse job posting ---
-    print("[resume-helper] Fetching job posting...", file=sys.stderr)
-    job_text = parse_job_input(job_input)
-    if not job_text.strip():
-        print(
-            "[resume-helper] ERROR: Could not extract job posting content from the provided URL.\n"
-            "[resume-helper] Try pasting the job description as raw text instead.",
-            file=sys.stderr,
-        )
-        raise ValueError("Could not extract job posting content from the provided URL.")
-
     # --- Load and filter projects ---
     print(f"[resume-helper] Loading projects: {resolved_projects}", file=sys.stderr)
-    projects = load_projects(str(resolved_projects))
+    with span("load projects"):
+        projects = load_project_views(str(resolved_projects), role_tag, match_all_roles)
     if role_tag:
-        projects = filter_by_role_tag(projects, role_tag)
-        print(f"[resume-helper] Filtered to {len(projects)} project(s) for role: {role_tag}", file=sys.stderr)
+        roles = (" and " if match_all_roles else " or ").join(role_tags_of(role_tag))
+        print(f"[resume-helper] Filtered to {len(projects)} project(s) for role: {roles}", file=sys.stderr)
 
     # --- Pre-flight coverage check (advisory only) ---
     if base_resume_text:
-        _preflight_coverage_check(base_resume_text, projects)
+        with span("coverage check"):
+            _preflight_coverage_check(base_resume_text, projects)
 
     # --- Load template ---
-    system_prompt_text, pandoc_path = resolve_template(template)
+    with span("load template"):
+        system_prompt_text, pandoc_path = resolve_template(template)
     print(f"[resume-helper] Using template: {template or 'project_focused_long'}", file=sys.stderr)
 
-    # --- Build prompt ---
-    system_prompt, user_prompt = build_prompt(base_resume_text, job_text, projects, system_prompt_text)
+    return BuildInputs(base_resume_text, projects, system_prompt_text, pandoc_path)
+
+
+@collect("build")
+def build_resume(
+    resume_path: str | None,
+    job_input: str,
+    projects_path: str | None,
+    role_tag: str | list[str] | None,
+    provider: str,
+    output_path: str | None,
+    template: str | None = None,
+    user_paths: UserPaths | None = None,
+    inputs: BuildInputs | None = None,
+    llm=None,
+    job_index: int | None = None,
+    llm_cache: bool = False,
+    refresh_cache: bool = False,
+    record_llm: bool = False,
+    pdf_engine: str | None = None,
+    job_text: str | None = None,
+    top_k: int = TOP_K,
+    max_input_tokens: int = MAX_INPUT_TOKENS,
+    dry_run: bool = False,
+    on_chunk=None,
+    background_docx: bool = False,
+    docx_engine: str | None = None,
+    match_all_roles: bool = False,
+) -> tuple[Path, Path] | None:
+    """Tailor one resume to one job posting; return (md_path, docx_path).
+
+    inputs and llm may be passed in pre-built (see load_build_inputs) so that
+    batch runs share them; job_index keeps concurrent auto-named outputs apart.
+    llm_cache serves byte-identical LLM requests from the user's on-disk cache;
+    refresh_cache bypasses cached answers and overwrites them.
+    record_llm writes the LLM exchange to REPLAY_DIR for `--provider replay`.
+    job_text, if given, is the already-fetched posting and job_input is not parsed.
+    top_k > 0 sends only the best-matching projects (see select_top_projects).
+    max_input_tokens > 0 trims the prompt to that estimated size (see assemble_prompt).
+    dry_run prints the prompt's per-section token estimate and returns None without
+    calling the LLM.
+    on_chunk, if given, is called with each piece of the resume text as it streams in.
+    background_docx returns as soon as the Markdown is written, leaving the DOCX to the
+    background conversion pool; md2docx.wait_for_docx(docx_path) blocks until it is ready.
+    docx_engine picks the DOCX renderer (see md2docx.resolve_engine; default DOCX_ENGINE).
+    role_tag and match_all_roles filter projects as in load_build_inputs.
+    """
+    # --- Resolve defaults ---
+    _p = user_paths
+    _out_md           = _p.output_dir_md   if _p else OUTPUT_DIR_MD
+    _out_docx         = _p.output_dir_docx if _p else OUTPUT_DIR_DOCX
+    _job_reqs_dir     = _p.job_reqs_dir    if _p else None
+
+    # --- Resume, projects and template ---
+    if inputs is None:
+        with span("load inputs"):
+            inputs = load_build_inputs(
+                resume_path, projects_path, role_tag, template, user_paths, pdf_engine, match_all_roles,
+            )
+    base_resume_text, projects, system_prompt_text, pandoc_path = inputs
+
+    # --- Parse job posting ---
+    if job_text is None:
+        print("[resume-helper] Fetching job posting...", file=sys.stderr)
+        with span("fetch job"):
+            job_text = parse_job_input(job_input)
+    if not job_text.strip():
+        print(
+            "[resume-helper] ERROR: Could not extract job posting content from the provided URL.\n"
+            "[resume-helper] Try pasting the job description as raw text instead.",
+            file=sys.stderr,
+        )
+        raise ValueError("Could not extract job posting content from the provided URL.")
+
+    # --- Rank projects against the posting ---
+    with span("rank projects"):
+        projects = select_top_projects(projects, job_text, top_k)
+
+    # --- Build prompt within the token budget ---
+    with span("assemble prompt"):
+        plan = assemble_prompt(base_resume_text, job_text, projects, system_prompt_text, max_input_tokens)
+    system_prompt, user_prompt = plan.system_prompt, plan.user_prompt
+    _print_token_estimate(plan, max_input_tokens, breakdown=dry_run)
+    if dry_run:
+        return None
 
     # --- Select LLM provider ---
-    llm = _get_provider(provider)
+    if llm is None:
+        llm = _get_provider(provider, llm_cache, refresh_cache, _p.cache_dir if _p else CACHE_DIR, record_llm)
     print(f"[resume-helper] Calling {llm.get_model_name()}...", file=sys.stderr)
 
     # --- Call LLM ---
-    raw_output = llm.complete(system_prompt, user_prompt)
+    with span("llm"):
+        try:
+            raw_output = _stream_completion(llm, system_prompt, user_prompt, on_chunk, plan.prefix_chars)
+        except ValueError as exc:  # e.g. no recorded exchange under --provider replay
+            print(f"[resume-helper] ERROR: {exc}", file=sys.stderr)
+            raise
 
     # --- Validate job content sentinel ---
-    if raw_output.strip().startswith("JOB_CONTENT_ERROR:"):
-        reason = raw_output.strip().removeprefix("JOB_CONTENT_ERROR:").strip()
+    if raw_output.strip().startswith(_JOB_CONTENT_SENTINEL):
+        reason = raw_output.strip().removeprefix(_JOB_CONTENT_SENTINEL).strip().partition("\n")[0]
         print(f"[resume-helper] ERROR: Job posting content is insufficient — {reason}", file=sys.stderr)
         print("[resume-helper] Try pasting the job description as raw text instead.", file=sys.stderr)
         raise ValueError(f"Job posting content is insufficient — {reason}")
 
     # --- Resolve output path ---
-    resolved_output = _resolve_output_path(output_path, role_tag, _out_md)
+    resolved_output = _resolve_output_path(output_path, role_tag, _out_md, job_index)
 
     # --- Format and write ---
-    result = format_and_write(raw_output, str(resolved_output))
+    with span("format"):
+        result = format_and_write(raw_output, str(resolved_output))
 
     # --- Rename to company+role-based filename if auto-named ---
     if not output_path:
-        resolved_output = _rename_with_metadata(resolved_output, result.company, result.role)
+        resolved_output = _rename_with_metadata(resolved_output, result.company, result.role, job_index)
 
     # --- Save job req text ---
     if _job_reqs_dir:
@@ -111,9 +212,63 @@ def build_resume(
         print(f"[resume-helper] Job req saved to: {job_req_path}", file=sys.stderr)
 
     # --- Convert to DOCX (soft failure) ---
-    _convert_to_docx(resolved_output, pandoc_path, _out_docx)
+    with span("docx" if not background_docx else "docx (queue)"):
+        docx_path = _convert_to_docx(resolved_output, pandoc_path, _out_docx, not background_docx, docx_engine)
+
+    return resolved_output, docx_path
 
-    return resolved_output, _resolve_docx_path(resolved_output, _out_docx)
+
+def _stream_completion(llm, system_prompt: str, user_prompt: str, on_chunk=None, prefix_chars: int = 0) -> str:
+    """Return the LLM's completion, passing text to on_chunk as it streams in.
+
+    Leading text is held back until it can no longer be the JOB_CONTENT_ERROR: sentinel.
+    A sentinel response is read only to the end of its reason line, then the stream is
+    closed so the provider stops generating; none of it reaches on_chunk.
+    """
+    stream = llm.complete_stream(system_prompt, user_prompt, prefix_chars)
+    parts: list[str] = []
+    head = ""           # leading text, held back while it could still be the sentinel
+    passing = False     # decided: not the sentinel, forward everything
+    try:
+        for chunk in stream:
+            parts.append(chunk)
+            if passing:
+                if on_chunk:
+                    on_chunk(chunk)
+                continue
+            head += chunk
+            lead = head.lstrip()
+            if lead.startswith(_JOB_CONTENT_SENTINEL):
+                if "\n" in lead.removeprefix(_JOB_CONTENT_SENTINEL).lstrip():
+                    break
+            elif not _JOB_CONTENT_SENTINEL.startswith(lead):
+                passing = True
+                if on_chunk:
+                    on_chunk(head)
+    finally:
+        close = getattr(stream, "close", None)
+        if close:
+            close()
+
+    text = "".join(parts)
+    if on_chunk and not text.lstrip().startswith(_JOB_CONTENT_SENTINEL):
+        if not passing:
+            on_chunk(head)  # a short reply that never got past the prefix check
+        if not text.endswith("\n"):
+            on_chunk("\n")
+    return text
+
+
+def _print_token_estimate(plan: PromptPlan, max_input_tokens: int, breakdown: bool = False) -> None:
+    """Log the prompt's estimated size and any trimming; breakdown adds a per-section table."""
+    budget = f" (budget {max_input_tokens:,})" if max_input_tokens else ""
+    print(f"[resume-helper] Prompt is ~{plan.tokens['total']:,} tokens{budget}.", file=sys.stderr)
+    for step in plan.degraded:
+        print(f"[resume-helper]   trimmed: {step}", file=sys.stderr)
+    if breakdown:
+        print(f"[resume-helper] Estimated input tokens (~{CHARS_PER_TOKEN} chars/token):", file=sys.stderr)
+        for section, tokens in plan.tokens.items():
+            print(f"[resume-helper]   {section:<16} {tokens:>8,}", file=sys.stderr)
 
 
 def _extract_project_titles(resume_text: str) -> list[str]:
@@ -207,23 +362,32 @@ def _slugify(text: str) -> str:
 
 def _resolve_output_path(
     output_path: str | None,
-    role_tag: str | None,
+    role_tag: str | list[str] | None,
     output_dir_md: Path = OUTPUT_DIR_MD,
+    job_index: int | None = None,
 ) -> Path:
     if output_path:
         return Path(output_path)
     datestamp = datetime.now().strftime("%Y%m%d")
-    suffix = f"_{role_tag}" if role_tag else ""
+    suffix = f"_{'+'.join(role_tags_of(role_tag))}" if role_tag else ""
+    if job_index is not None:
+        suffix += f"_job{job_index:03d}"
     filename = f"resume{suffix}_{datestamp}.md"
     output_dir_md.mkdir(parents=True, exist_ok=True)
     return output_dir_md / filename
 
 
-def _rename_with_metadata(current_path: Path, company: str, role: str) -> Path:
-    """Rename the written file to include company and role slugs; return the new path."""
+def _rename_with_metadata(current_path: Path, company: str, role: str, job_index: int | None = None) -> Path:
+    """Rename the written file to include company and role slugs; return the new path.
+
+    job_index keeps the _jobNNN suffix of _resolve_output_path, so batch postings for
+    the same company and role do not overwrite each other.
+    """
     datestamp = datetime.now().strftime("%Y%m%d")
     parts = [_slugify(company) if company else None, _slugify(role) if role else None]
     meta = "_".join(p for p in parts if p)
+    if meta and job_index is not None:
+        meta += f"_job{job_index:03d}"
     new_name = f"resume_{meta}_{datestamp}.md" if meta else current_path.name
     new_path = current_path.parent / new_name
     if new_path != current_path:
@@ -237,26 +401,45 @@ def _resolve_docx_path(md_path: Path, output_dir_docx: Path = OUTPUT_DIR_DOCX) -
     return output_dir_docx / md_path.with_suffix(".docx").name
 
 
-def _convert_to_docx(md_path: Path, reference_doc: Path, output_dir_docx: Path = OUTPUT_DIR_DOCX) -> None:
+def _convert_to_docx(
+    md_path: Path,
+    reference_doc: Path,
+    output_dir_docx: Path = OUTPUT_DIR_DOCX,
+    wait: bool = True,
+    engine: str | None = None,
+) -> Path:
+    """Queue md_path for DOCX conversion and return the DOCX path; wait blocks until done."""
     docx_path = _resolve_docx_path(md_path, output_dir_docx)
     ref = reference_doc if reference_doc.exists() else None
+    future = submit_conversion(md_path, docx_path, ref, engine)
+    if wait:
+        _report_docx(future)
+    else:
+        future.add_done_callback(_report_docx)
+    return docx_path
+
+
+def _report_docx(future) -> None:
     try:
-        check_pandoc_installed()
-        convert_markdown_to_docx(str(md_path), str(docx_path), str(ref) if ref else None)
-        print(f"[resume-helper] DOCX written to: {docx_path}", file=sys.stderr)
+        docx_path = future.result()
     except RuntimeError as exc:
         print(f"[resume-helper] WARNING: {exc} — skipping DOCX conversion.", file=sys.stderr)
+    else:
+        print(f"[resume-helper] DOCX written to: {docx_path}", file=sys.stderr)
+
 
+def _get_provider(
+    provider: str,
+    llm_cache: bool = False,
+    refresh_cache: bool = False,
+    cache_dir: Path = CACHE_DIR,
+    record: bool = False,
+):
+    from resume_helper.llm.registry import get_provider, wrap_provider
+    try:
+        llm = get_provider(provider)
+    except ValueError as exc:
+        print(f"[resume-helper] ERROR: {exc}", file=sys.stderr)
+        sys.exit(1)
+    return wrap_provider(llm, cache_dir if llm_cache or refresh_cache else None, refresh_cache, record)
 
-def _get_provider(provider: str):
-    if provider == "claude":
-        from resume_helper.llm.claude_provider import ClaudeProvider
-        return ClaudeProvider()
-    if provider == "openai":
-        from resume_helper.llm.openai_provider import OpenAIProvider
-        return OpenAIProvider()
-    if provider == "gemini":
-        from resume_helper.llm.gemini_provider import GeminiProvider
-        return GeminiProvider()
-    print(f"[resume-helper] ERROR: Provider '{provider}' is not yet implemented.", file=sys.stderr)
-    sys.exit(1)
@@ -3,8 +3,14 @@ import argparse
 import os
 import sys
 
-from resume_helper.config import DEFAULT_PROVIDER, DEFAULT_TEMPLATE, list_templates, resolve_user_paths, ensure_user_dirs
+from resume_helper.config import (
+    BATCH_WORKERS, DEFAULT_PROVIDER, DEFAULT_TEMPLATE, DOCX_ENGINE, DOCX_WORKERS, LLM_CACHE_ENABLED,
+    MAX_INPUT_TOKENS, PDF_ENGINE, TOP_K, list_templates, resolve_template, resolve_user_paths,
+    ensure_user_dirs,
+)
 from resume_helper.models import ROLE_TAGS
+from resume_helper.output.md2docx import DOCX_ENGINES, convert_directory
+from resume_helper.parsers.pdf_engines import PDF_ENGINES
 
 
 def _read_job_input(job_arg: str | None) -> str:
@@ -24,13 +30,168 @@ def _read_job_input(job_arg: str | None) -> str:
     return text
 
 
+def _echo_chunk(text: str) -> None:
+    """Show the resume on the terminal as the LLM writes it."""
+    sys.stderr.write(text)
+    sys.stderr.flush()
+
+
+def _add_common_args(parser: argparse.ArgumentParser) -> None:
+    """Options shared by single-job and batch builds."""
+    parser.add_argument("--resume", help="Path to base resume PDF (default: resumes/legacy/default_resume.pdf)")
+    parser.add_argument("--projects", help="Path to projects.json (default: data/projects.json)")
+    parser.add_argument("--role", choices=ROLE_TAGS, metavar="ROLE", nargs="+",
+                        help="Only use projects tagged with any of these roles (several allowed). "
+                             f"Valid values: {', '.join(ROLE_TAGS)}")
+    parser.add_argument("--all-roles", action="store_true",
+                        help="With several --role tags, only use projects tagged with all of them")
+    parser.add_argument(
+        "--provider",
+        default=DEFAULT_PROVIDER,
+        help=f"LLM provider: gemini, openai, claude; offline: stub (canned answers) or replay "
+             f"(exchanges saved by --record) (default: {DEFAULT_PROVIDER})",
+    )
+    parser.add_argument(
+        "--template",
+        default=None,
+        choices=list_templates(),
+        metavar="TEMPLATE",
+        help=f"Resume template to use (default: {DEFAULT_TEMPLATE}). Available: {', '.join(list_templates())}",
+    )
+    parser.add_argument(
+        "--top-k",
+        type=int,
+        default=TOP_K,
+        metavar="K",
+        help="Send only the K projects that best match the posting, plus include_by_default ones "
+             f"(default: {TOP_K}; 0 sends all; set RESUME_HELPER_TOP_K to change)",
+    )
+    parser.add_argument(
+        "--max-input-tokens",
+        type=int,
+        default=MAX_INPUT_TOKENS,
+        metavar="N",
+        help="Estimated prompt-size budget; over it, project notes, keywords and details are "
+             f"trimmed, then the weakest-matching projects dropped (default: {MAX_INPUT_TOKENS}; "
+             "0 = no limit; set RESUME_HELPER_MAX_INPUT_TOKENS to change)",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Print the prompt's estimated per-section token counts and stop before calling the LLM",
+    )
+    parser.add_argument("--user", help="Your user profile name (or set RESUME_HELPER_USER env var)")
+    add_pdf_engine_arg(parser)
+    add_docx_engine_arg(parser)
+    add_cache_args(parser)
+    add_record_arg(parser)
+    add_timing_args(parser)
+
+
+def add_pdf_engine_arg(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--pdf-engine",
+        default=PDF_ENGINE,
+        choices=PDF_ENGINES,
+        help=f"PDF text-extraction backend (default: {PDF_ENGINE}; set RESUME_HELPER_PDF_ENGINE to change)",
+    )
+
+
+def add_docx_engine_arg(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--docx-engine",
+        default=DOCX_ENGINE,
+        choices=DOCX_ENGINES,
+        help="DOCX renderer: pandoc, native (in-process, no pandoc needed) or auto (pandoc if "
+             f"installed; default: {DOCX_ENGINE}; set RESUME_HELPER_DOCX_ENGINE to change)",
+    )
+
+
+def add_cache_args(parser: argparse.ArgumentParser) -> None:
+    """--cache/--no-cache and --refresh for the on-disk LLM response cache."""
+    parser.add_argument(
+        "--cache",
+        action=argparse.BooleanOptionalAction,
+        default=LLM_CACHE_ENABLED,
+        help="Reuse LLM responses for byte-identical requests from the profile's on-disk cache "
+             "(default: off, or on if RESUME_HELPER_LLM_CACHE=1)",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached LLM responses and overwrite them with fresh ones (implies --cache)",
+    )
+
+
+def add_record_arg(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--record",
+        action="store_true",
+        help="Record every LLM exchange of this run to the recordings directory (or "
+             "RESUME_HELPER_REPLAY_DIR) so later runs can use --provider replay offline",
+    )
+
+
+def add_timing_args(parser: argparse.ArgumentParser) -> None:
+    """--timings and --timings-log for per-stage build timings (see timing.py)."""
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Print how long each build stage took (PDF parsing, fetching, LLM call, DOCX, ...)",
+    )
+    parser.add_argument(
+        "--timings-log",
+        metavar="PATH",
+        default=None,
+        help="Append each build's stage timings to PATH as one JSON line "
+             "(or set RESUME_HELPER_TIMINGS_LOG); summarise with `python -m resume_helper.timing PATH`",
+    )
+
+
+def add_profile_arg(parser: argparse.ArgumentParser) -> None:
+    from resume_helper.profiling import PROFILE_MODES
+    parser.add_argument(
+        "--profile",
+        choices=PROFILE_MODES,
+        default=None,
+        help="Profile this run and write the report to the profile's profiles/ directory: cpu "
+             "(cProfile dump + top functions) or mem (per-stage tracemalloc peaks and top "
+             "allocations). Add --provider stub to leave the LLM out",
+    )
+
+
+def _configure_timings(args: argparse.Namespace) -> None:
+    if args.timings or args.timings_log:
+        from resume_helper import timing
+        timing.configure(print_breakdown=args.timings, sink=args.timings_log)
+
+
+def _activate_user(user: str | None):
+    user_paths = resolve_user_paths(user)
+    ensure_user_dirs(user_paths)
+    active_user = user or os.getenv("RESUME_HELPER_USER", "").strip() or "jayne_dough"
+    print(f"[resume-helper] Active profile: {active_user}", file=sys.stderr)
+    return user_paths
+
+
 def main() -> None:
+    if len(sys.argv) > 1 and sys.argv[1] == "batch":
+        _batch_main(sys.argv[2:])
+        return
+    if len(sys.argv) > 1 and sys.argv[1] == "docx":
+        _docx_main(sys.argv[2:])
+        return
+
     parser = argparse.ArgumentParser(
         prog="resume-helper",
         description="Tailor a resume to a job posting using an LLM.",
-        epilog="See also: resume-helper-init  resume-helper-users  resume-helper-import-projects",
+        epilog=(
+            "Run `resume-helper batch --help` to build for many postings at once, and\n"
+            "`resume-helper docx --help` to re-convert existing resumes to DOCX.\n"
+            "See also: resume-helper-init  resume-helper-users  resume-helper-import-projects"
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
     )
-    parser.add_argument("--resume", help="Path to base resume PDF (default: resumes/legacy/default_resume.pdf)")
     parser.add_argument(
         "--job",
         default=None,
@@ -39,45 +200,147 @@ def main() -> None:
             "Omit entirely to be prompted for interactive paste (Enter then Ctrl+D to finish)."
         ),
     )
-    parser.add_argument("--projects", help="Path to projects.json (default: data/projects.json)")
-    parser.add_argument("--role", choices=ROLE_TAGS, metavar="ROLE",
-                        help=f"Filter projects by role tag. Valid values: {', '.join(ROLE_TAGS)}")
-    parser.add_argument("--provider", default=DEFAULT_PROVIDER, help=f"LLM provider (default: {DEFAULT_PROVIDER})")
     parser.add_argument("--output", help="Output file path (auto-named if omitted)")
-    parser.add_argument(
-        "--template",
-        default=None,
-        choices=list_templates(),
-        metavar="TEMPLATE",
-        help=f"Resume template to use (default: {DEFAULT_TEMPLATE}). Available: {', '.join(list_templates())}",
-    )
-    parser.add_argument("--user", help="Your user profile name (or set RESUME_HELPER_USER env var)")
+    _add_common_args(parser)
+    add_profile_arg(parser)
 
     args = parser.parse_args()
+    _configure_timings(args)
 
     job_input = _read_job_input(args.job)
 
-    user_paths = resolve_user_paths(args.user)
-    ensure_user_dirs(user_paths)
-    active_user = args.user or os.getenv("RESUME_HELPER_USER", "").strip() or "jayne_dough"
-    print(f"[resume-helper] Active profile: {active_user}", file=sys.stderr)
+    user_paths = _activate_user(args.user)
 
     # Import here to keep startup fast and allow stubs during scaffold
     from resume_helper.builder.resume_builder import build_resume  # noqa: F401
+    from resume_helper.profiling import profile
+    try:
+        with profile(args.profile, user_paths.profile_dir, "build"):
+            build_resume(
+                resume_path=args.resume,
+                job_input=job_input,
+                projects_path=args.projects,
+                role_tag=args.role,
+                match_all_roles=args.all_roles,
+                provider=args.provider,
+                output_path=args.output,
+                template=args.template,
+                user_paths=user_paths,
+                llm_cache=args.cache,
+                refresh_cache=args.refresh,
+                record_llm=args.record,
+                pdf_engine=args.pdf_engine,
+                top_k=args.top_k,
+                max_input_tokens=args.max_input_tokens,
+                dry_run=args.dry_run,
+                on_chunk=_echo_chunk if sys.stderr.isatty() else None,
+                docx_engine=args.docx_engine,
+            )
+    except (FileNotFoundError, ValueError):
+        sys.exit(1)
+
+
+def _batch_main(argv: list[str]) -> None:
+    parser = argparse.ArgumentParser(
+        prog="resume-helper batch",
+        description="Tailor one resume per job posting, running several jobs concurrently.",
+    )
+    parser.add_argument(
+        "jobs",
+        help=(
+            "A file with one job posting URL per line, or a directory with one "
+            ".txt/.md/.url file per job (URL or pasted posting text)."
+        ),
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=BATCH_WORKERS,
+        help=f"Maximum jobs in flight at once (default: {BATCH_WORKERS})",
+    )
+    _add_common_args(parser)
+
+    args = parser.parse_args(argv)
+    _configure_timings(args)
+
+    from resume_helper.builder.batch_builder import build_batch, print_batch_summary, read_job_inputs
     try:
-        build_resume(
+        jobs = read_job_inputs(args.jobs)
+    except (FileNotFoundError, ValueError) as exc:
+        print(f"[resume-helper] ERROR: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+    user_paths = _activate_user(args.user)
+
+    try:
+        results = build_batch(
+            jobs,
             resume_path=args.resume,
-            job_input=job_input,
             projects_path=args.projects,
             role_tag=args.role,
+            match_all_roles=args.all_roles,
             provider=args.provider,
-            output_path=args.output,
             template=args.template,
             user_paths=user_paths,
+            max_workers=args.workers,
+            llm_cache=args.cache,
+            refresh_cache=args.refresh,
+            record_llm=args.record,
+            pdf_engine=args.pdf_engine,
+            top_k=args.top_k,
+            max_input_tokens=args.max_input_tokens,
+            dry_run=args.dry_run,
+            docx_engine=args.docx_engine,
         )
     except (FileNotFoundError, ValueError):
         sys.exit(1)
 
+    print_batch_summary(results)
+    if any(r.error for r in results):
+        sys.exit(1)
+
+
+def _docx_main(argv: list[str]) -> None:
+    parser = argparse.ArgumentParser(
+        prog="resume-helper docx",
+        description="Convert every Markdown resume in the profile's resumes/enhanced/md/ to DOCX, in parallel.",
+    )
+    parser.add_argument(
+        "--template",
+        default=None,
+        choices=list_templates(),
+        metavar="TEMPLATE",
+        help=f"Template whose pandoc_template.docx styles the output (default: {DEFAULT_TEMPLATE})",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DOCX_WORKERS,
+        help=f"Conversions run at once (default: {DOCX_WORKERS}; set RESUME_HELPER_DOCX_WORKERS to change)",
+    )
+    parser.add_argument("--user", help="Your user profile name (or set RESUME_HELPER_USER env var)")
+    add_docx_engine_arg(parser)
+
+    args = parser.parse_args(argv)
+    user_paths = _activate_user(args.user)
+
+    _, reference_doc = resolve_template(args.template)
+    try:
+        results = convert_directory(
+            user_paths.output_dir_md, user_paths.output_dir_docx, reference_doc, args.workers, args.docx_engine,
+        )
+    except RuntimeError as exc:
+        print(f"[resume-helper] ERROR: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+    n_ok = sum(1 for _, _, error in results if error is None)
+    print(f"\n[resume-helper] Converted {n_ok}/{len(results)} resume(s) to DOCX.", file=sys.stderr)
+    for md_path, _, error in results:
+        if error:
+            print(f"[resume-helper]   FAIL  {md_path.name} — {error}", file=sys.stderr)
+    if n_ok < len(results):
+        sys.exit(1)
+
 
 if __name__ == "__main__":
     main()
@@ -10,10 +10,15 @@ load_dotenv()
 PROJECT_ROOT = Path(__file__).parent.parent
 
 DEFAULT_RESUME_PATH = PROJECT_ROOT / "users" / "jayne_dough" / "resumes" / "legacy" / "resume_default.pdf"
-DEFAULT_PROJECTS_PATH = PROJECT_ROOT / "users" / "jayne_dough" / "projects.json"
+# A user's projects database: projects.json, or a SQLite store such as projects.db
+# (see data/projects_sqlite.py)
+PROJECTS_FILE = os.getenv("RESUME_HELPER_PROJECTS_FILE", "projects.json")
+
+DEFAULT_PROJECTS_PATH = PROJECT_ROOT / "users" / "jayne_dough" / PROJECTS_FILE
 OUTPUT_DIR = PROJECT_ROOT / "users" / "jayne_dough" / "resumes" / "enhanced"
 OUTPUT_DIR_MD   = OUTPUT_DIR / "md"
 OUTPUT_DIR_DOCX = OUTPUT_DIR / "docx"
+CACHE_DIR = PROJECT_ROOT / "users" / "jayne_dough" / ".cache"
 
 TEMPLATES_DIR = PROJECT_ROOT / "shared" / "templates"
 DEFAULT_TEMPLATE = "project_focused_xyz"
@@ -26,6 +31,69 @@ DEFAULT_PROVIDER = "gemini"
 # Default maximum number of tokens
 MAX_TOKENS = 4096
 
+# Concurrent jobs in `resume-helper batch` (bounded by LLM round-trips, not CPU)
+BATCH_WORKERS = int(os.getenv("RESUME_HELPER_BATCH_WORKERS", "4"))
+
+# PDF text-extraction backend (see parsers/pdf_engines.py): pdfplumber | pypdfium2
+PDF_ENGINE = os.getenv("RESUME_HELPER_PDF_ENGINE", "pdfplumber")
+
+# Processes used to extract text from long PDFs (1 = extract pages serially)
+PDF_WORKERS = int(os.getenv("RESUME_HELPER_PDF_WORKERS", "1"))
+
+# DOCX conversions run in the background, at most this many at once (0 = on the build's own
+# thread; see output/md2docx.py)
+DOCX_WORKERS = int(os.getenv("RESUME_HELPER_DOCX_WORKERS", "2"))
+
+# DOCX renderer: pandoc | native (in-process, output/docx_native.py) | auto (pandoc if installed)
+DOCX_ENGINE = os.getenv("RESUME_HELPER_DOCX_ENGINE", "auto")
+
+# Job-page fetching: keep-alive pool sizes and an on-disk HTTP cache shared by all users.
+# Within the TTL (seconds) a cached page is reused as-is; after it, ETag / Last-Modified
+# make the re-fetch a conditional request. Least-recently-used pages are evicted past MAX_MB.
+HTTP_POOL_CONNECTIONS = int(os.getenv("RESUME_HELPER_HTTP_POOL_CONNECTIONS", "10"))
+HTTP_POOL_MAXSIZE = int(os.getenv("RESUME_HELPER_HTTP_POOL_MAXSIZE", "10"))
+HTTP_CACHE_ENABLED = os.getenv("RESUME_HELPER_HTTP_CACHE", "1").strip().lower() not in {"0", "false", "no", "off"}
+HTTP_CACHE_DIR = PROJECT_ROOT / ".cache" / "http"
+HTTP_CACHE_TTL = int(os.getenv("RESUME_HELPER_HTTP_CACHE_TTL", "3600"))
+HTTP_CACHE_MAX_MB = int(os.getenv("RESUME_HELPER_HTTP_CACHE_MAX_MB", "100"))
+
+# Job pages are streamed into the HTML parser; reading stops after this many bytes
+HTTP_MAX_BYTES = int(os.getenv("RESUME_HELPER_HTTP_MAX_BYTES", str(5 * 1024 * 1024)))
+
+# Fetching many job postings at once: overall and per-host concurrency, retries on
+# transient errors (connection failures, timeouts, 429/5xx) and base backoff in seconds
+FETCH_WORKERS = int(os.getenv("RESUME_HELPER_FETCH_WORKERS", "8"))
+FETCH_PER_HOST = int(os.getenv("RESUME_HELPER_FETCH_PER_HOST", "2"))
+FETCH_RETRIES = int(os.getenv("RESUME_HELPER_FETCH_RETRIES", "3"))
+FETCH_BACKOFF = float(os.getenv("RESUME_HELPER_FETCH_BACKOFF", "0.5"))
+
+# Append one JSON line of per-stage build timings here (see timing.py); unset = off
+TIMINGS_LOG = os.getenv("RESUME_HELPER_TIMINGS_LOG", "").strip() or None
+
+# LLM SDK clients are created once per (provider, API key) and kept for the process
+# (see llm/registry.py); these size their HTTP keep-alive pools
+LLM_POOL_MAX_CONNECTIONS = int(os.getenv("RESUME_HELPER_LLM_POOL_MAX_CONNECTIONS", "20"))
+LLM_POOL_MAX_KEEPALIVE = int(os.getenv("RESUME_HELPER_LLM_POOL_MAX_KEEPALIVE", "10"))
+LLM_POOL_KEEPALIVE_EXPIRY = float(os.getenv("RESUME_HELPER_LLM_POOL_KEEPALIVE_EXPIRY", "60"))
+
+# Send only the K projects that best match the posting (BM25), plus include_by_default
+# ones; 0 sends every project
+TOP_K = int(os.getenv("RESUME_HELPER_TOP_K", "0"))
+
+# Estimated input-token budget per build prompt (~4 chars/token); over it, project detail
+# is trimmed (see assemble_prompt). 0 = no limit
+MAX_INPUT_TOKENS = int(os.getenv("RESUME_HELPER_MAX_INPUT_TOKENS", "0"))
+
+# On-disk LLM response cache — opt-in; --cache / --no-cache override per run
+LLM_CACHE_ENABLED = os.getenv("RESUME_HELPER_LLM_CACHE", "").strip().lower() in {"1", "true", "yes", "on"}
+LLM_CACHE_MAX_MB = int(os.getenv("RESUME_HELPER_LLM_CACHE_MAX_MB", "200"))
+LLM_CACHE_MAX_AGE_DAYS = int(os.getenv("RESUME_HELPER_LLM_CACHE_MAX_AGE_DAYS", "30"))
+
+# Recorded LLM exchanges: written by --record, served by --provider replay (see
+# llm/replay_provider.py). Latency: none | recorded | fixed:S | normal:MEAN,SD | lognormal:MEDIAN,SIGMA
+REPLAY_DIR = Path(os.getenv("RESUME_HELPER_REPLAY_DIR", "").strip() or PROJECT_ROOT / "recordings")
+REPLAY_LATENCY = os.getenv("RESUME_HELPER_REPLAY_LATENCY", "none")
+
 
 @dataclass
 class UserPaths:
@@ -34,6 +102,8 @@ class UserPaths:
     output_dir_md: Path
     output_dir_docx: Path
     job_reqs_dir: Path
+    cache_dir: Path = CACHE_DIR
+    profile_dir: Path = PROJECT_ROOT / "profiles"
 
 
 def resolve_user_paths(user: str | None = None) -> UserPaths:
@@ -41,10 +111,12 @@ def resolve_user_paths(user: str | None = None) -> UserPaths:
     root = PROJECT_ROOT / "users" / effective_user
     return UserPaths(
         resume=root / "resumes" / "legacy" / "resume_default.pdf",
-        projects=root / "projects.json",
+        projects=root / PROJECTS_FILE,
         output_dir_md=root / "resumes" / "enhanced" / "md",
         output_dir_docx=root / "resumes" / "enhanced" / "docx",
         job_reqs_dir=root / "job_reqs",
+        cache_dir=root / ".cache",
+        profile_dir=root / "profiles",
     )
 
 
@@ -0,0 +1,165 @@
+"""Inverted index over project titles, skills and keywords, for local keyword search.
+
+Tokens and BM25 scoring follow builder/project_ranker.py, restricted to the fields a
+project is looked up by, so "spark airflow" finds the projects that list both without
+an LLM call. Query time depends on how many projects carry the query's terms, not on
+the size of the database.
+"""
+import heapq
+import math
+from bisect import insort
+from collections import Counter
+from itertools import chain
+
+from resume_helper.builder.project_ranker import _B, _FIELD_WEIGHTS, _K1, _project_terms, _tokenize
+
+_INDEXED_WEIGHTS = {field: _FIELD_WEIGHTS[field] for field in ("title", "skills", "keywords")}
+
+
+class TermIndex:
+    """Term -> positions of the projects containing it, plus each project's term counts.
+
+    Positions are indices into the project list the index was built from. Postings
+    lists stay sorted, and updated() copies only the lists it changes, so an index
+    can be shared with readers while a newer one is built from it.
+    """
+
+    def __init__(self, projects: list) -> None:
+        self._terms: list[Counter] = []
+        self._lengths: list[int] = []
+        self._postings: dict[str, list[int]] = {}
+        self._total = 0
+        self._impact_cache: dict[str, tuple[dict[int, float], list[int]]] = {}
+        for p in projects:
+            self._append(p)
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def search(
+        self, query: str, match_any: bool = False, candidates=None, limit: int | None = None,
+    ) -> list[tuple[float, int]]:
+        """Return (BM25 score, position) pairs for query, best first; ties keep file order.
+
+        A project must contain every query term, or any of them with match_any.
+        candidates, when given, restricts the positions considered; limit keeps the
+        best limit pairs.
+        """
+        terms = list(dict.fromkeys(_tokenize(query)))
+        postings = [self._postings.get(term, ()) for term in terms]
+        if not terms or not (any(postings) if match_any else all(postings)):
+            return []
+        n_docs = len(self._terms)
+        lists = [
+            (math.log(1 + (n_docs - len(found) + 0.5) / (len(found) + 0.5)), *self._impacts(term))
+            for term, found in zip(terms, postings) if found
+        ]
+        if candidates is not None:
+            candidates = set(candidates)
+        if limit:
+            return self._top(lists, match_any, candidates, limit)
+
+        if match_any:
+            hits = set(chain.from_iterable(postings))
+        else:
+            rarest, *rest = sorted(postings, key=len)
+            hits = set(rarest)
+            for found in rest:
+                hits.intersection_update(found)
+        if candidates is not None:
+            hits &= candidates
+        scored = [(sum(idf * weights.get(i, 0.0) for idf, weights, _ in lists), i) for i in hits]
+        scored.sort(key=lambda pair: (-pair[0], pair[1]))
+        return scored
+
+    def _top(self, lists: list, match_any: bool, candidates: set | None, limit: int) -> list:
+        # Threshold algorithm: walk every term's positions in order of falling weight and
+        # stop once the limit-th best score beats anything a project not yet seen could reach
+        best: list[tuple[float, int]] = []  # min-heap of (score, -position): worst result on top
+        seen: set[int] = set()
+        for depth in range(max(len(order) for _, _, order in lists)):
+            threshold = 0.0
+            for idf, weights, order in lists:
+                if depth >= len(order):
+                    continue
+                i = order[depth]
+                threshold += idf * weights[i]
+                if i in seen:
+                    continue
+                seen.add(i)
+                if candidates is not None and i not in candidates:
+                    continue
+                if not match_any and any(i not in w for _, w, _ in lists):
+                    continue
+                entry = (sum(idf * w.get(i, 0.0) for idf, w, _ in lists), -i)
+                if len(best) < limit:
+                    heapq.heappush(best, entry)
+                elif entry > best[0]:
+                    heapq.heapreplace(best, entry)
+            if len(best) == limit and best[0][0] > threshold:
+                break
+        return [(score, -neg) for score, neg in sorted(best, reverse=True)]
+
+    def _impacts(self, term: str) -> tuple[dict[int, float], list[int]]:
+        """Return term's BM25 term-frequency weight per position, and its positions by
+        falling weight (ties in file order). Computed once per term and index."""
+        cached = self._impact_cache.get(term)
+        if cached is None:
+            avg_len = self._total / len(self._terms) or 1.0
+            weights = {}
+            for i in self._postings[term]:
+                tf = self._terms[i][term]
+                weights[i] = tf * (_K1 + 1) / (tf + _K1 * (1 - _B + _B * self._lengths[i] / avg_len))
+            order = sorted(self._postings[term], key=weights.__getitem__, reverse=True)
+            self._impact_cache[term] = cached = (weights, order)
+        return cached
+
+    def updated(self, changed, projects: list) -> "TermIndex":
+        """Return the index of projects, given that it differs from this index's list only
+        at the positions in changed and past its end; only those projects are re-tokenized.
+        A shorter projects list is indexed from scratch.
+        """
+        if len(projects) < len(self._terms):
+            return TermIndex(projects)
+        new = TermIndex.__new__(TermIndex)
+        new._terms = list(self._terms)
+        new._lengths = list(self._lengths)
+        new._postings = dict(self._postings)
+        new._total = self._total
+        new._impact_cache = {}
+        copied: set[str] = set()
+
+        def _postings_of(term: str) -> list[int]:
+            if term not in copied:
+                new._postings[term] = list(new._postings.get(term, ()))
+                copied.add(term)
+            return new._postings[term]
+
+        for i in changed:
+            for term in new._terms[i]:
+                found = _postings_of(term)
+                found.remove(i)
+                if not found:
+                    del new._postings[term]
+                    copied.discard(term)
+            terms = _project_terms(projects[i], _INDEXED_WEIGHTS)
+            new._total += sum(terms.values()) - new._lengths[i]
+            new._terms[i], new._lengths[i] = terms, sum(terms.values())
+            for term in terms:
+                insort(_postings_of(term), i)
+        for p in projects[len(new._terms):]:
+            new._append(p, _postings_of)
+        return new
+
+    def _append(self, p: dict, postings_of=None) -> None:
+        i = len(self._terms)
+        terms = _project_terms(p, _INDEXED_WEIGHTS)
+        self._terms.append(terms)
+        self._lengths.append(sum(terms.values()))
+        self._total += self._lengths[-1]
+        for term in terms:
+            if postings_of is None:
+                self._postings.setdefault(term, []).append(i)
+            else:
+                postings_of(term).append(i)
+
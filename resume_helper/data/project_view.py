@@ -0,0 +1,100 @@
+"""Compact, read-only in-memory form of a validated project.
+
+A project dict from ProjectRecord.model_dump() carries a hash table and its own list
+objects. ProjectView keeps the same fields in __slots__, holds lists as tuples, and
+interns the strings projects share (skills, role tags, keywords, organization, role)
+and the dates mappings, so memoized databases (projects_db) stay smaller. It is a
+read-only Mapping, so code that reads projects with p["..."] / p.get(...), such as
+build_prompt and project ranking, accepts it unchanged; to_dict() gives the plain
+model_dump() form for mutation or JSON.
+"""
+import sys
+from collections.abc import Mapping
+from operator import attrgetter
+from types import MappingProxyType
+
+from resume_helper.models import ProjectRecord
+
+_FIELDS = tuple(ProjectRecord.model_fields)
+
+# list[str] fields stored as tuples; _SHARED_LISTS also have their items interned
+_LIST_FIELDS = ("skills", "role_tags", "impact", "keywords")
+_SHARED_LISTS = ("skills", "role_tags", "keywords")
+_SHARED_STRS = ("organization", "role")
+_PLAIN_FIELDS = tuple(set(_FIELDS) - set(_LIST_FIELDS) - set(_SHARED_STRS) - {"dates"})
+
+# Read-only dates mappings by content: projects with the same dates share one
+_DATES: dict[tuple, MappingProxyType] = {(): MappingProxyType({})}
+
+
+class ProjectView(Mapping):
+    """One project's validated fields, read-only; see the module docstring."""
+
+    __slots__ = _FIELDS
+
+    @classmethod
+    def from_dict(cls, p: Mapping) -> "ProjectView":
+        """Build a view of a validated project dict (every ProjectRecord field present)."""
+        view = object.__new__(cls)
+        for name in _PLAIN_FIELDS:
+            _SETTERS[name](view, p[name])
+        for name in _SHARED_LISTS:
+            _SETTERS[name](view, tuple(map(sys.intern, p[name])))
+        for name in _SHARED_STRS:
+            _SETTERS[name](view, sys.intern(p[name]))
+        _SETTERS["impact"](view, tuple(p["impact"]))
+        _SETTERS["dates"](view, _shared_dates(p["dates"]))
+        return view
+
+    @classmethod
+    def from_record(cls, record: ProjectRecord) -> "ProjectView":
+        """Build a view of a ProjectRecord, skipping its model_dump()."""
+        return cls.from_dict(record.__dict__)
+
+    def to_dict(self) -> dict:
+        """Return the project as the plain dict ProjectRecord.model_dump() would give."""
+        out = dict(zip(_FIELDS, _GET_ALL(self)))
+        for name in _LIST_FIELDS:
+            out[name] = list(out[name])
+        out["dates"] = dict(out["dates"])
+        return out
+
+    def __getitem__(self, key: str):
+        return _GETTERS[key](self)  # KeyError for anything but a field
+
+    def get(self, key: str, default=None):
+        getter = _GETTERS.get(key)
+        return getter(self) if getter else default
+
+    def __contains__(self, key) -> bool:
+        return key in _GETTERS
+
+    def __iter__(self):
+        return iter(_FIELDS)
+
+    def __len__(self) -> int:
+        return len(_FIELDS)
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError("ProjectView is read-only; use to_dict() for an editable copy")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("ProjectView is read-only; use to_dict() for an editable copy")
+
+    def __repr__(self) -> str:
+        return f"ProjectView(id={self.id!r}, title={self.title!r})"
+
+
+def _shared_dates(dates: dict) -> MappingProxyType:
+    key = tuple(dates.items())
+    try:
+        return _DATES[key]
+    except KeyError:
+        return _DATES.setdefault(key, MappingProxyType(dict(dates)))
+    except TypeError:  # unhashable values: not shared
+        return MappingProxyType(dict(dates))
+
+
+_SETTERS = {name: getattr(ProjectView, name).__set__ for name in _FIELDS}
+_GETTERS = {name: attrgetter(name) for name in _FIELDS}
+_GET_ALL = attrgetter(*_FIELDS)
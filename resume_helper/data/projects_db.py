@@ -1,28 +1,235 @@
-"""Load, validate, and filter the projects JSON database."""
+"""Load, validate, and filter the projects database.
+
+The database is a projects.json file, or a SQLite store for paths ending in one of
+SQLITE_SUFFIXES (see projects_sqlite.py); both sit behind the same functions.
+"""
 import json
 import re
+import threading
+from itertools import chain
 from pathlib import Path
 
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
+
+from resume_helper.data.project_search import TermIndex
+from resume_helper.data.project_view import ProjectView
+from resume_helper.models import ROLE_TAG_BITS, ROLE_TAGS, ProjectRecord, ProjectsFile, role_tag_mask  # noqa: F401
+
+SQLITE_SUFFIXES = {".db", ".sqlite", ".sqlite3"}
+
+# Built once: parses and validates projects.json bytes in a single pass, no json module
+_PROJECTS_ADAPTER = TypeAdapter(ProjectsFile)
+
+# resolved path -> (mtime_ns, size, ProjectIndex of ProjectViews of its enabled projects);
+# see load_projects
+_cache: dict[Path, tuple[int, int, "ProjectIndex"]] = {}
+_cache_lock = threading.Lock()
+
+
+class ProjectIndex:
+    """Projects with a precomputed role mask each (see models.role_tag_mask), for filtering.
+
+    Projects are grouped by mask, so a role filter tests each distinct mask once (there
+    are at most 2 ** len(ROLE_TAGS)) rather than every project's tag list. Skills
+    (case-insensitive) and the keyword search index (see search) are built on first use.
+    """
+
+    def __init__(self, projects: list) -> None:
+        self.projects = projects
+        self.masks = [_project_mask(p.get("role_tags") or ()) for p in projects]
+        self._by_mask: dict[int, list[int]] = {}
+        for i, mask in enumerate(self.masks):
+            self._by_mask.setdefault(mask, []).append(i)
+        self._by_skill: dict[str, list[int]] | None = None
+        self._terms: TermIndex | None = None
+
+    def select(self, any_tags=(), all_tags=(), any_skills=(), all_skills=()) -> list:
+        """Return copies of the matching projects as dicts, in file order (see positions)."""
+        return [_project_dict(self.projects[i]) for i in self.positions(any_tags, all_tags, any_skills, all_skills)]
+
+    def positions(self, any_tags=(), all_tags=(), any_skills=(), all_skills=()) -> list[int]:
+        """Return the sorted indices of projects matching every given predicate.
+
+        A project matches any_tags if it has at least one of them and all_tags if it
+        has all of them; likewise for skills. Empty predicates match everything.
+        Raises ValueError for an unknown role tag.
+        """
+        want_any, want_all = role_tag_mask(any_tags), role_tag_mask(all_tags)
+        if not (want_any or want_all or any_skills or all_skills):
+            return list(range(len(self.projects)))
+        if want_any or want_all:
+            groups = [
+                group for mask, group in self._by_mask.items()
+                if (not want_any or mask & want_any) and mask & want_all == want_all
+            ]
+            if not (any_skills or all_skills):
+                return sorted(chain.from_iterable(groups))
+            hits = set(chain.from_iterable(groups))
+        else:
+            hits = None
+        by_skill = self._skill_index()
+        if any_skills:
+            found = set(chain.from_iterable(by_skill.get(s.lower(), ()) for s in any_skills))
+            hits = found if hits is None else hits & found
+        for skill in all_skills:
+            found = by_skill.get(skill.lower(), ())
+            hits = set(found) if hits is None else hits.intersection(found)
+        return sorted(hits)
+
+    def search(
+        self, query: str, match_any: bool = False, any_tags=(), all_tags=(), limit: int | None = None,
+    ) -> list[tuple[float, dict]]:
+        """Return (score, project copy) pairs for the projects whose title, skills and
+        keywords contain every term of query (any of them with match_any), best first.
+
+        any_tags / all_tags narrow the search as in positions; limit keeps the best ones.
+        """
+        candidates = self.positions(any_tags, all_tags) if any_tags or all_tags else None
+        return [
+            (score, _project_dict(self.projects[i]))
+            for score, i in self.term_index().search(query, match_any, candidates, limit)
+        ]
+
+    def term_index(self) -> TermIndex:
+        if self._terms is None:
+            self._terms = TermIndex(self.projects)  # built whole, then published: safe to race
+        return self._terms
+
+    def updated(self, projects: list) -> "ProjectIndex":
+        """Return the index of projects, a later version of this index's list.
+
+        Entries that are the very same dicts at the same positions keep their keyword
+        index entries; only the others are re-indexed.
+        """
+        new = ProjectIndex(projects)
+        if self._terms is not None:
+            old = self.projects
+            changed = [i for i, p in enumerate(projects[:len(old)]) if p is not old[i]]
+            new._terms = self._terms.updated(changed, projects)
+        return new
+
+    def _skill_index(self) -> dict[str, list[int]]:
+        if self._by_skill is None:
+            by_skill: dict[str, list[int]] = {}
+            for i, p in enumerate(self.projects):
+                for skill in {s.lower() for s in p.get("skills") or ()}:
+                    by_skill.setdefault(skill, []).append(i)
+            self._by_skill = by_skill  # built whole, then published: safe to race
+        return self._by_skill
+
+
+def _project_dict(p) -> dict:
+    return p.to_dict() if isinstance(p, ProjectView) else dict(p)
+
+
+def _project_mask(role_tags) -> int:
+    # Unlike role_tag_mask, tolerates unknown tags: plain lists passed in are not validated
+    mask = 0
+    for tag in role_tags:
+        mask |= ROLE_TAG_BITS.get(tag, 0)
+    return mask
+
+
+def is_sqlite_store(path: str | Path) -> bool:
+    return Path(path).suffix.lower() in SQLITE_SUFFIXES
+
+
+def load_projects(path: str, role_tag: str | list[str] | None = None, match_all: bool = False) -> list:
+    """Load and validate projects.json. Returns the list of project dicts.
+
+    role_tag, one tag or several, keeps only projects carrying any of them (all of them
+    with match_all); see ProjectIndex. A SQLite store answers from its role_tags index.
+
+    Validated projects are memoized per file, as compact ProjectViews, until its mtime
+    or size changes, so repeated loads (batch jobs, the web UI) skip parsing and
+    validation. Each call returns fresh dicts the caller may modify freely; read-only
+    callers can take the memoized views themselves from load_project_views.
+    """
+    tags = role_tags_of(role_tag)
+    role_tag_mask(tags)  # reject unknown tags before touching the file
+    if is_sqlite_store(path):
+        from resume_helper.data import projects_sqlite
+        return projects_sqlite.load_projects(path, tags, match_all)
+    index = load_project_index(path)
+    return index.select(all_tags=tags) if match_all else index.select(any_tags=tags)
+
+
+def load_project_views(path: str, role_tag: str | list[str] | None = None, match_all: bool = False) -> list:
+    """load_projects, returning read-only ProjectViews rather than dicts.
+
+    For projects.json these are the memoized views themselves, so nothing is copied.
+    """
+    tags = role_tags_of(role_tag)
+    role_tag_mask(tags)
+    if is_sqlite_store(path):
+        from resume_helper.data import projects_sqlite
+        return [ProjectView.from_dict(p) for p in projects_sqlite.load_projects(path, tags, match_all)]
+    index = load_project_index(path)
+    positions = index.positions(all_tags=tags) if match_all else index.positions(any_tags=tags)
+    return [index.projects[i] for i in positions]
+
+
+def load_project_index(path: str) -> ProjectIndex:
+    """Return the memoized ProjectIndex of projects.json's enabled projects, as ProjectViews."""
+    resolved = Path(path).resolve()
+    try:
+        st = resolved.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Projects file not found: {Path(path)}") from None
+
+    cached = _cache.get(resolved)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+    index = ProjectIndex([ProjectView.from_record(p) for p in _validate_file(resolved)])
+    with _cache_lock:
+        _cache[resolved] = (st.st_mtime_ns, st.st_size, index)
+    return index
+
+
+def search_projects(
+    path: str, query: str, role_tag: str | list[str] | None = None, match_all_roles: bool = False,
+    match_any: bool = False, limit: int | None = 10,
+) -> list[tuple[float, dict]]:
+    """Return up to limit (score, project) pairs matching query, best first (see ProjectIndex.search).
+
+    role_tag and match_all_roles filter as in load_projects. A projects.json file's
+    keyword index is built on the first search and kept with its memoized load; a
+    SQLite store is indexed afresh on every call.
+    """
+    tags = role_tags_of(role_tag)
+    role_tag_mask(tags)
+    if is_sqlite_store(path):
+        from resume_helper.data import projects_sqlite
+        return ProjectIndex(projects_sqlite.load_projects(path, tags, match_all_roles)).search(
+            query, match_any, limit=limit,
+        )
+    index = load_project_index(path)
+    if match_all_roles:
+        return index.search(query, match_any, all_tags=tags, limit=limit)
+    return index.search(query, match_any, any_tags=tags, limit=limit)
 
-from resume_helper.models import ROLE_TAGS, ProjectsFile
 
+def role_tags_of(role_tag: str | list[str] | None) -> tuple[str, ...]:
+    """Normalise a role_tag argument (None, one tag or several) to a tuple of distinct tags."""
+    if not role_tag:
+        return ()
+    if isinstance(role_tag, str):
+        return (role_tag,)
+    return tuple(dict.fromkeys(role_tag))
 
-def load_projects(path: str) -> list:
-    """Load and validate projects.json. Returns the list of project dicts."""
-    resolved = Path(path)
-    if not resolved.exists():
-        raise FileNotFoundError(f"Projects file not found: {resolved}")
 
-    with resolved.open() as f:
-        data = json.load(f)
+def clear_cache() -> None:
+    """Forget every memoized projects file."""
+    with _cache_lock:
+        _cache.clear()
 
+
+def _validate_file(path: Path) -> list[ProjectRecord]:
     try:
-        validated = ProjectsFile.model_validate(data)
+        validated = _PROJECTS_ADAPTER.validate_json(path.read_bytes())
     except ValidationError as exc:
         raise ValueError(f"projects.json validation error: {exc}") from exc
-
-    return [p.model_dump() for p in validated.projects if p.enabled]
+    return [p for p in validated.projects if p.enabled]
 
 
 def merge_projects(existing: list, new_projects: list, projects_path: str) -> tuple[int, list]:
@@ -32,7 +239,12 @@ def merge_projects(existing: list, new_projects: list, projects_path: str) -> tu
     Auto-generates IDs for incoming projects that lack them.
     Accepts new_projects as dicts or ProjectRecord instances.
     Returns (count_added, merged_list).
+    A SQLite store is updated in place instead (see projects_sqlite.merge_projects).
     """
+    if is_sqlite_store(projects_path):
+        from resume_helper.data import projects_sqlite
+        return projects_sqlite.merge_projects(existing, new_projects, projects_path)
+
     # Normalize ProjectRecord instances to dicts
     normalized = [
         p.model_dump() if hasattr(p, "model_dump") else p
@@ -71,10 +283,39 @@ def merge_projects(existing: list, new_projects: list, projects_path: str) -> tu
     with resolved.open("w", encoding="utf-8") as f:
         json.dump({"projects": merged}, f, indent=2, ensure_ascii=False)
         f.write("\n")
+    _carry_cache(resolved, merged)
 
     return added, merged
 
 
+def _carry_cache(path: Path, merged: list) -> None:
+    """Re-key path's memoized index to the file merge_projects just wrote.
+
+    Projects unchanged since the load are reused as they are; only edited and new ones
+    are validated and re-indexed (see ProjectIndex.updated). If any fails validation,
+    the entry is dropped and the next load reports the error.
+    """
+    resolved = path.resolve()
+    with _cache_lock:
+        cached = _cache.pop(resolved, None)
+    if cached is None:
+        return
+    index = cached[2]
+    projects = []
+    try:
+        for i, p in enumerate(merged):
+            if i < len(index.projects) and p == _project_dict(index.projects[i]):
+                projects.append(index.projects[i])
+            else:
+                projects.append(ProjectView.from_record(ProjectRecord.model_validate(p)))
+    except ValidationError:
+        return
+    st = resolved.stat()
+    index = index.updated([p for p in projects if p["enabled"]])
+    with _cache_lock:
+        _cache[resolved] = (st.st_mtime_ns, st.st_size, index)
+
+
 def _norm(s: str) -> str:
     return s.strip().lower()
 
@@ -95,7 +336,29 @@ def filter_by_role_tag(projects: list, role_tag: str) -> list:
 
     Raises ValueError if role_tag is not a recognised tag.
     """
-    if role_tag not in ROLE_TAGS:
-        valid = ", ".join(ROLE_TAGS)
-        raise ValueError(f"Unknown role tag '{role_tag}'. Valid tags: {valid}")
+    role_tag_mask([role_tag])
     return [p for p in projects if role_tag in p.get("role_tags", [])]
+
+
+def filter_projects(projects: list, any_tags=(), all_tags=(), any_skills=(), all_skills=()) -> list:
+    """Return the projects matching every given predicate, in order (see ProjectIndex.positions).
+
+    One pass over a plain list; a loaded file's cached index (load_project_index) answers
+    the same predicates without visiting every project.
+    """
+    want_any, want_all = role_tag_mask(any_tags), role_tag_mask(all_tags)
+    any_skills = {s.lower() for s in any_skills}
+    all_skills = {s.lower() for s in all_skills}
+
+    def _keep(p: dict) -> bool:
+        if want_any or want_all:
+            mask = _project_mask(p.get("role_tags") or ())
+            if (want_any and not mask & want_any) or mask & want_all != want_all:
+                return False
+        if any_skills or all_skills:
+            skills = {s.lower() for s in p.get("skills") or ()}
+            if (any_skills and skills.isdisjoint(any_skills)) or not all_skills <= skills:
+                return False
+        return True
+
+    return [p for p in projects if _keep(p)]
@@ -0,0 +1,276 @@
+"""SQLite storage backend for the projects database.
+
+Used by projects_db.load_projects / merge_projects for any projects path ending in
+.db, .sqlite or .sqlite3. Records are validated once, on the way in, so loading is a
+single indexed query with no re-validation; merging inserts and updates only the rows
+that changed instead of rewriting the whole file; the next auto-generated ID is kept in
+a counter rather than found by scanning every ID. role_tags and skills live in indexed
+side tables, and enabled and (title, organization) are indexed on the main table.
+
+Every record is stored exactly as given (raw) next to its validated form (record), so
+JSON -> SQLite -> JSON round-trips losslessly, in the original order:
+
+    python -m resume_helper.data.projects_sqlite import projects.json projects.db
+    python -m resume_helper.data.projects_sqlite export projects.db projects.json
+
+Unlike a projects.json rewrite, a merge never drops rows missing from the existing list
+(e.g. disabled projects); remove those with export / edit / import.
+"""
+import argparse
+import json
+import re
+import sqlite3
+import sys
+from contextlib import closing
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from resume_helper.models import ProjectRecord, ProjectsFile
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    seq       INTEGER PRIMARY KEY AUTOINCREMENT,  -- insertion (= file) order
+    id        TEXT NOT NULL UNIQUE,
+    title_key TEXT NOT NULL,                      -- _norm(title), for deduplication
+    org_key   TEXT NOT NULL,                      -- _norm(organization)
+    enabled   INTEGER NOT NULL,
+    raw       TEXT NOT NULL,                      -- the record as given; export writes this
+    record    TEXT NOT NULL                       -- validated, defaults filled; load returns this
+);
+CREATE INDEX IF NOT EXISTS projects_enabled ON projects (enabled, seq);
+CREATE INDEX IF NOT EXISTS projects_title_org ON projects (title_key, org_key);
+CREATE TABLE IF NOT EXISTS project_role_tags (
+    tag TEXT NOT NULL,
+    seq INTEGER NOT NULL REFERENCES projects (seq) ON DELETE CASCADE,
+    PRIMARY KEY (tag, seq)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS project_skills (
+    skill TEXT NOT NULL COLLATE NOCASE,
+    seq   INTEGER NOT NULL REFERENCES projects (seq) ON DELETE CASCADE,
+    PRIMARY KEY (skill, seq)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+
+def load_projects(
+    path: str | Path, role_tags=(), match_all: bool = False, skill: str | None = None,
+) -> list:
+    """Return the enabled project dicts in file order.
+
+    Only projects with any of role_tags (all of them with match_all) and with skill,
+    when given; tags must be distinct.
+    """
+    resolved = Path(path)
+    if not resolved.exists():
+        raise FileNotFoundError(f"Projects file not found: {resolved}")
+    query, params = "SELECT p.record FROM projects p", []
+    if role_tags:
+        marks = ", ".join("?" * len(role_tags))
+        having = " HAVING COUNT(*) = ?" if match_all and len(role_tags) > 1 else ""
+        query += (
+            f" JOIN (SELECT seq FROM project_role_tags WHERE tag IN ({marks}) GROUP BY seq{having}) t"
+            " ON t.seq = p.seq"
+        )
+        params += [*role_tags, len(role_tags)] if having else role_tags
+    if skill:
+        query += " JOIN project_skills s ON s.seq = p.seq AND s.skill = ?"
+        params.append(skill)
+    query += " WHERE p.enabled = 1 ORDER BY p.seq"
+    with closing(_connect(resolved)) as conn:
+        rows = conn.execute(query, params).fetchall()
+    # One parse of the whole list is markedly faster than one json.loads per row
+    return json.loads("[" + ",".join(record for (record,) in rows) + "]")
+
+
+def merge_projects(existing: list, new_projects: list, path: str | Path) -> tuple[int, list]:
+    """SQLite counterpart of projects_db.merge_projects, applied incrementally.
+
+    Rows for the dicts in existing are updated where they changed; new_projects not
+    already in the store (same title and organization, case-insensitive) are inserted.
+    """
+    from resume_helper.data.projects_db import _norm
+
+    normalized = [p.model_dump() if hasattr(p, "model_dump") else p for p in new_projects]
+    resolved = Path(path)
+    resolved.parent.mkdir(parents=True, exist_ok=True)
+    added = []
+    with closing(_connect(resolved)) as conn, conn:
+        conn.execute("BEGIN IMMEDIATE")  # one writer at a time: ID allocation stays consistent
+        # Loaded dicts serialise back to their stored record unless they were edited,
+        # so only edited ones are re-validated and rewritten
+        stored = dict(conn.execute("SELECT id, record FROM projects")) if existing else {}
+        for proj in existing:
+            if stored.get(proj.get("id")) != json.dumps(proj, ensure_ascii=False, separators=(",", ":")):
+                _update(conn, proj)
+        next_id = _get_next_id(conn)
+        for proj in normalized:
+            key = (_norm(proj.get("title", "")), _norm(proj.get("organization", "")))
+            if conn.execute(
+                "SELECT 1 FROM projects WHERE title_key = ? AND org_key = ?", key,
+            ).fetchone():
+                continue
+            # Assign an ID if the LLM didn't provide one
+            if not proj.get("id"):
+                proj["id"] = f"proj_{next_id:03d}"
+            # Ensure required fields have at least an empty default so schema passes
+            proj.setdefault("summary", "")
+            proj.setdefault("skills", [])
+            proj.setdefault("role_tags", [])
+            proj.setdefault("impact", [])
+            next_id = _insert(conn, proj, next_id)
+            added.append(proj)
+        _set_next_id(conn, next_id)
+    return len(added), list(existing) + added
+
+
+def import_json(json_path: str | Path, db_path: str | Path) -> int:
+    """Replace the store's contents with the projects in json_path; return how many."""
+    from resume_helper.data.projects_db import _next_project_id
+
+    with open(json_path, encoding="utf-8") as f:
+        data = json.load(f)
+    try:
+        ProjectsFile.model_validate(data)
+    except ValidationError as exc:
+        raise ValueError(f"projects.json validation error: {exc}") from exc
+    raw_projects = data["projects"]
+
+    Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+    with closing(_connect(Path(db_path))) as conn, conn:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute("DELETE FROM projects")
+        next_id = _next_project_id(raw_projects)
+        for raw in raw_projects:
+            next_id = _insert(conn, raw, next_id)
+        _set_next_id(conn, next_id)
+    return len(raw_projects)
+
+
+def export_json(db_path: str | Path, json_path: str | Path) -> int:
+    """Write every stored project, disabled ones included, as projects.json; return how many."""
+    resolved = Path(db_path)
+    if not resolved.exists():
+        raise FileNotFoundError(f"Projects file not found: {resolved}")
+    with closing(_connect(resolved)) as conn:
+        rows = conn.execute("SELECT raw FROM projects ORDER BY seq").fetchall()
+    projects = [json.loads(raw) for (raw,) in rows]
+    out = Path(json_path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    with out.open("w", encoding="utf-8") as f:
+        json.dump({"projects": projects}, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    return len(projects)
+
+
+# -- internals ---------------------------------------------------------------
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(path, isolation_level=None)  # transactions are explicit (BEGIN)
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def _validated(raw: dict) -> ProjectRecord:
+    try:
+        return ProjectRecord.model_validate(raw)
+    except ValidationError as exc:
+        raise ValueError(f"Project '{raw.get('id', '?')}' is invalid: {exc}") from exc
+
+
+def _insert(conn: sqlite3.Connection, raw: dict, next_id: int) -> int:
+    """Insert one project; return the ID counter advanced past its ID."""
+    from resume_helper.data.projects_db import _norm
+
+    record = _validated(raw)
+    try:
+        seq = conn.execute(
+            "INSERT INTO projects (id, title_key, org_key, enabled, raw, record) VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                record.id, _norm(record.title), _norm(record.organization), record.enabled,
+                json.dumps(raw, ensure_ascii=False), record.model_dump_json(),
+            ),
+        ).lastrowid
+    except sqlite3.IntegrityError:
+        raise ValueError(f"Duplicate project id '{record.id}'") from None
+    _index(conn, seq, record)
+    m = re.search(r"(\d+)$", record.id)
+    return max(next_id, int(m.group(1)) + 1) if m else next_id
+
+
+def _update(conn: sqlite3.Connection, proj: dict) -> None:
+    """Rewrite the row for proj['id'] if its content changed; unknown IDs are inserted."""
+    from resume_helper.data.projects_db import _norm
+
+    record = _validated(proj)
+    record_json = record.model_dump_json()
+    row = conn.execute("SELECT seq, record FROM projects WHERE id = ?", (record.id,)).fetchone()
+    if row is None:
+        _set_next_id(conn, _insert(conn, proj, _get_next_id(conn)))
+        return
+    seq, stored = row
+    if stored == record_json:
+        return
+    conn.execute(
+        "UPDATE projects SET title_key = ?, org_key = ?, enabled = ?, raw = ?, record = ? WHERE seq = ?",
+        (
+            _norm(record.title), _norm(record.organization), record.enabled,
+            json.dumps(proj, ensure_ascii=False), record_json, seq,
+        ),
+    )
+    conn.execute("DELETE FROM project_role_tags WHERE seq = ?", (seq,))
+    conn.execute("DELETE FROM project_skills WHERE seq = ?", (seq,))
+    _index(conn, seq, record)
+
+
+def _index(conn: sqlite3.Connection, seq: int, record: ProjectRecord) -> None:
+    conn.executemany(
+        "INSERT OR IGNORE INTO project_role_tags (tag, seq) VALUES (?, ?)",
+        [(tag, seq) for tag in record.role_tags],
+    )
+    conn.executemany(
+        "INSERT OR IGNORE INTO project_skills (skill, seq) VALUES (?, ?)",
+        [(skill, seq) for skill in record.skills],
+    )
+
+
+def _get_next_id(conn: sqlite3.Connection) -> int:
+    row = conn.execute("SELECT value FROM meta WHERE key = 'next_id'").fetchone()
+    return int(row[0]) if row else 1
+
+
+def _set_next_id(conn: sqlite3.Connection, next_id: int) -> None:
+    conn.execute(
+        "INSERT INTO meta (key, value) VALUES ('next_id', ?) "
+        "ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+        (str(next_id),),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m resume_helper.data.projects_sqlite",
+        description="Convert a projects database between projects.json and SQLite.",
+    )
+    parser.add_argument("command", choices=["import", "export"],
+                        help="import: JSON -> SQLite (replaces the store's contents); export: SQLite -> JSON")
+    parser.add_argument("source")
+    parser.add_argument("dest")
+    args = parser.parse_args()
+    try:
+        if args.command == "import":
+            n = import_json(args.source, args.dest)
+        else:
+            n = export_json(args.source, args.dest)
+    except (FileNotFoundError, ValueError) as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        sys.exit(1)
+    print(f"{args.command.capitalize()}ed {n} project(s): {args.source} -> {args.dest}")
+
+
+if __name__ == "__main__":
+    main()
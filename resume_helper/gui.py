@@ -6,13 +6,19 @@ Run with:  resume-helper-app
 import contextlib
 import io
 import os
+import queue
 import shutil
 import sys
+import threading
 from pathlib import Path
 
 import gradio as gr
 
-from resume_helper.config import PROJECT_ROOT, DEFAULT_TEMPLATE, list_templates, resolve_user_paths, ensure_user_dirs
+from resume_helper.config import (
+    PROJECT_ROOT, DEFAULT_TEMPLATE, LLM_CACHE_ENABLED,
+    list_templates, resolve_user_paths, ensure_user_dirs,
+)
+from resume_helper.llm.registry import API_KEY_ENV, PROVIDERS, get_provider, wrap_provider
 from resume_helper.models import ROLE_TAGS
 
 
@@ -32,12 +38,7 @@ def _inject_api_key(provider: str, api_key: str) -> None:
     """Write API key into os.environ for the chosen provider (never persisted to disk)."""
     if not api_key.strip():
         return
-    key_map = {
-        "gemini": "GEMINI_API_KEY",
-        "openai": "OPENAI_API_KEY",
-        "claude": "ANTHROPIC_API_KEY",
-    }
-    env_var = key_map.get(provider)
+    env_var = API_KEY_ENV.get(provider)
     if env_var:
         os.environ[env_var] = api_key.strip()
 
@@ -53,19 +54,6 @@ def _save_uploaded_resume(file_obj, user: str) -> str:
     return str(dest)
 
 
-def _get_provider(provider: str):
-    if provider == "claude":
-        from resume_helper.llm.claude_provider import ClaudeProvider
-        return ClaudeProvider()
-    if provider == "openai":
-        from resume_helper.llm.openai_provider import OpenAIProvider
-        return OpenAIProvider()
-    if provider == "gemini":
-        from resume_helper.llm.gemini_provider import GeminiProvider
-        return GeminiProvider()
-    raise ValueError(f"Provider '{provider}' is not yet implemented.")
-
-
 # ---------------------------------------------------------------------------
 # Event handlers
 # ---------------------------------------------------------------------------
@@ -79,10 +67,12 @@ def _build_resume_handler(
     template: str,
     provider: str,
     api_key: str,
-) -> tuple[str, str, str | None, str | None]:
+):
     """Build Resume button handler.
 
-    Returns (log, preview_markdown, md_filepath, docx_filepath).
+    A generator: yields (log, preview_markdown, md_filepath, docx_filepath) repeatedly,
+    so the preview fills in while the LLM streams, then with the Markdown file as soon as
+    it is written, and once more when the background DOCX conversion finishes.
     """
     log_buf = io.StringIO()
     print(f"[resume-helper] Active profile: {user}", file=log_buf)
@@ -91,7 +81,8 @@ def _build_resume_handler(
 
         job_input = job_url.strip() or job_text.strip()
         if not job_input:
-            return "ERROR: Provide a job description — paste text or enter a URL.", "", None, None
+            yield "ERROR: Provide a job description — paste text or enter a URL.", "", None, None
+            return
 
         resume_path = _save_uploaded_resume(resume_file, user) if resume_file else None
         user_paths = resolve_user_paths(user)
@@ -99,27 +90,62 @@ def _build_resume_handler(
 
         from resume_helper.builder.resume_builder import build_resume
 
-        with contextlib.redirect_stderr(log_buf):
-            md_path, docx_path = build_resume(
-                resume_path=resume_path,
-                job_input=job_input,
-                projects_path=None,
-                role_tag=role_tag or None,
-                provider=provider,
-                output_path=None,
-                template=template,
-                user_paths=user_paths,
-            )
-
-        log = log_buf.getvalue()
+        # build_resume runs on a worker thread and hands streamed text back through chunks;
+        # None marks the end of the build
+        chunks: queue.Queue = queue.Queue()
+        outcome: dict = {}
+
+        def _run() -> None:
+            try:
+                with contextlib.redirect_stderr(log_buf):
+                    outcome["paths"] = build_resume(
+                        resume_path=resume_path,
+                        job_input=job_input,
+                        projects_path=None,
+                        role_tag=role_tag or None,
+                        provider=provider,
+                        output_path=None,
+                        template=template,
+                        user_paths=user_paths,
+                        llm_cache=LLM_CACHE_ENABLED,
+                        on_chunk=chunks.put,
+                        background_docx=True,
+                    )
+            except Exception as exc:
+                outcome["error"] = exc
+            finally:
+                chunks.put(None)
+
+        threading.Thread(target=_run, daemon=True).start()
+
+        streamed = ""
+        done = False
+        while not done:
+            # Block for the next chunk, then take whatever else has queued up so each
+            # UI update covers all text received so far
+            pending = [chunks.get()]
+            while not chunks.empty():
+                pending.append(chunks.get_nowait())
+            done = pending[-1] is None
+            streamed += "".join(c for c in pending if c is not None)
+            if not done:
+                yield log_buf.getvalue(), streamed, None, None
+
+        if "error" in outcome:
+            raise outcome["error"]
+        md_path, docx_path = outcome["paths"]
+
         preview = md_path.read_text()
-        docx_str = str(docx_path) if docx_path.exists() else None
-        return log, preview, str(md_path), docx_str
+        yield log_buf.getvalue(), preview, str(md_path), None
+
+        from resume_helper.output.md2docx import wait_for_docx
+        docx_path = wait_for_docx(docx_path)
+        yield log_buf.getvalue(), preview, str(md_path), str(docx_path) if docx_path else None
 
     except (FileNotFoundError, ValueError) as exc:
-        return f"{log_buf.getvalue()}\nERROR: {exc}", "", None, None
+        yield f"{log_buf.getvalue()}\nERROR: {exc}", "", None, None
     except Exception as exc:
-        return f"{log_buf.getvalue()}\nUnexpected error: {exc}", "", None, None
+        yield f"{log_buf.getvalue()}\nUnexpected error: {exc}", "", None, None
 
 
 def _import_projects_handler(
@@ -150,9 +176,9 @@ def _import_projects_handler(
 
         with contextlib.redirect_stderr(log_buf):
             print(f"[import-projects] Parsing resume: {resume_path}", file=sys.stderr)
-            resume_text = parse_pdf(resume_path)
+            resume_text = parse_pdf(resume_path, cache_dir=user_paths.cache_dir)
 
-            llm = _get_provider(provider)
+            llm = wrap_provider(get_provider(provider), user_paths.cache_dir if LLM_CACHE_ENABLED else None)
             print(f"[import-projects] Extracting projects via {llm.get_model_name()}...", file=sys.stderr)
             new_projects = extract_projects(resume_text, llm)
             print(f"[import-projects] Extracted {len(new_projects)} project(s).", file=sys.stderr)
@@ -215,7 +241,7 @@ def _create_user_handler(new_user: str, br_user_comp, ip_user_comp):
 # ---------------------------------------------------------------------------
 
 def main() -> None:
-    providers = ["gemini", "openai", "claude"]
+    providers = PROVIDERS
     role_choices = [""] + ROLE_TAGS
     templates = list_templates()
     users = _list_users()
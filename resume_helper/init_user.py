@@ -3,6 +3,7 @@ import shutil
 import sys
 
 from resume_helper.config import PROJECT_ROOT, resolve_user_paths, ensure_user_dirs
+from resume_helper.data.projects_db import is_sqlite_store
 
 
 def main() -> None:
@@ -19,7 +20,12 @@ def main() -> None:
         sys.exit(0)
 
     ensure_user_dirs(user_paths)
-    shutil.copy(PROJECT_ROOT / "shared" / "projects_empty.json", user_paths.projects)
+    empty_projects = PROJECT_ROOT / "shared" / "projects_empty.json"
+    if is_sqlite_store(user_paths.projects):
+        from resume_helper.data.projects_sqlite import import_json
+        import_json(empty_projects, user_paths.projects)
+    else:
+        shutil.copy(empty_projects, user_paths.projects)
 
     print(f"[init] Created user profile '{name}'.")
     print(f"[init] Drop your resume PDF at:")
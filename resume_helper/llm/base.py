@@ -1,11 +1,24 @@
 """LLMProvider Protocol — structural typing, no inheritance required."""
-from typing import Protocol, Type, TypeVar
+import sys
+from typing import Iterator, Protocol, Type, TypeVar
 
 T = TypeVar("T")
 
 
 class LLMProvider(Protocol):
     def complete(self, system_prompt: str, user_prompt: str) -> str: ...
+    def complete_stream(self, system_prompt: str, user_prompt: str, prefix_chars: int = 0) -> Iterator[str]: ...
     def complete_structured(self, system_prompt: str, user_prompt: str, response_model: Type[T]) -> list[T]: ...
     def complete_structured_one(self, system_prompt: str, user_prompt: str, response_model: Type[T]) -> T: ...
     def get_model_name(self) -> str: ...
+
+
+def report_cache_usage(model: str, input_tokens: int, cached_tokens: int, written_tokens: int = 0) -> None:
+    """Print how much of a request's input the provider served from its prompt cache."""
+    line = (
+        f"[llm] {model}: {input_tokens:,} input tokens — {cached_tokens:,} cache hit, "
+        f"{input_tokens - cached_tokens - written_tokens:,} miss"
+    )
+    if written_tokens:
+        line += f", {written_tokens:,} written to cache"
+    print(line, file=sys.stderr)
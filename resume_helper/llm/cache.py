@@ -0,0 +1,165 @@
+"""Content-addressed on-disk cache that wraps any LLMProvider.
+
+Entries are keyed by a hash of (model, call kind, system prompt, user prompt, response
+schema), so a byte-identical request is served from disk instead of the network.
+Eviction is least-recently-used: a hit refreshes the entry's mtime, entries older than
+max_age are dropped, and the oldest go first once the cache exceeds max_bytes. The
+directory is scanned on the first write and then only when a running total of the bytes
+written goes over max_bytes, not on every write.
+"""
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from resume_helper.config import LLM_CACHE_MAX_AGE_DAYS, LLM_CACHE_MAX_MB
+
+
+def cache_key(model: str, kind: str, system_prompt: str, user_prompt: str, schema: dict | None = None) -> str:
+    """Return the hex SHA-256 identifying one LLM request."""
+    payload = json.dumps(
+        {"model": model, "kind": kind, "system": system_prompt, "user": user_prompt, "schema": schema},
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CachedProvider:
+    """LLMProvider wrapper that reads through an on-disk response cache.
+
+    refresh=True skips lookups but still stores fresh responses, overwriting stale ones.
+    """
+
+    def __init__(
+        self,
+        inner,
+        cache_dir: Path,
+        refresh: bool = False,
+        max_bytes: int = LLM_CACHE_MAX_MB * 1024 * 1024,
+        max_age_seconds: float = LLM_CACHE_MAX_AGE_DAYS * 86400,
+    ) -> None:
+        self._inner = inner
+        self._dir = Path(cache_dir)
+        self._refresh = refresh
+        self._max_bytes = max_bytes
+        self._max_age = max_age_seconds
+        # Cache size as of the last prune plus what was written since; None until scanned
+        self._size: int | None = None
+        self._size_lock = threading.Lock()
+
+    def complete(self, system_prompt: str, user_prompt: str) -> str:
+        key = cache_key(self.get_model_name(), "complete", system_prompt, user_prompt)
+        hit = self._get(key)
+        if hit is not None:
+            return hit["text"]
+        text = self._inner.complete(system_prompt, user_prompt)
+        self._put(key, {"text": text})
+        return text
+
+    def complete_stream(self, system_prompt: str, user_prompt: str, prefix_chars: int = 0):
+        """Stream through the inner provider; a hit arrives as a single chunk.
+
+        Shares entries with complete(). A stream abandoned part-way is not stored.
+        """
+        key = cache_key(self.get_model_name(), "complete", system_prompt, user_prompt)
+        hit = self._get(key)
+        if hit is not None:
+            yield hit["text"]
+            return
+        chunks = []
+        for chunk in self._inner.complete_stream(system_prompt, user_prompt, prefix_chars):
+            chunks.append(chunk)
+            yield chunk
+        self._put(key, {"text": "".join(chunks)})
+
+    def complete_structured(self, system_prompt: str, user_prompt: str, response_model) -> list:
+        key = cache_key(
+            self.get_model_name(), "structured", system_prompt, user_prompt,
+            response_model.model_json_schema(),
+        )
+        hit = self._get(key)
+        if hit is not None:
+            return [response_model.model_validate(item) for item in hit["items"]]
+        items = self._inner.complete_structured(system_prompt, user_prompt, response_model)
+        self._put(key, {"items": [item.model_dump(mode="json") for item in items]})
+        return items
+
+    def complete_structured_one(self, system_prompt: str, user_prompt: str, response_model):
+        key = cache_key(
+            self.get_model_name(), "structured_one", system_prompt, user_prompt,
+            response_model.model_json_schema(),
+        )
+        hit = self._get(key)
+        if hit is not None:
+            return response_model.model_validate(hit["item"])
+        item = self._inner.complete_structured_one(system_prompt, user_prompt, response_model)
+        self._put(key, {"item": item.model_dump(mode="json")})
+        return item
+
+    def get_model_name(self) -> str:
+        return self._inner.get_model_name()
+
+    # -- storage ------------------------------------------------------------
+
+    def _path(self, key: str) -> Path:
+        return self._dir / key[:2] / f"{key}.json"
+
+    def _get(self, key: str) -> dict | None:
+        if self._refresh:
+            return None
+        path = self._path(key)
+        try:
+            if time.time() - path.stat().st_mtime > self._max_age:
+                return None
+            entry = json.loads(path.read_text(encoding="utf-8"))
+            os.utime(path)  # mark as recently used
+        except (OSError, ValueError):
+            return None
+        print(f"[llm-cache] Hit {key[:12]} ({self.get_model_name()})", file=sys.stderr)
+        return entry
+
+    def _put(self, key: str, entry: dict) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename so concurrent readers never see a partial entry
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp, path)
+        self._account(path.stat().st_size)
+
+    def _account(self, written: int) -> None:
+        """Add a write to the running size; prune once it goes over max_bytes."""
+        with self._size_lock:
+            if self._size is not None and self._size + written <= self._max_bytes:
+                self._size += written
+                return
+        self.prune()
+
+    def prune(self) -> None:
+        """Drop expired entries, then least-recently-used ones until under max_bytes."""
+        now = time.time()
+        entries = []
+        for path in self._dir.glob("*/*.json"):
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            if now - st.st_mtime > self._max_age:
+                path.unlink(missing_ok=True)
+            else:
+                entries.append((st.st_mtime, st.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self._max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+        with self._size_lock:
+            self._size = total
@@ -1,19 +1,23 @@
 """Anthropic Claude LLM provider implementation."""
 import anthropic
+import httpx
 import instructor
 
 from resume_helper.config import ANTHROPIC_API_KEY, MAX_TOKENS
+from resume_helper.llm.base import report_cache_usage
 
 MODEL = "claude-sonnet-4-6"
 
 
 class ClaudeProvider:
-    def __init__(self) -> None:
-        if not ANTHROPIC_API_KEY:
+    def __init__(self, api_key: str | None = None, limits: httpx.Limits | None = None) -> None:
+        api_key = api_key or ANTHROPIC_API_KEY
+        if not api_key:
             raise EnvironmentError(
                 "ANTHROPIC_API_KEY is not set. Copy .env.example to .env and add your key."
             )
-        self._client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
+        http_client = anthropic.DefaultHttpxClient(limits=limits) if limits else None
+        self._client = anthropic.Anthropic(api_key=api_key, http_client=http_client)
         self._instructor = instructor.from_anthropic(self._client)
 
     def complete(self, system_prompt: str, user_prompt: str) -> str:
@@ -25,6 +29,29 @@ class ClaudeProvider:
         )
         return message.content[0].text
 
+    def complete_stream(self, system_prompt: str, user_prompt: str, prefix_chars: int = 0):
+        """Yield text deltas as they arrive; closing the generator ends the request.
+
+        The system prompt and the first prefix_chars of user_prompt are marked as
+        cache breakpoints, so builds that share them re-read the prefix from Anthropic's
+        prompt cache. Prefixes under the model's minimum cacheable length are not cached.
+        """
+        cached = {"cache_control": {"type": "ephemeral"}}
+        content = [{"type": "text", "text": user_prompt[:prefix_chars], **cached}] if prefix_chars else []
+        if user_prompt[prefix_chars:]:
+            content.append({"type": "text", "text": user_prompt[prefix_chars:]})
+        with self._client.messages.stream(
+            model=MODEL,
+            max_tokens=MAX_TOKENS,
+            system=[{"type": "text", "text": system_prompt, **cached}],
+            messages=[{"role": "user", "content": content}],
+        ) as stream:
+            yield from stream.text_stream
+            usage = stream.get_final_message().usage
+        read = usage.cache_read_input_tokens or 0
+        written = usage.cache_creation_input_tokens or 0
+        report_cache_usage(MODEL, usage.input_tokens + read + written, read, written)
+
     def complete_structured(self, system_prompt: str, user_prompt: str, response_model) -> list:
         return self._instructor.chat.completions.create(
             model=MODEL,
@@ -1,20 +1,24 @@
 """Google Gemini LLM provider implementation."""
+import httpx
 import instructor
 from google import genai
 from google.genai import types
 
 from resume_helper.config import GEMINI_API_KEY, MAX_TOKENS
+from resume_helper.llm.base import report_cache_usage
 
 MODEL = "gemini-3-flash-preview"
 
 
 class GeminiProvider:
-    def __init__(self) -> None:
-        if not GEMINI_API_KEY:
+    def __init__(self, api_key: str | None = None, limits: httpx.Limits | None = None) -> None:
+        api_key = api_key or GEMINI_API_KEY
+        if not api_key:
             raise EnvironmentError(
                 "GEMINI_API_KEY is not set. Copy .env.example to .env and add your key."
             )
-        self._client = genai.Client(api_key=GEMINI_API_KEY)
+        http_options = types.HttpOptions(client_args={"limits": limits}) if limits else None
+        self._client = genai.Client(api_key=api_key, http_options=http_options)
         self._instructor = instructor.from_genai(self._client)
 
     def complete(self, system_prompt: str, user_prompt: str) -> str:
@@ -28,6 +32,31 @@ class GeminiProvider:
         )
         return response.text
 
+    def complete_stream(self, system_prompt: str, user_prompt: str, prefix_chars: int = 0):
+        """Yield text deltas as they arrive; closing the generator ends the request.
+
+        Gemini caches repeated prompt prefixes implicitly, so prefix_chars needs no
+        markup here; the cached share of the input is reported once the stream ends.
+        """
+        stream = self._client.models.generate_content_stream(
+            model=MODEL,
+            contents=user_prompt,
+            config=types.GenerateContentConfig(
+                system_instruction=system_prompt,
+                max_output_tokens=MAX_TOKENS,
+            ),
+        )
+        usage = None
+        try:
+            for chunk in stream:
+                usage = chunk.usage_metadata or usage
+                if chunk.text:
+                    yield chunk.text
+        finally:
+            stream.close()
+        if usage is not None and usage.prompt_token_count:
+            report_cache_usage(MODEL, usage.prompt_token_count, usage.cached_content_token_count or 0)
+
     def complete_structured(self, system_prompt: str, user_prompt: str, response_model) -> list:
         return self._instructor.create(
             model=MODEL,
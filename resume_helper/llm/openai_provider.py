@@ -1,19 +1,23 @@
 """OpenAI LLM provider implementation."""
+import httpx
 import instructor
 import openai
 
 from resume_helper.config import OPENAI_API_KEY, MAX_TOKENS
+from resume_helper.llm.base import report_cache_usage
 
 MODEL = "gpt-5.2"
 
 
 class OpenAIProvider:
-    def __init__(self) -> None:
-        if not OPENAI_API_KEY:
+    def __init__(self, api_key: str | None = None, limits: httpx.Limits | None = None) -> None:
+        api_key = api_key or OPENAI_API_KEY
+        if not api_key:
             raise EnvironmentError(
                 "OPENAI_API_KEY is not set. Copy .env.example to .env and add your key."
             )
-        self._client = openai.OpenAI(api_key=OPENAI_API_KEY)
+        http_client = openai.DefaultHttpxClient(limits=limits) if limits else None
+        self._client = openai.OpenAI(api_key=api_key, http_client=http_client)
         self._instructor = instructor.from_openai(self._client)
 
     def complete(self, system_prompt: str, user_prompt: str) -> str:
@@ -27,6 +31,32 @@ class OpenAIProvider:
         )
         return response.choices[0].message.content
 
+    def complete_stream(self, system_prompt: str, user_prompt: str, prefix_chars: int = 0):
+        """Yield text deltas as they arrive; closing the generator ends the request.
+
+        OpenAI caches long prompt prefixes automatically, so prefix_chars needs no
+        markup here; the cached share of the input is reported once the stream ends.
+        """
+        stream = self._client.chat.completions.create(
+            model=MODEL,
+            max_tokens=MAX_TOKENS,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+        usage = None
+        with stream:
+            for chunk in stream:
+                usage = chunk.usage or usage
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        if usage is not None:
+            details = usage.prompt_tokens_details
+            report_cache_usage(MODEL, usage.prompt_tokens, (details and details.cached_tokens) or 0)
+
     def complete_structured(self, system_prompt: str, user_prompt: str, response_model) -> list:
         return self._instructor.chat.completions.create(
             model=MODEL,
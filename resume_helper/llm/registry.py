@@ -0,0 +1,96 @@
+"""Process-wide provider registry: one long-lived LLM client per (provider, API key).
+
+SDK clients hold HTTP connection pools, so reusing them across builds keeps TLS
+sessions and keep-alive connections warm — which matters most in the web UI, where
+every button press used to construct a fresh client. Clients are thread-safe and are
+shared by the CLI, batch builds, the import pipeline and the GUI.
+"""
+import hashlib
+import os
+import threading
+from pathlib import Path
+
+import httpx
+
+from resume_helper.config import (
+    LLM_POOL_KEEPALIVE_EXPIRY, LLM_POOL_MAX_CONNECTIONS, LLM_POOL_MAX_KEEPALIVE, REPLAY_DIR, REPLAY_LATENCY,
+)
+
+PROVIDERS = ["gemini", "openai", "claude"]
+
+# Offline providers that need no API key; not offered in the web UI
+OFFLINE_PROVIDERS = ["stub", "replay"]
+
+# Environment variable holding each provider's default API key
+API_KEY_ENV = {
+    "gemini": "GEMINI_API_KEY",
+    "openai": "OPENAI_API_KEY",
+    "claude": "ANTHROPIC_API_KEY",
+}
+
+_instances: dict[tuple[str, str], object] = {}
+_lock = threading.Lock()
+
+
+def get_provider(name: str, api_key: str | None = None):
+    """Return the shared provider for name, creating it on first use.
+
+    api_key overrides the key from the environment / .env. Raises ValueError for an
+    unknown provider and EnvironmentError when no API key is available.
+    """
+    if name not in API_KEY_ENV and name not in OFFLINE_PROVIDERS:
+        available = ", ".join(PROVIDERS + OFFLINE_PROVIDERS)
+        raise ValueError(f"Provider '{name}' is not yet implemented. Available: {available}")
+    key = api_key or os.getenv(API_KEY_ENV.get(name, ""), "")
+    # Index by a digest so raw keys don't sit in the registry
+    slot = (name, hashlib.sha256(key.encode("utf-8")).hexdigest())
+    with _lock:
+        provider = _instances.get(slot)
+        if provider is None:
+            provider = _create(name, key or None)
+            _instances[slot] = provider
+        return provider
+
+
+def wrap_provider(llm, cache_dir: Path | None = None, refresh: bool = False, record: bool = False):
+    """Return llm wrapped as the CLI flags ask: --record, then --cache / --refresh.
+
+    record tees every exchange to REPLAY_DIR for `--provider replay`. A cache_dir (the
+    user's cache root) adds the on-disk response cache under cache_dir / "llm";
+    refresh skips cached answers and overwrites them.
+    """
+    if record:
+        from resume_helper.llm.replay_provider import ReplayProvider
+        llm = ReplayProvider(REPLAY_DIR, inner=llm)
+    if cache_dir is not None:
+        from resume_helper.llm.cache import CachedProvider
+        llm = CachedProvider(llm, Path(cache_dir) / "llm", refresh=refresh)
+    return llm
+
+
+def clear() -> None:
+    """Forget every cached provider (their clients close once unreferenced)."""
+    with _lock:
+        _instances.clear()
+
+
+def _create(name: str, api_key: str | None):
+    limits = httpx.Limits(
+        max_connections=LLM_POOL_MAX_CONNECTIONS,
+        max_keepalive_connections=LLM_POOL_MAX_KEEPALIVE,
+        keepalive_expiry=LLM_POOL_KEEPALIVE_EXPIRY,
+    )
+    if name == "replay":
+        from resume_helper.llm.replay_provider import ReplayProvider
+        return ReplayProvider(REPLAY_DIR, latency=REPLAY_LATENCY)
+    if name == "stub":
+        from resume_helper.llm.stub_provider import StubProvider
+        return StubProvider(api_key, limits)
+    if name == "claude":
+        from resume_helper.llm.claude_provider import ClaudeProvider
+        return ClaudeProvider(api_key, limits)
+    if name == "openai":
+        from resume_helper.llm.openai_provider import OpenAIProvider
+        return OpenAIProvider(api_key, limits)
+    from resume_helper.llm.gemini_provider import GeminiProvider
+    return GeminiProvider(api_key, limits)
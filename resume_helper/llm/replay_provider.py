@@ -0,0 +1,190 @@
+"""Record/replay LLM provider for deterministic, network-free builds and imports.
+
+Record mode wraps a real provider and writes every exchange to a recordings directory:
+the response, the model that produced it, its wall-clock duration and, for streams,
+each chunk with its arrival time. Replay mode (`--provider replay`) serves those
+exchanges back without network access or API keys, so recordings made on one machine
+can drive benchmarks and load tests on an air-gapped one.
+
+Exchanges are keyed like the response cache (see llm/cache.py) but without the model
+name, so a replay needs no knowledge of which provider was recorded; recording the same
+request again overwrites it. A request with no recording raises ValueError.
+
+Replay latency is one of:
+    none                    answer immediately (default)
+    recorded                wait as long as the recorded call took
+    fixed:S                 wait S seconds
+    normal:MEAN,SD          wait a normally distributed time (clamped at 0)
+    lognormal:MEDIAN,SIGMA  wait a log-normally distributed time
+Streams keep their recorded chunk boundaries and relative timing, stretched to the
+simulated duration.
+"""
+import json
+import math
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from resume_helper.llm.cache import cache_key
+
+MODEL = "replay"
+
+LATENCY_MODES = ["none", "recorded", "fixed", "normal", "lognormal"]
+
+
+def parse_latency(spec: str | None):
+    """Return a function (rng, recorded_seconds) -> seconds to wait, for a latency spec."""
+    mode, _, params = (spec or "none").strip().partition(":")
+    try:
+        values = [float(v) for v in params.split(",")] if params else []
+    except ValueError:
+        values = None
+    expected = {"none": 0, "recorded": 0, "fixed": 1, "normal": 2, "lognormal": 2}.get(mode)
+    if expected is None or values is None or len(values) != expected or any(v < 0 for v in values):
+        raise ValueError(
+            f"Invalid replay latency '{spec}'. Use none, recorded, fixed:S, normal:MEAN,SD "
+            "or lognormal:MEDIAN,SIGMA (seconds)"
+        )
+    if mode == "none":
+        return lambda rng, recorded: 0.0
+    if mode == "recorded":
+        return lambda rng, recorded: recorded
+    if mode == "fixed":
+        return lambda rng, recorded: values[0]
+    if mode == "normal":
+        return lambda rng, recorded: max(0.0, rng.gauss(values[0], values[1]))
+    if values[0] == 0:
+        return lambda rng, recorded: 0.0
+    return lambda rng, recorded: rng.lognormvariate(math.log(values[0]), values[1])
+
+
+class ReplayProvider:
+    """LLMProvider that records a real provider's exchanges, or replays recorded ones.
+
+    With inner, every call goes through inner and is written to recordings_dir.
+    Without it, calls are answered from recordings_dir, after the simulated latency;
+    seed makes the sampled latencies repeatable.
+    """
+
+    def __init__(self, recordings_dir: Path, inner=None, latency: str | None = None, seed: int | None = None) -> None:
+        self._dir = Path(recordings_dir)
+        self._inner = inner
+        self._latency = parse_latency(latency)
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()  # batch builds share one provider across threads
+
+    @property
+    def recording(self) -> bool:
+        return self._inner is not None
+
+    def complete(self, system_prompt: str, user_prompt: str) -> str:
+        key = cache_key("", "complete", system_prompt, user_prompt)
+        if self.recording:
+            start = time.perf_counter()
+            text = self._inner.complete(system_prompt, user_prompt)
+            self._record(key, "complete", time.perf_counter() - start, {"text": text})
+            return text
+        entry = self._replay(key, "complete")
+        time.sleep(self._delay(entry))
+        return entry["text"]
+
+    def complete_stream(self, system_prompt: str, user_prompt: str, prefix_chars: int = 0):
+        """Stream through inner, or replay a recorded stream chunk by chunk.
+
+        Shares recordings with complete(): a non-streamed recording replays as one chunk.
+        A stream the caller closes part-way is recorded as far as it was read.
+        """
+        key = cache_key("", "complete", system_prompt, user_prompt)
+        if self.recording:
+            yield from self._record_stream(key, self._inner.complete_stream(system_prompt, user_prompt, prefix_chars))
+            return
+        entry = self._replay(key, "complete")
+        chunks = entry.get("chunks") or [[entry["seconds"], entry["text"]]]
+        scale = self._delay(entry) / entry["seconds"] if entry["seconds"] else 0.0
+        start = time.perf_counter()
+        for offset, chunk in chunks:
+            wait = offset * scale - (time.perf_counter() - start)
+            if wait > 0:
+                time.sleep(wait)
+            yield chunk
+
+    def complete_structured(self, system_prompt: str, user_prompt: str, response_model) -> list:
+        key = cache_key(
+            "", "structured", system_prompt, user_prompt, response_model.model_json_schema(),
+        )
+        if self.recording:
+            start = time.perf_counter()
+            items = self._inner.complete_structured(system_prompt, user_prompt, response_model)
+            self._record(key, "structured", time.perf_counter() - start,
+                         {"items": [item.model_dump(mode="json") for item in items]})
+            return items
+        entry = self._replay(key, "structured")
+        time.sleep(self._delay(entry))
+        return [response_model.model_validate(item) for item in entry["items"]]
+
+    def complete_structured_one(self, system_prompt: str, user_prompt: str, response_model):
+        key = cache_key(
+            "", "structured_one", system_prompt, user_prompt, response_model.model_json_schema(),
+        )
+        if self.recording:
+            start = time.perf_counter()
+            item = self._inner.complete_structured_one(system_prompt, user_prompt, response_model)
+            self._record(key, "structured_one", time.perf_counter() - start,
+                         {"item": item.model_dump(mode="json")})
+            return item
+        entry = self._replay(key, "structured_one")
+        time.sleep(self._delay(entry))
+        return response_model.model_validate(entry["item"])
+
+    def get_model_name(self) -> str:
+        return self._inner.get_model_name() if self.recording else MODEL
+
+    # -- storage ------------------------------------------------------------
+
+    def _path(self, key: str) -> Path:
+        return self._dir / key[:2] / f"{key}.json"
+
+    def _record_stream(self, key: str, stream):
+        chunks = []
+        start = time.perf_counter()
+        try:
+            for chunk in stream:
+                chunks.append([round(time.perf_counter() - start, 6), chunk])
+                yield chunk
+        except GeneratorExit:
+            stream.close()
+            self._record_chunks(key, start, chunks)
+            raise
+        self._record_chunks(key, start, chunks)
+
+    def _record_chunks(self, key: str, start: float, chunks: list) -> None:
+        entry = {"text": "".join(chunk for _, chunk in chunks), "chunks": chunks}
+        self._record(key, "complete", time.perf_counter() - start, entry)
+
+    def _record(self, key: str, kind: str, seconds: float, entry: dict) -> None:
+        entry = {"model": self._inner.get_model_name(), "kind": kind, "seconds": round(seconds, 6), **entry}
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename so a concurrent replay never sees a partial entry
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp, path)
+        print(f"[llm] Recorded {kind} {key[:12]} ({entry['model']}, {seconds:.2f} s)", file=sys.stderr)
+
+    def _replay(self, key: str, kind: str) -> dict:
+        try:
+            return json.loads(self._path(key).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            raise ValueError(
+                f"No recorded {kind} response for this request ({key[:12]}) in {self._dir}. "
+                "Record one by re-running with --record and a real provider."
+            ) from None
+
+    def _delay(self, entry: dict) -> float:
+        with self._rng_lock:
+            return self._latency(self._rng, entry["seconds"])
@@ -0,0 +1,72 @@
+"""Offline stand-in LLM provider: deterministic canned answers, no network, no API key.
+
+Selected with `--provider stub` to profile or benchmark the local pipeline in isolation.
+Answers are built from the prompt so every downstream stage has realistic input: a
+resume listing the candidate projects, one project per title in the resume's Project
+Experience section, no duplicates and no coverage gaps.
+"""
+import re
+
+from resume_helper.models import ROLE_TAGS, DuplicateMatch, MergedProjectText, ProjectRecord
+
+MODEL = "stub"
+
+# complete_stream() chunk size, roughly one token-burst of a real stream
+_CHUNK_CHARS = 16
+
+
+class StubProvider:
+    def __init__(self, api_key: str | None = None, limits=None) -> None:
+        pass
+
+    def complete(self, system_prompt: str, user_prompt: str) -> str:
+        if "JOB POSTING\n" in user_prompt:
+            return _resume(user_prompt)
+        return "NONE"  # coverage check: nothing missing
+
+    def complete_stream(self, system_prompt: str, user_prompt: str, prefix_chars: int = 0):
+        text = self.complete(system_prompt, user_prompt)
+        for i in range(0, len(text), _CHUNK_CHARS):
+            yield text[i:i + _CHUNK_CHARS]
+
+    def complete_structured(self, system_prompt: str, user_prompt: str, response_model) -> list:
+        if response_model is not ProjectRecord:
+            return []
+        from resume_helper.builder.resume_builder import _extract_project_titles
+        return [
+            ProjectRecord(
+                id=re.sub(r"[^a-z0-9]+", "_", title.lower()).strip("_"),
+                title=title,
+                summary=title,
+                skills=[],
+                role_tags=[ROLE_TAGS[0]],
+                impact=[],
+            )
+            for title in _extract_project_titles(user_prompt)
+        ]
+
+    def complete_structured_one(self, system_prompt: str, user_prompt: str, response_model):
+        if response_model is DuplicateMatch:
+            return DuplicateMatch(matched_id="", reason="stub provider never matches")
+        if response_model is MergedProjectText:
+            return MergedProjectText(summary="", description_long="")
+        raise TypeError(f"StubProvider has no canned {response_model.__name__}")
+
+    def get_model_name(self) -> str:
+        return MODEL
+
+
+def _resume(user_prompt: str) -> str:
+    job = user_prompt.split("JOB POSTING\n", 1)[1].split("\n", 1)[1].strip()
+    role = job.splitlines()[0].strip() if job else "Role"
+    titles = re.findall(r"^Project: (.+)$", user_prompt, re.MULTILINE)
+    summaries = re.findall(r"^Summary: (.+)$", user_prompt, re.MULTILINE)
+    projects = "\n\n".join(f"### {t}\n{s}" for t, s in zip(titles, summaries + [""] * len(titles)))
+    return (
+        f"COMPANY: Stub Co\nROLE: {role}\n"
+        "# Candidate\n\n##### candidate@example.com\n\n---\n\n"
+        "## Work Experience\n\n#### **Engineer, Example Corp** | 2020 - Present\n"
+        "- **Delivery:** Built and ran data pipelines.\n\n---\n\n"
+        f"## Project Experience\n\n{projects}\n\n---\n\n"
+        f"## SELECTION NOTES\nStub provider: kept all {len(titles)} project(s) in prompt order.\n"
+    )
@@ -10,6 +10,26 @@ ROLE_TAGS = [
     "data_engineer",
 ]
 
+# Built once: role_tags is validated for every project on every cold load
+_ROLE_TAG_SET = frozenset(ROLE_TAGS)
+
+# Bit i of a role mask stands for ROLE_TAGS[i]; append new tags to keep stored masks valid
+ROLE_TAG_BITS = {tag: 1 << i for i, tag in enumerate(ROLE_TAGS)}
+
+
+def role_tag_mask(tags) -> int:
+    """Return the role mask with the bit of every tag in tags set.
+
+    Raises ValueError for a tag not in ROLE_TAGS.
+    """
+    mask = 0
+    for tag in tags:
+        bit = ROLE_TAG_BITS.get(tag)
+        if bit is None:
+            raise ValueError(f"Unknown role tag '{tag}'. Valid tags: {', '.join(ROLE_TAGS)}")
+        mask |= bit
+    return mask
+
 
 class ProjectRecord(BaseModel):
     # Required fields
@@ -34,8 +54,8 @@ class ProjectRecord(BaseModel):
     def role_tags_must_be_valid(cls, v: list[str]) -> list[str]:
         if not v:
             raise ValueError("role_tags must be non-empty")
-        invalid = set(v) - set(ROLE_TAGS)
-        if invalid:
+        if not _ROLE_TAG_SET.issuperset(v):
+            invalid = set(v) - _ROLE_TAG_SET
             raise ValueError(
                 f"Invalid role_tags: {sorted(invalid)}. Must be a subset of: {ROLE_TAGS}"
             )
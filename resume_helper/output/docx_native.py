@@ -0,0 +1,296 @@
+"""In-process Markdown-to-DOCX renderer — no pandoc required.
+
+Covers the Markdown our templates ask the LLM for: ATX headings, paragraphs, bullet
+lists, horizontal rules, **bold**, *italic*, `code`, [links](url) and <autolinks>.
+Every part of the reference .docx except the document body is copied through as-is,
+so its styles, bullet numbering, fonts, theme and page setup apply unchanged. Blocks
+use the style names pandoc uses (Heading1-6, FirstParagraph, BodyText), so a template
+styles both engines' output the same way; bullets use the template's ListBullet style.
+"""
+import os
+import re
+import sys
+import tempfile
+import zipfile
+from functools import lru_cache
+from pathlib import Path
+from typing import NamedTuple
+from xml.sax.saxutils import escape, quoteattr
+
+_DOCUMENT = "word/document.xml"
+_DOCUMENT_RELS = "word/_rels/document.xml.rels"
+_HYPERLINK_TYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink"
+
+_NAMESPACES = (
+    'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships" '
+    'xmlns:v="urn:schemas-microsoft-com:vml" '
+    'xmlns:o="urn:schemas-microsoft-com:office:office"'
+)
+
+# Letter, 1" margins: used only if the reference document has no section properties
+_DEFAULT_SECT_PR = (
+    '<w:sectPr><w:pgSz w:w="12240" w:h="15840"/>'
+    '<w:pgMar w:top="1440" w:right="1440" w:bottom="1440" w:left="1440" '
+    'w:header="720" w:footer="720" w:gutter="0"/></w:sectPr>'
+)
+
+# The same horizontal-rule shape pandoc emits for ---
+_HR = (
+    '<w:p><w:r><w:pict><v:rect style="width:0;height:1.5pt" o:hralign="center" '
+    'o:hrstd="t" o:hr="t"/></w:pict></w:r></w:p>'
+)
+
+_HEADING = re.compile(r"^ {0,3}(#{1,6})\s+(.*?)(?:\s+#+)?\s*$")
+_RULE = re.compile(r"^ {0,3}([-*_])(?:\s*\1){2,}\s*$")
+_BULLET = re.compile(r"^(\s*)[-*+]\s+(.*)$")
+
+# Inline markup, tried leftmost-first; triple emphasis must precede double and single
+_INLINE = re.compile(
+    r"\\(?P<escaped>[\\`*_{}\[\]()#+\-.!<>|])"
+    r"|`(?P<code>[^`]+)`"
+    r"|\[(?P<label>[^\]]+)\]\((?P<url>[^)\s]+)(?:\s+\"[^\"]*\")?\)"
+    r"|<(?P<autolink>https?://[^>\s]+|mailto:[^>\s]+)>"
+    r"|\*\*\*(?P<strong_em>.+?)\*\*\*"
+    r"|\*\*(?P<strong>.+?)\*\*|(?<!\w)__(?P<strong_u>.+?)__(?!\w)"
+    r"|\*(?P<em>[^*\s](?:.*?[^*\s])?)\*|(?<!\w)_(?P<em_u>[^_\s](?:.*?[^_\s])?)_(?!\w)"
+)
+
+# Bullet indentation per nesting level, in twips (the template's ListBullet indents 180)
+_LIST_INDENT = 180
+
+
+class _Run(NamedTuple):
+    text: str
+    bold: bool = False
+    italic: bool = False
+    code: bool = False
+    url: str | None = None
+    line_break: bool = False
+
+
+class _Reference(NamedTuple):
+    parts: dict          # zip member name -> bytes, everything but the body and its rels
+    sect_pr: str
+    relationships: list  # non-hyperlink <Relationship> elements of the body
+
+
+def render_markdown_to_docx(input_file, output_file, template_file=None) -> None:
+    """Render a Markdown file to DOCX in-process, styled by the template_file reference doc.
+
+    Same contract as md2docx.convert_markdown_to_docx(): raises RuntimeError if the
+    input file is missing or unreadable, the reference doc can't be found or read, or
+    the output can't be written, and prints progress to stderr. The output is written
+    atomically.
+    """
+    if not Path(input_file).is_file():
+        raise RuntimeError(f"Input file '{input_file}' not found")
+    if template_file and not Path(template_file).is_file():
+        print(f"Warning: Template file '{template_file}' not found. Using default styles...", file=sys.stderr)
+        template_file = None
+    if not template_file:
+        from resume_helper.config import resolve_template
+        try:
+            template_file = resolve_template(None)[1]
+        except FileNotFoundError as exc:
+            raise RuntimeError(f"No reference doc to render with: {exc}") from exc
+    print(f"Rendering '{input_file}' using template '{template_file}'...", file=sys.stderr)
+
+    reference = _load_reference(template_file)
+    try:
+        markdown = Path(input_file).read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError) as exc:
+        raise RuntimeError(f"Could not read input file '{input_file}': {exc}") from exc
+    body, links = markdown_to_body(markdown)
+    try:
+        _write_package(Path(output_file), reference, body, links)
+    except OSError as exc:
+        raise RuntimeError(f"Could not write '{output_file}': {exc}") from exc
+    print(f"Success! File saved to '{output_file}'.", file=sys.stderr)
+
+
+def markdown_to_body(markdown: str) -> tuple[str, list[str]]:
+    """Return (WordprocessingML paragraphs, hyperlink targets) for markdown.
+
+    The n-th hyperlink in the XML refers to relationship id f"rIdLink{n}" (1-based),
+    whose target is links[n - 1].
+    """
+    links: list[str] = []
+    paragraphs: list[str] = []
+    block: list[str] = []        # lines of the paragraph being gathered
+    block_kind = None            # None | "para" | ("bullet", level)
+    first_paragraph = True       # next paragraph directly follows a heading (pandoc's FirstParagraph)
+
+    def flush() -> None:
+        nonlocal block, block_kind, first_paragraph
+        if not block:
+            return
+        runs = _inline_runs(block)
+        if block_kind == "para":
+            style = "FirstParagraph" if first_paragraph else "BodyText"
+            paragraphs.append(_paragraph(style, runs, links))
+            first_paragraph = False
+        else:
+            paragraphs.append(_paragraph("ListBullet", runs, links, indent_level=block_kind[1]))
+        block, block_kind = [], None
+
+    for line in markdown.splitlines():
+        if not line.strip():
+            flush()
+            continue
+        if heading := _HEADING.match(line):
+            flush()
+            level = len(heading.group(1))
+            paragraphs.append(_paragraph(f"Heading{level}", _inline_runs([heading.group(2)]), links))
+            first_paragraph = True
+            continue
+        if _RULE.match(line):
+            flush()
+            paragraphs.append(_HR)
+            first_paragraph = False
+            continue
+        if bullet := _BULLET.match(line):
+            flush()
+            block, block_kind = [bullet.group(2)], ("bullet", len(bullet.group(1).expandtabs(4)) // 2)
+            first_paragraph = False
+            continue
+        if block_kind is None:
+            block_kind = "para"
+        block.append(line)
+    flush()
+    return "".join(paragraphs), links
+
+
+def _inline_runs(lines: list[str]) -> list[_Run]:
+    """Parse a paragraph's lines into runs; two trailing spaces or a backslash break the line."""
+    runs: list[_Run] = []
+    for i, line in enumerate(lines):
+        hard_break = line.endswith("  ") or line.endswith("\\")
+        text = line.rstrip(" \\" if line.endswith("\\") else " ").lstrip()
+        runs.extend(_parse_inline(text))
+        if i < len(lines) - 1:
+            runs.append(_Run("", line_break=True) if hard_break else _Run(" "))
+    return runs
+
+
+def _parse_inline(text: str, bold: bool = False, italic: bool = False, url: str | None = None) -> list[_Run]:
+    runs: list[_Run] = []
+    pos = 0
+    for m in _INLINE.finditer(text):
+        if m.start() > pos:
+            runs.append(_Run(text[pos:m.start()], bold, italic, url=url))
+        pos = m.end()
+        kind = m.lastgroup
+        if kind == "escaped":
+            runs.append(_Run(m.group("escaped"), bold, italic, url=url))
+        elif kind == "code":
+            runs.append(_Run(m.group("code"), bold, italic, code=True, url=url))
+        elif kind == "url":
+            runs.extend(_parse_inline(m.group("label"), bold, italic, m.group("url")))
+        elif kind == "autolink":
+            target = m.group("autolink")
+            runs.append(_Run(target.removeprefix("mailto:"), bold, italic, url=target))
+        elif kind == "strong_em":
+            runs.extend(_parse_inline(m.group(kind), True, True, url))
+        elif kind in ("strong", "strong_u"):
+            runs.extend(_parse_inline(m.group(kind), True, italic, url))
+        else:
+            runs.extend(_parse_inline(m.group(kind), bold, True, url))
+    if pos < len(text):
+        runs.append(_Run(text[pos:], bold, italic, url=url))
+    return runs
+
+
+def _paragraph(style: str, runs: list[_Run], links: list[str], indent_level: int = 0) -> str:
+    ppr = f'<w:pStyle w:val="{style}"/>'
+    if indent_level:
+        left = _LIST_INDENT * (indent_level + 1)
+        ppr += f'<w:ind w:left="{left}" w:hanging="{_LIST_INDENT}"/>'
+    out = [f"<w:p><w:pPr>{ppr}</w:pPr>"]
+    i = 0
+    while i < len(runs):
+        url = runs[i].url
+        if url is None:
+            out.append(_run_xml(runs[i]))
+            i += 1
+            continue
+        # Consecutive runs of one link share a single hyperlink element
+        links.append(url)
+        out.append(f'<w:hyperlink r:id="rIdLink{len(links)}">')
+        while i < len(runs) and runs[i].url == url:
+            out.append(_run_xml(runs[i]))
+            i += 1
+        out.append("</w:hyperlink>")
+    out.append("</w:p>")
+    return "".join(out)
+
+
+def _run_xml(run: _Run) -> str:
+    if run.line_break:
+        return "<w:r><w:br/></w:r>"
+    rpr = ""
+    if run.code:
+        rpr += '<w:rStyle w:val="VerbatimChar"/>'
+    elif run.url is not None:
+        rpr += '<w:rStyle w:val="Hyperlink"/>'
+    if run.bold:
+        rpr += "<w:b/><w:bCs/>"
+    if run.italic:
+        rpr += "<w:i/><w:iCs/>"
+    rpr = f"<w:rPr>{rpr}</w:rPr>" if rpr else ""
+    return f'<w:r>{rpr}<w:t xml:space="preserve">{escape(run.text)}</w:t></w:r>'
+
+
+def _load_reference(template_file) -> _Reference:
+    path = Path(template_file)
+    try:
+        return _read_reference(str(path.resolve()), path.stat().st_mtime_ns)
+    except (OSError, zipfile.BadZipFile, KeyError) as exc:
+        raise RuntimeError(f"Could not read reference doc '{template_file}': {exc}") from exc
+
+
+@lru_cache(maxsize=8)
+def _read_reference(path: str, _mtime_ns: int) -> _Reference:
+    """Parse a reference .docx once per (path, mtime); the result is shared, not mutated."""
+    with zipfile.ZipFile(path) as zf:
+        parts = {name: zf.read(name) for name in zf.namelist() if name not in (_DOCUMENT, _DOCUMENT_RELS)}
+        document = zf.read(_DOCUMENT).decode("utf-8")
+        rels = zf.read(_DOCUMENT_RELS).decode("utf-8") if _DOCUMENT_RELS in zf.namelist() else ""
+    sect_pr = re.search(r"<w:sectPr\b.*?</w:sectPr>|<w:sectPr\b[^>]*/>", document, re.DOTALL)
+    relationships = [
+        r for r in re.findall(r"<Relationship\b[^>]*/>", rels)
+        if f'Type="{_HYPERLINK_TYPE}"' not in r
+    ]
+    return _Reference(parts, sect_pr.group(0) if sect_pr else _DEFAULT_SECT_PR, relationships)
+
+
+def _write_package(output_file: Path, reference: _Reference, body: str, links: list[str]) -> None:
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        f"<w:document {_NAMESPACES}><w:body>{body}{reference.sect_pr}</w:body></w:document>"
+    )
+    hyperlinks = [
+        f'<Relationship Id="rIdLink{n}" Type="{_HYPERLINK_TYPE}" Target={quoteattr(url)} TargetMode="External"/>'
+        for n, url in enumerate(links, start=1)
+    ]
+    rels = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        + "".join(reference.relationships + hyperlinks)
+        + "</Relationships>"
+    )
+
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=output_file.parent, suffix=".docx.tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh, zipfile.ZipFile(fh, "w", zipfile.ZIP_DEFLATED) as zf:
+            # [Content_Types].xml first, as Word and most readers expect
+            names = sorted(reference.parts, key=lambda n: n != "[Content_Types].xml")
+            for name in names:
+                zf.writestr(name, reference.parts[name])
+            zf.writestr(_DOCUMENT, document)
+            zf.writestr(_DOCUMENT_RELS, rels)
+        os.replace(tmp, output_file)
+    except BaseException:
+        os.unlink(tmp)
+        raise
@@ -2,15 +2,71 @@ import subprocess
 import argparse
 import sys
 import shutil
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+from resume_helper.config import DOCX_ENGINE, DOCX_WORKERS
+
+DOCX_ENGINES = ["auto", "pandoc", "native"]
+
+# Background conversion pool, created on first use, and the conversions still in
+# flight keyed by output path
+_pool: ThreadPoolExecutor | None = None
+_pending: dict[Path, Future] = {}
+_lock = threading.Lock()
+
+# Convert on the calling thread instead of the pool (RESUME_HELPER_DOCX_WORKERS=0, profiling)
+_inline = DOCX_WORKERS <= 0
+
+
+@lru_cache(maxsize=None)
+def _pandoc_executable() -> str | None:
+    return shutil.which("pandoc")
+
 
 def check_pandoc_installed():
     """Check if pandoc is available in the system's PATH. Raises RuntimeError if not."""
-    if shutil.which("pandoc") is None:
+    if _pandoc_executable() is None:
         raise RuntimeError("Pandoc is not installed or not in your PATH")
 
 
+def resolve_engine(engine: str | None = None) -> str:
+    """Return the concrete renderer for engine (default DOCX_ENGINE): 'pandoc' or 'native'.
+
+    'auto' picks pandoc when it is installed and the native renderer otherwise.
+    Raises ValueError for unknown names.
+    """
+    engine = engine or DOCX_ENGINE
+    if engine not in DOCX_ENGINES:
+        raise ValueError(f"Unknown DOCX engine '{engine}'. Valid engines: {', '.join(DOCX_ENGINES)}")
+    if engine == "auto":
+        return "pandoc" if _pandoc_executable() else "native"
+    return engine
+
+
+def render_docx(input_file, output_file, template_file=None, engine: str | None = None) -> None:
+    """Convert a Markdown file to DOCX with the selected engine (see resolve_engine).
+
+    Raises RuntimeError if the conversion fails or pandoc is selected but missing. Any
+    other error a renderer raises is re-raised as RuntimeError, so callers can treat
+    every failed conversion as a soft DOCX failure.
+    """
+    engine = resolve_engine(engine)
+    try:
+        if engine == "native":
+            from resume_helper.output.docx_native import render_markdown_to_docx
+            render_markdown_to_docx(input_file, output_file, template_file)
+        else:
+            check_pandoc_installed()
+            convert_markdown_to_docx(input_file, output_file, template_file)
+    except RuntimeError:
+        raise
+    except Exception as exc:
+        raise RuntimeError(f"DOCX conversion of '{input_file}' failed: {exc}") from exc
+
+
 def convert_markdown_to_docx(input_file, output_file, template_file=None):
     """Execute the pandoc command to convert a Markdown file to DOCX.
 
@@ -20,7 +76,7 @@ def convert_markdown_to_docx(input_file, output_file, template_file=None):
     if not Path(input_file).is_file():
         raise RuntimeError(f"Input file '{input_file}' not found")
 
-    command = ["pandoc", input_file, "-o", output_file]
+    command = [_pandoc_executable() or "pandoc", str(input_file), "-o", str(output_file)]
 
     if template_file:
         if Path(template_file).is_file():
@@ -38,17 +94,131 @@ def convert_markdown_to_docx(input_file, output_file, template_file=None):
         raise RuntimeError(f"Pandoc conversion failed: {e.stderr}") from e
 
 
+def submit_conversion(input_file, output_file, template_file=None, engine: str | None = None) -> Future:
+    """Queue a render_docx() call on the shared background pool and return its Future.
+
+    At most DOCX_WORKERS conversions run at once (0 = convert before returning). The
+    Future resolves to the output Path, or raises RuntimeError for any failed conversion.
+    """
+    global _pool
+    output_file = Path(output_file)
+    engine = resolve_engine(engine)
+
+    def _convert() -> Path:
+        # Clear an earlier build's DOCX first, so wait_for_docx() can't pass it off as
+        # the output of a conversion that failed
+        try:
+            output_file.unlink(missing_ok=True)
+        except OSError as exc:
+            raise RuntimeError(f"Could not replace '{output_file}': {exc}") from exc
+        render_docx(input_file, output_file, template_file, engine)
+        return output_file
+
+    if _inline:
+        future = Future()
+        try:
+            future.set_result(_convert())
+        except RuntimeError as exc:
+            future.set_exception(exc)
+        return future
+
+    with _lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=max(1, DOCX_WORKERS), thread_name_prefix="docx")
+        future = _pool.submit(_convert)
+        _pending[output_file] = future
+    future.add_done_callback(lambda f: _forget(output_file, f))
+    return future
+
+
+def run_conversions_inline(enabled: bool = True) -> bool:
+    """Make submit_conversion() convert on the calling thread, so a profiler sees the work.
+
+    Returns the previous setting, so callers can restore it.
+    """
+    global _inline
+    previous, _inline = _inline, enabled
+    return previous
+
+
+def wait_for_docx(output_file, timeout: float | None = None) -> Path | None:
+    """Block until a queued conversion to output_file finishes; return the path if it exists.
+
+    Returns None if the conversion failed or the file was never written.
+    Raises TimeoutError if timeout (seconds) passes first.
+    """
+    output_file = Path(output_file)
+    with _lock:
+        future = _pending.get(output_file)
+    if future is not None:
+        try:
+            future.result(timeout=timeout)
+        except RuntimeError:
+            return None
+    return output_file if output_file.exists() else None
+
+
+def convert_directory(
+    input_dir,
+    output_dir,
+    template_file=None,
+    max_workers: int = DOCX_WORKERS,
+    engine: str | None = None,
+) -> list[tuple[Path, Path | None, str | None]]:
+    """Convert every .md file in input_dir to a same-named .docx in output_dir, in parallel.
+
+    Returns (md_path, docx_path, error) per file in name order; docx_path is None
+    and error is set for a file that failed. Raises RuntimeError if pandoc is selected
+    but missing.
+    """
+    engine = resolve_engine(engine)
+    if engine == "pandoc":
+        check_pandoc_installed()
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    md_files = sorted(Path(input_dir).glob("*.md"))
+
+    def _convert(md_path: Path) -> tuple[Path, Path | None, str | None]:
+        docx_path = output_dir / md_path.with_suffix(".docx").name
+        try:
+            render_docx(md_path, docx_path, template_file, engine)
+        except RuntimeError as exc:
+            return md_path, None, str(exc)
+        return md_path, docx_path, None
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        return list(pool.map(_convert, md_files))
+
+
+def _forget(output_file: Path, future: Future) -> None:
+    with _lock:
+        if _pending.get(output_file) is future:
+            del _pending[output_file]
+
+
 if __name__ == "__main__":
-    parser = argparse.ArgumentParser(description="Convert Markdown to DOCX using Pandoc.")
-    parser.add_argument("input", help="The source Markdown file.")
-    parser.add_argument("output", help="The destination DOCX file.")
+    parser = argparse.ArgumentParser(description="Convert Markdown to DOCX using Pandoc or the native renderer.")
+    parser.add_argument("input", help="The source Markdown file, or a directory of them.")
+    parser.add_argument("output", help="The destination DOCX file, or a directory for bulk conversion.")
     parser.add_argument("-t", "--template", help="Optional Word (.docx) template file for styling.", default=None)
+    parser.add_argument("-j", "--workers", type=int, default=DOCX_WORKERS,
+                        help=f"Parallel conversions in directory mode (default: {DOCX_WORKERS}).")
+    parser.add_argument("-e", "--engine", choices=DOCX_ENGINES, default=DOCX_ENGINE,
+                        help=f"DOCX renderer; auto uses pandoc if installed (default: {DOCX_ENGINE}).")
 
     args = parser.parse_args()
 
     try:
-        check_pandoc_installed()
-        convert_markdown_to_docx(args.input, args.output, args.template)
+        if Path(args.input).is_dir():
+            results = convert_directory(args.input, args.output, args.template, args.workers, args.engine)
+            failed = [(md, err) for md, _docx, err in results if err]
+            for md, err in failed:
+                print(f"Error: {md}: {err}", file=sys.stderr)
+            print(f"Converted {len(results) - len(failed)}/{len(results)} file(s).", file=sys.stderr)
+            if failed:
+                sys.exit(1)
+        else:
+            render_docx(args.input, args.output, args.template, args.engine)
     except RuntimeError as exc:
         print(f"Error: {exc}", file=sys.stderr)
         sys.exit(1)
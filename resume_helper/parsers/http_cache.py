@@ -0,0 +1,142 @@
+"""On-disk HTTP cache for scraped job pages.
+
+Each URL maps to <sha256>.json (validators + fetch time) and <sha256>.body (raw bytes).
+Within ttl seconds a cached page is served without touching the network; after that the
+stored ETag / Last-Modified turn the next fetch into a conditional request. Like the LLM
+cache, eviction is least-recently-used: a hit refreshes the entry's mtime, and the oldest
+entries go first once the cache exceeds max_bytes. The directory is scanned on the first
+write and then only when a running total of the bytes written goes over max_bytes.
+"""
+import codecs
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+from resume_helper.config import HTTP_CACHE_MAX_MB
+
+
+def resolve_encoding(encoding: str | None) -> str:
+    """Return encoding if Python can decode text with it, else utf-8.
+
+    Servers sometimes send an unknown or misspelled charset; decoding with it would
+    raise LookupError for the whole page.
+    """
+    try:
+        if encoding and codecs.lookup(encoding)._is_text_encoding:
+            return encoding
+    except LookupError:
+        pass
+    return "utf-8"
+
+
+class CachedPage(NamedTuple):
+    body: bytes
+    encoding: str | None
+    etag: str | None
+    last_modified: str | None
+    fetched_at: float
+
+    @property
+    def text(self) -> str:
+        return self.body.decode(resolve_encoding(self.encoding), errors="replace")
+
+    def validators(self) -> dict:
+        """Request headers that make a re-fetch conditional on this copy."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HttpCache:
+    def __init__(self, cache_dir: Path, ttl: float, max_bytes: int = HTTP_CACHE_MAX_MB * 1024 * 1024) -> None:
+        self._dir = Path(cache_dir)
+        self.ttl = ttl
+        self._max_bytes = max_bytes
+        # Cache size as of the last prune plus what was written since; None until scanned
+        self._size: int | None = None
+        self._size_lock = threading.Lock()
+
+    def get(self, url: str) -> CachedPage | None:
+        meta_path, body_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            body = body_path.read_bytes()
+            os.utime(meta_path)  # mark as recently used
+        except (OSError, ValueError):
+            return None
+        return CachedPage(body, meta.get("encoding"), meta.get("etag"), meta.get("last_modified"), meta["fetched_at"])
+
+    def is_fresh(self, page: CachedPage) -> bool:
+        return time.time() - page.fetched_at < self.ttl
+
+    def put(self, url: str, body: bytes, encoding: str | None, etag: str | None, last_modified: str | None) -> None:
+        meta_path, body_path = self._paths(url)
+        self._dir.mkdir(parents=True, exist_ok=True)
+        # Body first, then metadata: a reader never sees metadata without its body
+        meta = _meta(url, encoding, etag, last_modified)
+        _atomic_write(body_path, body)
+        _atomic_write(meta_path, meta)
+        self._account(len(body) + len(meta))
+
+    def touch(self, url: str, page: CachedPage, etag: str | None = None, last_modified: str | None = None) -> None:
+        """Record a 304 revalidation: keep the stored body, refresh the fetch time.
+
+        etag / last_modified replace the stored validators when the 304 sent new ones.
+        """
+        meta_path, _ = self._paths(url)
+        _atomic_write(meta_path, _meta(url, page.encoding, etag or page.etag, last_modified or page.last_modified))
+
+    def _account(self, written: int) -> None:
+        """Add a write to the running size; prune once it goes over max_bytes."""
+        with self._size_lock:
+            if self._size is not None and self._size + written <= self._max_bytes:
+                self._size += written
+                return
+        self.prune()
+
+    def prune(self) -> None:
+        """Drop least-recently-used pages until the cache is under max_bytes."""
+        entries = []
+        for meta_path in self._dir.glob("*.json"):
+            body_path = meta_path.with_suffix(".body")
+            try:
+                st = meta_path.stat()
+                size = st.st_size + body_path.stat().st_size
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, size, meta_path, body_path))
+
+        total = sum(size for _, size, _, _ in entries)
+        for _, size, meta_path, body_path in sorted(entries):
+            if total <= self._max_bytes:
+                break
+            # Metadata first, so a reader never sees metadata without its body
+            meta_path.unlink(missing_ok=True)
+            body_path.unlink(missing_ok=True)
+            total -= size
+        with self._size_lock:
+            self._size = total
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self._dir / f"{key}.json", self._dir / f"{key}.body"
+
+
+def _meta(url: str, encoding: str | None, etag: str | None, last_modified: str | None) -> bytes:
+    meta = {"url": url, "encoding": encoding, "etag": etag, "last_modified": last_modified, "fetched_at": time.time()}
+    return json.dumps(meta).encode("utf-8")
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
@@ -1,12 +1,37 @@
 """Parse job posting from URL or raw text."""
+import codecs
+import random
+import sys
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from urllib.parse import urlsplit
 
 import requests
 from bs4 import BeautifulSoup
+from lxml import etree
+from requests.adapters import HTTPAdapter
+
+from resume_helper.config import (
+    FETCH_BACKOFF, FETCH_PER_HOST, FETCH_RETRIES, FETCH_WORKERS,
+    HTTP_CACHE_DIR, HTTP_CACHE_ENABLED, HTTP_CACHE_TTL, HTTP_MAX_BYTES, HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+)
+from resume_helper.parsers.http_cache import HttpCache, resolve_encoding
 
 # Tags whose content is never useful (scripts, styles, nav, etc.)
 _STRIP_TAGS = {"script", "style", "noscript", "header", "footer", "nav", "aside"}
 
+# Tags whose strings BeautifulSoup types apart from body text (template content, ruby
+# annotations, script / style)
+_STRING_CONTAINERS = {"template", "rt", "rp", "script", "style"}
+
+# id / class hints for the main posting container when there is no <main>
+_CONTENT_HINT = re.compile(r"job|content|description", re.I)
+
 _HEADERS = {
     "User-Agent": (
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
@@ -15,6 +40,15 @@ _HEADERS = {
     )
 }
 
+# Read size when streaming a page body into the parser
+_CHUNK_BYTES = 64 * 1024
+
+# Statuses worth retrying: rate limiting and transient server/gateway errors
+_RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
 
 def parse_job_input(job_input: str) -> str:
     """Return plain text for a job posting.
@@ -27,24 +61,307 @@ def parse_job_input(job_input: str) -> str:
     return job_input.strip()
 
 
+def parse_job_inputs(
+    job_inputs: list[str],
+    max_workers: int = FETCH_WORKERS,
+    per_host: int = FETCH_PER_HOST,
+    return_exceptions: bool = False,
+) -> list:
+    """Return plain text for many job postings, in input order.
+
+    URLs are fetched concurrently — at most max_workers at once overall and per_host
+    at once against any single host — with transient errors retried with backoff.
+    Raw-text inputs pass through unchanged. With return_exceptions=True a failed
+    fetch yields its exception in that slot instead of raising.
+    """
+    results: list = [None] * len(job_inputs)
+    by_host: dict[str, list[int]] = {}
+    for i, job_input in enumerate(job_inputs):
+        if _is_url(job_input):
+            by_host.setdefault(urlsplit(job_input.strip()).netloc.lower(), []).append(i)
+        else:
+            results[i] = job_input.strip()
+
+    # Interleave hosts so one busy host doesn't occupy every worker waiting on its limit
+    queues = list(by_host.values())
+    order = [q[n] for n in range(max(map(len, queues), default=0)) for q in queues if n < len(q)]
+
+    limiter = _HostLimiter(per_host)
+    cache = _default_http_cache()
+
+    def _fetch(i: int):
+        try:
+            return _scrape_url(job_inputs[i].strip(), cache, limiter)
+        except Exception as exc:
+            if not return_exceptions:
+                raise
+            return exc
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        futures = {i: pool.submit(_fetch, i) for i in order}
+        for i, future in futures.items():
+            results[i] = future.result()
+    return results
+
+
 def _is_url(text: str) -> bool:
     return bool(re.match(r"^https?://", text.strip(), re.IGNORECASE))
 
 
-def _scrape_url(url: str) -> str:
-    response = requests.get(url, headers=_HEADERS, timeout=15)
-    response.raise_for_status()
+def _get_session() -> requests.Session:
+    """Return the process-wide keep-alive session, creating it on first use."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            session.headers.update(_HEADERS)
+            adapter = HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
+
+
+@lru_cache(maxsize=None)
+def _default_http_cache() -> HttpCache | None:
+    # One shared instance, so its running size total spans every fetch in the process
+    return HttpCache(HTTP_CACHE_DIR, HTTP_CACHE_TTL) if HTTP_CACHE_ENABLED else None
+
 
-    soup = BeautifulSoup(response.text, "lxml")
+class _HostLimiter:
+    """Caps concurrent requests per host with one semaphore per netloc."""
+
+    def __init__(self, per_host: int) -> None:
+        self._per_host = max(1, per_host)
+        self._semaphores: dict[str, threading.Semaphore] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def slot(self, url: str):
+        host = urlsplit(url).netloc.lower()
+        with self._lock:
+            sem = self._semaphores.setdefault(host, threading.Semaphore(self._per_host))
+        with sem:
+            yield
+
+
+def _fetch_with_retry(url: str, cache: HttpCache | None, limiter: _HostLimiter | None = None) -> str:
+    """_fetch_text with retries on connection errors, timeouts and 429/5xx responses.
+
+    Backs off exponentially with jitter, honouring a numeric Retry-After header.
+    The per-host slot is released while sleeping.
+    """
+    for attempt in range(FETCH_RETRIES + 1):
+        try:
+            if limiter is None:
+                return _fetch_text(url, cache)
+            with limiter.slot(url):
+                return _fetch_text(url, cache)
+        except (
+            requests.ConnectionError, requests.Timeout, requests.HTTPError, requests.exceptions.ChunkedEncodingError,
+        ) as exc:
+            response = getattr(exc, "response", None)
+            status = response.status_code if response is not None else None
+            if attempt == FETCH_RETRIES or (status is not None and status not in _RETRY_STATUSES):
+                raise
+            delay = FETCH_BACKOFF * 2 ** attempt * (1 + random.random() / 2)
+            retry_after = response.headers.get("Retry-After", "") if response is not None else ""
+            if retry_after.isdigit():
+                delay = max(delay, float(retry_after))
+            time.sleep(delay)
+
+
+def _fetch_text(url: str, cache: HttpCache | None = None) -> str:
+    """GET url over the pooled session and return the posting text.
+
+    Fresh cache hits skip the network; stale ones send If-None-Match / If-Modified-Since
+    and reuse the cached body on 304 Not Modified. Anything else is streamed into the
+    parser by _stream_text, and whatever was read is cached.
+    """
+    cached = cache.get(url) if cache else None
+    if cached and cache.is_fresh(cached):
+        return _html_to_text(cached.text)
+
+    headers = cached.validators() if cached else None
+    with _get_session().get(url, headers=headers, timeout=15, stream=True) as response:
+        if cached and response.status_code == 304:
+            cache.touch(url, cached, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+            return _html_to_text(cached.text)
+        response.raise_for_status()
+
+        encoding = resolve_encoding(response.encoding)
+        text, body = _stream_text(response, encoding, url)
+
+    if cache and "no-store" not in response.headers.get("Cache-Control", ""):
+        cache.put(url, body, encoding, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+    return text
+
+
+def _stream_text(response: requests.Response, encoding: str, url: str) -> tuple[str, bytes]:
+    """Feed a streamed response to an incremental parser; return (posting text, bytes read).
+
+    Reading stops after HTTP_MAX_BYTES, or as soon as the first <main> outside stripped
+    chrome closes with text in it — nothing later in the page can change the result.
+    """
+    parser = etree.HTMLPullParser(events=("start", "end"))
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    chunks: list[bytes] = []
+    size = 0
+    stripped_depth = 0
+    main = None
+    for chunk in response.iter_content(_CHUNK_BYTES):
+        chunk = chunk[:HTTP_MAX_BYTES - size]
+        chunks.append(chunk)
+        size += len(chunk)
+        parser.feed(decoder.decode(chunk))
+
+        main_done = False
+        for event, el in parser.read_events():
+            if el.tag in _STRIP_TAGS:
+                stripped_depth += 1 if event == "start" else -1
+            elif el.tag == "main" and not stripped_depth:
+                if event == "start" and main is None:
+                    main = el
+                elif event == "end" and el is main:
+                    main_done = bool(_collapse_whitespace("\n".join(_iter_strings(el))))
+        if main_done:
+            break
+        if size >= HTTP_MAX_BYTES:
+            print(
+                f"[resume-helper] WARNING: {url} is larger than {HTTP_MAX_BYTES} bytes; "
+                "using the first part only.",
+                file=sys.stderr,
+            )
+            break
+    else:
+        parser.feed(decoder.decode(b"", final=True))
+
+    body = b"".join(chunks)
+    try:
+        root = parser.close()
+    except etree.XMLSyntaxError:
+        # Empty document
+        return "", body
+    return (_tree_to_text(root) if root is not None else ""), body
+
+
+def _scrape_url(url: str, cache: HttpCache | None = None, limiter: _HostLimiter | None = None) -> str:
+    return _fetch_with_retry(url, cache if cache is not None else _default_http_cache(), limiter)
+
+
+def _html_to_text(html: str) -> str:
+    """Extract the posting text from a job page.
+
+    Works on a bare lxml tree instead of BeautifulSoup: stripped tags are skipped while
+    walking rather than removed, and the content container is chosen in a single pass.
+    Output matches _html_to_text_bs4, which is kept as the reference implementation.
+    """
+    try:
+        root = etree.HTML(html)
+    except ValueError:
+        # lxml refuses str input carrying an XML encoding declaration
+        root = etree.HTML(html.encode("utf-8"), etree.HTMLParser(encoding="utf-8"))
+    if root is None:
+        return ""
+    return _tree_to_text(root)
+
+
+def _tree_to_text(root) -> str:
+    # Prefer a focused content container if one exists
+    body = _find_content(root)
+    if body is None:
+        return _meta_description(root)
+
+    text = _collapse_whitespace("\n".join(_iter_strings(body)))
+
+    # JS-rendered SPAs (e.g. Ashby) produce an empty body — fall back to meta
+    if not text:
+        return _meta_description(root)
+
+    return text
+
+
+def _iter_elements(root):
+    """Yield elements in document order, skipping _STRIP_TAGS subtrees."""
+    walker = etree.iterwalk(root, events=("start",))
+    for _event, el in walker:
+        if el.tag in _STRIP_TAGS:
+            walker.skip_subtree()
+        else:
+            yield el
+
+
+def _find_content(root):
+    """First <main>, else first job/content id, else first such class, else <body>."""
+    by_id = by_class = body = None
+    for el in _iter_elements(root):
+        if el.tag == "main":
+            return el
+        if by_id is None and _CONTENT_HINT.search(el.get("id") or ""):
+            by_id = el
+        if by_class is None and _CONTENT_HINT.search(el.get("class") or ""):
+            by_class = el
+        if body is None and el.tag == "body":
+            body = el
+    # lxml elements are falsy when childless, so no `or` chaining here
+    for candidate in (by_id, by_class, body):
+        if candidate is not None:
+            return candidate
+    return None
+
+
+def _iter_strings(root):
+    """Yield root's text nodes in document order, as BeautifulSoup's get_text() sees them.
+
+    Comments are left out but their tails kept, and _STRIP_TAGS contribute only their
+    tails. As in bs4, a string belongs to its innermost _STRING_CONTAINERS ancestor and
+    is yielded only if that matches root's own kind — so body text skips <template> and
+    ruby annotations, while the text of a selected <rt> is exactly its annotation.
+    """
+    target = root.tag if root.tag in _STRING_CONTAINERS else None
+    kind = target or next((a.tag for a in root.iterancestors(*_STRING_CONTAINERS)), None)
+    if kind == target and root.text:
+        yield root.text
+    stack = [(root, iter(root), kind)]
+    while stack:
+        node, children, kind = stack[-1]
+        for child in children:
+            tag = child.tag
+            if isinstance(tag, str) and tag not in _STRIP_TAGS:
+                child_kind = tag if tag in _STRING_CONTAINERS else kind
+                # Nothing under a container is body text, so skip the subtree outright
+                if child_kind is None or target is not None:
+                    if child_kind == target and child.text:
+                        yield child.text
+                    stack.append((child, iter(child), child_kind))
+                    break
+            if kind == target and child.tail:
+                yield child.tail
+        else:
+            stack.pop()
+            if stack and stack[-1][2] == target and node.tail:
+                yield node.tail
+
+
+def _meta_description(root) -> str:
+    """Content of the first <meta name="description">, for JS-rendered pages."""
+    for el in _iter_elements(root):
+        if el.tag == "meta" and el.get("name") == "description":
+            return (el.get("content") or "").strip()
+    return ""
+
+
+def _html_to_text_bs4(html: str) -> str:
+    """Reference BeautifulSoup implementation of _html_to_text."""
+    soup = BeautifulSoup(html, "lxml")
 
     for tag in soup(list(_STRIP_TAGS)):
         tag.decompose()
 
-    # Prefer a focused content container if one exists
     body = (
         soup.find("main")
-        or soup.find(id=re.compile(r"job|content|description", re.I))
-        or soup.find(class_=re.compile(r"job|content|description", re.I))
+        or soup.find(id=_CONTENT_HINT)
+        or soup.find(class_=_CONTENT_HINT)
         or soup.body
     )
 
@@ -53,7 +370,6 @@ def _scrape_url(url: str) -> str:
 
     text = _collapse_whitespace(body.get_text(separator="\n"))
 
-    # JS-rendered SPAs (e.g. Ashby) produce an empty body — fall back to meta
     if not text:
         return _meta_description_fallback(soup)
 
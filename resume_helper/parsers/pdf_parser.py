@@ -1,24 +1,95 @@
 """Extract text from PDF resume files."""
+import hashlib
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-import pdfplumber
+from resume_helper.config import PDF_ENGINE, PDF_WORKERS
+from resume_helper.parsers.pdf_engines import get_engine
 
+# Extraction parameters — part of the text cache key
+X_TOLERANCE = 2
+Y_TOLERANCE = 2
 
-def parse_pdf(path: str) -> str:
+# Bump when extraction output changes so stale cache entries are ignored
+_CACHE_VERSION = 2
+
+# Below this many pages, process start-up costs more than the parallelism saves
+_PARALLEL_MIN_PAGES = 8
+
+
+def parse_pdf(
+    path: str,
+    cache_dir: Path | None = None,
+    workers: int | None = None,
+    engine: str | None = None,
+) -> str:
     """Extract plain text from a PDF resume.
 
     Joins pages with a blank line separator so section breaks are preserved.
-    Raises FileNotFoundError if the path does not exist.
+    If cache_dir is given, extracted text is cached there keyed by the PDF's
+    content hash and extraction parameters, so an unchanged file is never re-parsed.
+    workers > 1 fans pages of long documents out across a process pool
+    (default: RESUME_HELPER_PDF_WORKERS); output is identical either way.
+    engine names a backend from pdf_engines.PDF_ENGINES (default: RESUME_HELPER_PDF_ENGINE).
+    Raises FileNotFoundError if the path does not exist, ValueError for an unknown engine.
     """
     resolved = Path(path)
     if not resolved.exists():
         raise FileNotFoundError(f"Resume PDF not found: {resolved}")
 
-    pages = []
-    with pdfplumber.open(resolved) as pdf:
-        for page in pdf.pages:
-            text = page.extract_text(x_tolerance=2, y_tolerance=2)
-            if text:
-                pages.append(text.strip())
+    workers = PDF_WORKERS if workers is None else workers
+    engine = engine or PDF_ENGINE
+    get_engine(engine)  # fail fast on an unknown name, before any caching
+
+    if cache_dir is None:
+        return _extract_text(resolved, workers, engine)
+
+    cached = Path(cache_dir) / "pdf_text" / f"{_cache_key(resolved, engine)}.txt"
+    try:
+        return cached.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        pass
+
+    text = _extract_text(resolved, workers, engine)
+    cached.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=cached.parent, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp, cached)
+    return text
+
+
+def _extract_text(resolved: Path, workers: int = 1, engine: str = "pdfplumber") -> str:
+    n_pages = get_engine(engine).count_pages(str(resolved)) if workers > 1 else 0
+    if n_pages < _PARALLEL_MIN_PAGES:
+        pages = _extract_page_range(engine, str(resolved), 0, None)
+    else:
+        # Contiguous page ranges, one per worker; map() returns them in order
+        step = -(-n_pages // workers)
+        starts = range(0, n_pages, step)
+        with ProcessPoolExecutor(max_workers=len(starts)) as pool:
+            chunks = pool.map(
+                _extract_page_range,
+                [engine] * len(starts),
+                [str(resolved)] * len(starts),
+                starts,
+                [min(start + step, n_pages) for start in starts],
+            )
+            pages = [text for chunk in chunks for text in chunk]
+
+    return "\n\n".join(text for text in pages if text is not None)
+
+
+def _extract_page_range(engine: str, path: str, start: int, stop: int | None) -> list[str | None]:
+    """Return the stripped text of pages [start, stop). Top-level so process pools can pickle it."""
+    return get_engine(engine).extract_pages(path, start, stop, X_TOLERANCE, Y_TOLERANCE)
+
 
-    return "\n\n".join(pages)
+def _cache_key(resolved: Path, engine: str = "pdfplumber") -> str:
+    """Hash of the file contents plus everything that affects the extracted text."""
+    with resolved.open("rb") as f:
+        digest = hashlib.file_digest(f, "sha256")
+    digest.update(f"|v{_CACHE_VERSION}|{engine}|x{X_TOLERANCE}|y{Y_TOLERANCE}".encode())
+    return digest.hexdigest()
@@ -0,0 +1,98 @@
+"""--profile cpu|mem for build and import runs.
+
+cpu wraps the run in cProfile and writes a .prof dump (load it with pstats, snakeviz,
+etc.) plus the top functions by cumulative time as text. mem traces the run with
+tracemalloc and writes each stage's time, peak traced memory and largest allocation
+sites; stages are the timing.span() blocks the run already has. DOCX conversion is
+moved onto the calling thread for the run so both profilers see it.
+
+Profile the local pipeline without network or API costs by adding `--provider stub`.
+"""
+import contextlib
+import cProfile
+import io
+import pstats
+import sys
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+from resume_helper import timing
+from resume_helper.output import md2docx
+
+PROFILE_MODES = ["cpu", "mem"]
+
+# Functions listed in the cpu text report
+_TOP_FUNCTIONS = 40
+
+# Stack frames kept per traced allocation
+_TRACE_FRAMES = 10
+
+
+@contextlib.contextmanager
+def profile(mode: str | None, out_dir: Path, label: str, log_prefix: str = "resume-helper"):
+    """Profile the block in mode ('cpu' or 'mem'), writing reports to out_dir; None = off."""
+    if not mode:
+        yield
+        return
+    if mode not in PROFILE_MODES:
+        raise ValueError(f"Unknown profile mode '{mode}'. Valid modes: {', '.join(PROFILE_MODES)}")
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    stem = out_dir / f"{label}_{datetime.now():%Y%m%d_%H%M%S}_{mode}"
+    was_inline = md2docx.run_conversions_inline(True)
+    try:
+        if mode == "cpu":
+            yield from _profile_cpu(stem)
+        else:
+            yield from _profile_mem(stem, label)
+    finally:
+        md2docx.run_conversions_inline(was_inline)
+        for path in sorted(out_dir.glob(f"{stem.name}.*")):
+            print(f"[{log_prefix}] Profile written to: {path}", file=sys.stderr)
+
+
+def _profile_cpu(stem: Path):
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profiler.dump_stats(stem.with_suffix(".prof"))
+        report = io.StringIO()
+        pstats.Stats(profiler, stream=report).sort_stats("cumulative").print_stats(_TOP_FUNCTIONS)
+        stem.with_suffix(".txt").write_text(report.getvalue(), encoding="utf-8")
+
+
+def _profile_mem(stem: Path, label: str):
+    tracemalloc.start(_TRACE_FRAMES)
+    timings = timing.Timings(label, trace_memory=True)
+    try:
+        with timing.recording(timings):
+            yield
+    finally:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        stem.with_suffix(".txt").write_text(format_memory_report(timings, peak), encoding="utf-8")
+
+
+def format_memory_report(timings: "timing.Timings", overall_peak: int) -> str:
+    """Render a trace_memory Timings as text: per-stage time and peaks, then top allocations."""
+    mib = 2 ** 20
+    lines = [
+        f"{timings.label}: {timings.total:.3f} s, peak traced memory {overall_peak / mib:.1f} MiB",
+        "",
+        f"{'stage':<32} {'seconds':>8} {'peak MiB':>9} {'+peak MiB':>10}",
+    ]
+    for key, seconds in timings.stages.items():
+        mem = timings.memory.get(key)
+        name = "  " * key.count("/") + key.rsplit("/", 1)[-1]
+        if mem is None:
+            lines.append(f"{name:<32} {seconds:>8.3f}")
+        else:
+            lines.append(f"{name:<32} {seconds:>8.3f} {mem.peak / mib:>9.1f} {(mem.peak - mem.start) / mib:>10.1f}")
+    for key, mem in timings.memory.items():
+        lines += ["", f"Largest allocations kept by {key}:"]
+        lines += [f"  {stat}" for stat in mem.top] or ["  (none)"]
+    return "\n".join(lines) + "\n"
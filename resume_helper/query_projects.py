@@ -0,0 +1,47 @@
+"""CLI to search the projects database by title, skill and keyword, without an LLM."""
+import argparse
+import json
+import sys
+import time
+
+from resume_helper.config import resolve_user_paths
+from resume_helper.data.projects_db import load_project_index, is_sqlite_store, search_projects
+from resume_helper.models import ROLE_TAGS
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="resume-helper-query",
+        description="Rank projects whose title, skills and keywords match every query term.",
+    )
+    parser.add_argument("terms", nargs="+", help="Search terms, e.g. spark airflow")
+    parser.add_argument("--any", action="store_true", help="Match projects with any of the terms, not all")
+    parser.add_argument("--role", choices=ROLE_TAGS, metavar="ROLE", nargs="+",
+                        help=f"Only search projects tagged with any of these roles. Valid values: {', '.join(ROLE_TAGS)}")
+    parser.add_argument("--all-roles", action="store_true",
+                        help="With several --role tags, only search projects tagged with all of them")
+    parser.add_argument("--limit", type=int, default=10, help="Show at most this many matches (default: 10; 0 = all)")
+    parser.add_argument("--json", action="store_true", help="Print the matching projects as JSON")
+    parser.add_argument("--projects", help="Path to projects.json (default: user profile projects)")
+    parser.add_argument("--user", help="Your user profile name (or set RESUME_HELPER_USER env var)")
+    args = parser.parse_args()
+
+    projects_path = args.projects or str(resolve_user_paths(args.user).projects)
+    query = " ".join(args.terms)
+    try:
+        if not is_sqlite_store(projects_path):
+            load_project_index(projects_path).term_index()  # so the timing below is the search alone
+        start = time.perf_counter()
+        matches = search_projects(projects_path, query, args.role, args.all_roles, args.any, args.limit or None)
+        elapsed = time.perf_counter() - start
+    except (FileNotFoundError, ValueError) as exc:
+        print(f"[query] ERROR: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"[query] {len(matches)} match(es) for '{query}' in {elapsed * 1000:.2f} ms", file=sys.stderr)
+    if args.json:
+        print(json.dumps([{"score": round(score, 4), **p} for score, p in matches], indent=2, ensure_ascii=False))
+        return
+    for rank, (score, p) in enumerate(matches, start=1):
+        print(f"{rank:>3}. {score:7.3f}  {p['id']}  {p['title']}")
+        print(f"     skills: {', '.join(p.get('skills') or []) or '-'}")
@@ -0,0 +1,214 @@
+"""Per-stage build timings: spans, a stderr breakdown and an optional JSONL log.
+
+Stages are wrapped in `with span("name"):`. Spans record into the Timings of the
+enclosing collect() block, found through a ContextVar so concurrent batch builds on
+separate threads each keep their own. With timings off, collect() records nothing and
+span() returns a shared no-op context manager. A Timings created with trace_memory
+also records each stage's tracemalloc peak and top allocations (see profiling.py).
+
+Summarise a JSONL log with: python -m resume_helper.timing timings.jsonl
+"""
+import contextlib
+import json
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+from contextvars import ContextVar
+from pathlib import Path
+from typing import NamedTuple
+
+from resume_helper.config import TIMINGS_LOG
+
+_current: ContextVar["Timings | None"] = ContextVar("resume_helper_timings", default=None)
+_NULL_SPAN = contextlib.nullcontext()
+
+_settings = {"print": False, "sink": Path(TIMINGS_LOG) if TIMINGS_LOG else None}
+_sink_lock = threading.Lock()
+
+
+# Allocation sites kept per stage when tracing memory
+_TOP_ALLOCATIONS = 10
+
+
+class StageMemory(NamedTuple):
+    start: int         # traced bytes when the stage began
+    peak: int          # highest traced bytes while it ran
+    top: list          # tracemalloc.StatisticDiff, largest growth first
+
+
+class Timings:
+    """Wall-clock seconds per stage for one build; nested stages are named 'outer/inner'.
+
+    With trace_memory (tracemalloc must already be tracing), memory[stage] also holds
+    a StageMemory for every stage.
+    """
+
+    def __init__(self, label: str, trace_memory: bool = False) -> None:
+        self.label = label
+        self.stages: dict[str, float] = {}
+        self.memory: dict[str, StageMemory] = {}
+        self.total = 0.0
+        self.ok = True
+        self.trace_memory = trace_memory
+        self._path: list[str] = []
+        self._peaks: list[int] = []  # running peak of each open stage, innermost last
+
+    @contextlib.contextmanager
+    def span(self, name: str):
+        self._path.append(name)
+        key = "/".join(self._path)
+        self.stages.setdefault(key, 0.0)  # claim the slot now so stages list outer-first
+        if self.trace_memory:
+            before = _snapshot()
+            start_bytes = tracemalloc.get_traced_memory()[0]
+            self._enter_peak()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[key] = self.stages.get(key, 0.0) + time.perf_counter() - start
+            if self.trace_memory:
+                peak = self._exit_peak()
+                top = _snapshot().compare_to(before, "lineno")[:_TOP_ALLOCATIONS]
+                self.memory[key] = StageMemory(start_bytes, peak, top)
+            self._path.pop()
+
+    def _enter_peak(self) -> None:
+        # tracemalloc keeps one global peak: fold it into the enclosing stage, then restart it
+        if self._peaks:
+            self._peaks[-1] = max(self._peaks[-1], tracemalloc.get_traced_memory()[1])
+        self._peaks.append(0)
+        tracemalloc.reset_peak()
+
+    def _exit_peak(self) -> int:
+        peak = max(self._peaks.pop(), tracemalloc.get_traced_memory()[1])
+        if self._peaks:
+            self._peaks[-1] = max(self._peaks[-1], peak)
+        return peak
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+    return tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+
+
+def configure(print_breakdown: bool = False, sink: str | Path | None = None) -> None:
+    """Turn timings on: print a per-stage breakdown after each build and/or append to sink."""
+    _settings["print"] = print_breakdown
+    if sink is not None:
+        _settings["sink"] = Path(sink)
+
+
+def enabled() -> bool:
+    return _settings["print"] or _settings["sink"] is not None
+
+
+def span(name: str):
+    """Time the enclosed block as stage name of the current build; a no-op when not collecting."""
+    timings = _current.get()
+    if timings is None:
+        return _NULL_SPAN
+    return timings.span(name)
+
+
+@contextlib.contextmanager
+def collect(label: str):
+    """Collect the spans opened inside the block into a Timings, then report it.
+
+    Yields the Timings, or None when timings are off. Inside another collect() or
+    recording() block it is just span(label) of the outer Timings. Also usable as a
+    decorator.
+    """
+    outer = _current.get()
+    if outer is not None:
+        with outer.span(label):
+            yield outer
+        return
+    if not enabled():
+        yield None
+        return
+    timings = Timings(label)
+    try:
+        with recording(timings):
+            yield timings
+    finally:
+        if _settings["print"]:
+            print_breakdown(timings)
+        if _settings["sink"] is not None:
+            _append(timings, _settings["sink"])
+
+
+@contextlib.contextmanager
+def recording(timings: Timings):
+    """Make timings the current Timings for the block and set its total; no reporting."""
+    token = _current.set(timings)
+    start = time.perf_counter()
+    try:
+        yield timings
+    except BaseException:
+        timings.ok = False
+        raise
+    finally:
+        timings.total = time.perf_counter() - start
+        _current.reset(token)
+
+
+def print_breakdown(timings: Timings) -> None:
+    print(f"[resume-helper] Timings for {timings.label}: {timings.total:.3f} s total", file=sys.stderr)
+    for key, seconds in timings.stages.items():
+        depth = key.count("/")
+        name = "  " * depth + key.rsplit("/", 1)[-1]
+        share = f"{seconds / timings.total:6.1%}" if timings.total and not depth else ""
+        print(f"[resume-helper]   {name:<24} {seconds:8.3f} s  {share}", file=sys.stderr)
+
+
+def _append(timings: Timings, sink: Path) -> None:
+    record = {
+        "ts": time.time(),
+        "label": timings.label,
+        "ok": timings.ok,
+        "total": round(timings.total, 6),
+        "stages": {k: round(v, 6) for k, v in timings.stages.items()},
+    }
+    try:
+        sink.parent.mkdir(parents=True, exist_ok=True)
+        with _sink_lock, sink.open("a", encoding="utf-8") as fh:
+            fh.write(json.dumps(record) + "\n")
+    except OSError as exc:
+        print(f"[resume-helper] WARNING: could not write timings to {sink}: {exc}", file=sys.stderr)
+
+
+def summarize(path: str | Path) -> dict[str, tuple[int, float, float]]:
+    """Return {stage: (count, p50, p95)} in seconds over a JSONL timings log; 'total' included."""
+    samples: dict[str, list[float]] = defaultdict(list)
+    with open(path, encoding="utf-8") as fh:
+        for line in fh:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            samples["total"].append(record["total"])
+            for stage, seconds in record["stages"].items():
+                samples[stage].append(seconds)
+    return {stage: (len(v), _percentile(v, 50), _percentile(v, 95)) for stage, v in samples.items()}
+
+
+def _percentile(values: list[float], pct: int) -> float:
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[pct - 1]
+
+
+def main() -> None:
+    if len(sys.argv) != 2:
+        print("usage: python -m resume_helper.timing TIMINGS.jsonl", file=sys.stderr)
+        sys.exit(2)
+    summary = summarize(sys.argv[1])
+    print(f"{'stage':<32} {'n':>6} {'p50 s':>9} {'p95 s':>9}")
+    for stage, (n, p50, p95) in sorted(summary.items(), key=lambda item: item[0] != "total"):
+        print(f"{stage:<32} {n:>6} {p50:>9.3f} {p95:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -451,6 +451,1436 @@ def _preflight_warns_when_uncovered():
 
 check("_preflight_coverage_check warns when project uncovered", _preflight_warns_when_uncovered)
 
+# ---------------------------------------------------------------------------
+# batch builds
+# ---------------------------------------------------------------------------
+print("\n-- batch builds --")
+
+from resume_helper.builder.batch_builder import build_batch, read_job_inputs
+
+
+class _StubResumeLLM:
+    """Returns a well-formed resume; echoes the first job posting line as the role."""
+
+    def complete(self, _sys, user_prompt):
+        role = user_prompt.split("JOB POSTING\n-----------\n", 1)[1].splitlines()[0]
+        return f"COMPANY: Acme\nROLE: {role}\n{_WELL_FORMED_RESUME}"
+
+    def complete_stream(self, _sys, user_prompt, _prefix_chars=0):
+        text = self.complete(_sys, user_prompt)
+        for i in range(0, len(text), 16):
+            yield text[i:i + 16]
+
+    def get_model_name(self):
+        return "stub"
+
+
+def _tmp_user_paths(tmp: str) -> UserPaths:
+    return UserPaths(
+        resume=Path(tmp) / "resumes" / "legacy" / "resume_default.pdf",
+        projects=DEFAULT_PROJECTS_PATH,
+        output_dir_md=Path(tmp) / "resumes" / "enhanced" / "md",
+        output_dir_docx=Path(tmp) / "resumes" / "enhanced" / "docx",
+        job_reqs_dir=Path(tmp) / "job_reqs",
+    )
+
+
+def _read_job_inputs_check():
+    with tempfile.TemporaryDirectory() as tmp:
+        jobs_file = Path(tmp) / "jobs.txt"
+        jobs_file.write_text("# postings\nhttps://a.example/1\n\nhttps://b.example/2\n")
+        assert [j for j, _ in read_job_inputs(str(jobs_file))] == ["https://a.example/1", "https://b.example/2"]
+        jobs_dir = Path(tmp) / "jobs"
+        jobs_dir.mkdir()
+        (jobs_dir / "b.txt").write_text("Data Engineer\nBuild pipelines.")
+        (jobs_dir / "a.md").write_text("https://jobs.example.com/ds")
+        (jobs_dir / "ignored.pdf").write_text("x")
+        assert read_job_inputs(str(jobs_dir)) == [
+            ("a.md", "https://jobs.example.com/ds"), ("b.txt", "Data Engineer\nBuild pipelines."),
+        ]
+
+
+check("read_job_inputs reads URL lists and job directories", _read_job_inputs_check)
+
+
+def _build_batch_check():
+    import io
+    import contextlib
+    jobs = [("one", "Data Scientist\nModels."), ("two", "   "), ("three", "ML Engineer\nServing.")]
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = _tmp_user_paths(tmp)
+        ensure_user_dirs(paths)
+        with contextlib.redirect_stderr(io.StringIO()):
+            results = build_batch(jobs, None, None, None, "stub", user_paths=paths,
+                                  max_workers=3, llm=_StubResumeLLM())
+        assert [r.label for r in results] == ["one", "two", "three"], "results must keep input order"
+        assert results[1].error and results[1].md_path is None, "blank job should fail on its own"
+        names = sorted(r.md_path.name for r in results if r.md_path)
+        assert len(names) == 2 and "data_scientist" in names[0] and "ml_engineer" in names[1], names
+
+
+check("build_batch shares inputs, isolates failures, keeps order", _build_batch_check)
+
+
+def _batch_same_role_check():
+    import io
+    import contextlib
+    jobs = [("one", "Data Scientist\nModels."), ("two", "Data Scientist\nForecasts.")]
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = _tmp_user_paths(tmp)
+        ensure_user_dirs(paths)
+        with contextlib.redirect_stderr(io.StringIO()):
+            results = build_batch(jobs, None, None, None, "stub", user_paths=paths,
+                                  max_workers=2, llm=_StubResumeLLM())
+        md_paths = [r.md_path for r in results]
+        assert all(md_paths) and len(set(md_paths)) == 2, md_paths
+        assert all(p.exists() for p in md_paths), "one resume overwrote the other"
+        assert len(list(paths.job_reqs_dir.glob("*.txt"))) == 2
+
+check("build_batch keeps same company/role postings apart", _batch_same_role_check)
+
+# ---------------------------------------------------------------------------
+# LLM response cache
+# ---------------------------------------------------------------------------
+print("\n-- llm cache --")
+
+import contextlib as _contextlib
+import io as _io
+from resume_helper.llm.cache import CachedProvider
+
+
+class _CountingLLM:
+    def __init__(self):
+        self.calls = 0
+
+    def complete(self, _sys, usr):
+        self.calls += 1
+        return f"answer to {usr}"
+
+    def complete_structured_one(self, _sys, _usr, response_model):
+        self.calls += 1
+        return DuplicateMatch(matched_id="proj_001", reason="same")
+
+    def get_model_name(self):
+        return "counting"
+
+
+def _llm_cache_hit_check():
+    inner = _CountingLLM()
+    with tempfile.TemporaryDirectory() as tmp, _contextlib.redirect_stderr(_io.StringIO()):
+        llm = CachedProvider(inner, Path(tmp))
+        assert llm.complete("s", "u") == llm.complete("s", "u") == "answer to u"
+        assert llm.complete("s", "other") == "answer to other"
+        one = llm.complete_structured_one("s", "u", DuplicateMatch)
+        again = llm.complete_structured_one("s", "u", DuplicateMatch)
+        assert isinstance(again, DuplicateMatch) and again == one
+        assert inner.calls == 3, f"expected 3 network calls, got {inner.calls}"
+        CachedProvider(inner, Path(tmp), refresh=True).complete("s", "u")
+        assert inner.calls == 4, "refresh should bypass the cache"
+
+
+check("CachedProvider serves identical requests from disk", _llm_cache_hit_check)
+
+
+def _llm_cache_eviction_check():
+    import os, time
+    inner = _CountingLLM()
+    with tempfile.TemporaryDirectory() as tmp, _contextlib.redirect_stderr(_io.StringIO()):
+        llm = CachedProvider(inner, Path(tmp), max_bytes=60)
+        llm.complete("s", "first")
+        for entry in Path(tmp).glob("*/*.json"):
+            old = time.time() - 60
+            os.utime(entry, (old, old))
+        llm.complete("s", "second")
+        llm.complete("s", "third")
+        remaining = [e.read_text() for e in Path(tmp).glob("*/*.json")]
+        assert not any("first" in r for r in remaining), "least-recently-used entry should be evicted"
+        assert any("third" in r for r in remaining)
+        expired = CachedProvider(inner, Path(tmp), max_age_seconds=-1)
+        calls = inner.calls
+        expired.complete("s", "third")
+        assert inner.calls == calls + 1, "expired entries must not be served"
+
+
+check("CachedProvider evicts LRU entries by size and age", _llm_cache_eviction_check)
+
+
+def _cache_prune_rate_check():
+    from resume_helper.parsers.http_cache import HttpCache
+    with tempfile.TemporaryDirectory() as tmp, _contextlib.redirect_stderr(_io.StringIO()):
+        llm = CachedProvider(_CountingLLM(), Path(tmp) / "llm", max_bytes=10**6)
+        http = HttpCache(Path(tmp) / "http", ttl=3600, max_bytes=10**6)
+        for cache in (llm, http):
+            real_prune, scans = cache.prune, []
+            cache.prune = lambda real_prune=real_prune, scans=scans: scans.append(1) or real_prune()
+            for n in range(20):
+                if cache is llm:
+                    llm.complete("s", f"prompt {n}")
+                else:
+                    http.put(f"https://example.org/{n}", b"x" * 100, "utf-8", None, None)
+            assert len(scans) == 1, f"{type(cache).__name__} scanned {len(scans)} times for 20 writes"
+            cache._max_bytes = 1  # over the limit: every write prunes again
+            if cache is llm:
+                llm.complete("s", "one more")
+            else:
+                http.put("https://example.org/more", b"x", "utf-8", None, None)
+            assert len(scans) == 2
+
+check("LLM and HTTP caches rescan only when over max_bytes", _cache_prune_rate_check)
+
+# ---------------------------------------------------------------------------
+# parsed-PDF text cache
+# ---------------------------------------------------------------------------
+print("\n-- pdf text cache --")
+
+import resume_helper.parsers.pdf_parser as _pdf_parser
+
+
+def _pdf_cache_check():
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf = Path(tmp) / "resume.pdf"
+        pdf.write_bytes(DEFAULT_RESUME_PATH.read_bytes())
+        cache = Path(tmp) / "cache"
+        first = _pdf_parser.parse_pdf(str(pdf), cache_dir=cache)
+        assert first == _pdf_parser.parse_pdf(str(pdf)), "cached and uncached text must match"
+
+        real_extract = _pdf_parser._extract_text
+        calls = []
+        _pdf_parser._extract_text = lambda p, *_args: calls.append(p) or "re-parsed"
+        try:
+            assert _pdf_parser.parse_pdf(str(pdf), cache_dir=cache) == first, "unchanged PDF should hit the cache"
+            assert not calls
+            pdf.write_bytes(pdf.read_bytes() + b"\n%changed\n")
+            assert _pdf_parser.parse_pdf(str(pdf), cache_dir=cache) == "re-parsed", "changed PDF must be re-parsed"
+        finally:
+            _pdf_parser._extract_text = real_extract
+
+
+check("parse_pdf caches text by content hash and invalidates on change", _pdf_cache_check)
+
+def _pdf_parallel_check():
+    from benchmarks.synthetic import write_pdf
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf = write_pdf(Path(tmp) / "long.pdf", 10)
+        serial = _pdf_parser.parse_pdf(str(pdf), workers=1)
+        assert serial.startswith("Page 1 Project Experience") and "Page 10 Project Experience" in serial
+        assert _pdf_parser.parse_pdf(str(pdf), workers=3) == serial, "parallel output must match serial"
+
+
+check("parse_pdf process-pool extraction matches serial page order", _pdf_parallel_check)
+
+def _pdf_engine_parity_check():
+    from benchmarks.synthetic import write_text_pdf
+    resume_page = [
+        "Jane Smith", "jane at example.com | 555-555-5555",
+        "Work Experience", "Senior Data Scientist, Acme Corp | 2021 - Present | New York, NY",
+        "Project Experience",
+        "Churn Prediction Model", "Built a gradient boosted model to predict churn, cutting losses by 12%.",
+        "Demand Forecasting Platform", "Forecast weekly demand across 400 stores using Spark and Airflow.",
+        "Supporting Experience", "Technologies: Python, SQL, Spark",
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf = write_text_pdf(Path(tmp) / "resume.pdf", [resume_page, ["Education", "State University"]])
+        ref = _pdf_parser.parse_pdf(str(pdf), engine="pdfplumber")
+        fast = _pdf_parser.parse_pdf(str(pdf), engine="pypdfium2")
+        assert _extract_project_titles(fast) == _extract_project_titles(ref) == [
+            "Churn Prediction Model", "Demand Forecasting Platform",
+        ], _extract_project_titles(fast)
+        assert fast == ref, "pypdfium2 text should match pdfplumber on simple layouts"
+
+    # Real resume (mixed fonts, tabs, tight kerning): the full text and every title must match
+    ref = _pdf_parser._extract_text(DEFAULT_RESUME_PATH, 1, "pdfplumber")
+    fast = _pdf_parser._extract_text(DEFAULT_RESUME_PATH, 1, "pypdfium2")
+    diff = [(a, b) for a, b in zip(fast.splitlines(), ref.splitlines()) if a != b]
+    assert fast == ref, diff[:3] or "line counts differ"
+    assert _extract_project_titles(fast) == _extract_project_titles(ref), _extract_project_titles(fast)
+    assert _extract_project_titles(ref)[:2] == ["Flour and Yeast Analysis", "Predictive ML Baking Models"]
+
+
+check("pypdfium2 engine matches pdfplumber text and project titles", _pdf_engine_parity_check)
+
+
+def _pdf_unknown_engine_check():
+    try:
+        _pdf_parser.parse_pdf(str(DEFAULT_RESUME_PATH), engine="not_an_engine")
+        raise AssertionError("should have raised ValueError")
+    except ValueError:
+        pass
+
+
+check("parse_pdf rejects unknown engine", _pdf_unknown_engine_check)
+
+# ---------------------------------------------------------------------------
+# job page fetching (local HTTP stand-in server)
+# ---------------------------------------------------------------------------
+print("\n-- job page fetching --")
+
+import threading as _threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class _JobPageHandler(BaseHTTPRequestHandler):
+    """Serves /job/<n> with an ETag; answers If-None-Match with 304. Logs every request.
+
+    /slow/<n> pages take 0.1 s and record peak concurrency; /flaky/<n> pages fail
+    with 503 on their first request; /missing is a 404. /big/<n> pages carry ~1 MB of
+    inline script after the posting (inside <main> unless n is "nomain").
+    """
+    log: list = []
+    in_flight = 0
+    peak_in_flight = 0
+    _lock = _threading.Lock()
+
+    def do_GET(self):
+        etag = f'"{self.path}-v1"'
+        with self._lock:
+            first_hit = all(path != self.path for path, _ in self.log)
+            self.log.append((self.path, self.headers.get("If-None-Match")))
+        if self.path == "/missing" or (self.path.startswith("/flaky/") and first_hit):
+            self.send_response(404 if self.path == "/missing" else 503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path.startswith("/slow/"):
+            with self._lock:
+                type(self).in_flight += 1
+                type(self).peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            time.sleep(0.1)
+            with self._lock:
+                type(self).in_flight -= 1
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        body = (
+            f"<html><head><meta name='description' content='meta'></head><body><nav>Menu</nav>"
+            f"<main><h1>Data Scientist {self.path}</h1><p>Build models.</p></main></body></html>"
+        ).encode()
+        if self.path.startswith("/big/"):
+            tag = "div class='job'" if self.path == "/big/nomain" else "main"
+            body = (
+                f"<html><body><{tag}><h1>Data Scientist {self.path}</h1><p>Build models.</p></{tag.split()[0]}>"
+                f"<script>{'x' * 2**20}</script></body></html>"
+            ).encode()
+        self.send_response(200)
+        charset = "utf-8lol" if self.path.startswith("/badcharset/") else "utf-8"
+        self.send_header("Content-Type", f"text/html; charset={charset}")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # client stopped reading early
+
+    def log_message(self, *_args):
+        pass
+
+
+_job_server = ThreadingHTTPServer(("127.0.0.1", 0), _JobPageHandler)
+_threading.Thread(target=_job_server.serve_forever, daemon=True).start()
+_JOB_BASE = f"http://127.0.0.1:{_job_server.server_address[1]}"
+
+
+def _http_cache_check():
+    from resume_helper.parsers.http_cache import HttpCache
+    from resume_helper.parsers.job_parser import _scrape_url
+    _JobPageHandler.log.clear()
+    with tempfile.TemporaryDirectory() as tmp:
+        fresh = HttpCache(Path(tmp), ttl=3600)
+        first = _scrape_url(f"{_JOB_BASE}/job/1", cache=fresh)
+        assert first == "Data Scientist /job/1\nBuild models.", repr(first)
+        assert _scrape_url(f"{_JOB_BASE}/job/1", cache=fresh) == first
+        assert len(_JobPageHandler.log) == 1, "fresh cache hit must not touch the network"
+
+        stale = HttpCache(Path(tmp), ttl=0)
+        body_path = next(Path(tmp).glob("*.body"))
+        body_mtime, fetched_at = body_path.stat().st_mtime_ns, stale.get(f"{_JOB_BASE}/job/1").fetched_at
+        assert _scrape_url(f"{_JOB_BASE}/job/1", cache=stale) == first
+        assert _JobPageHandler.log[-1][1] == '"/job/1-v1"', "stale entry should revalidate with If-None-Match"
+        assert len(_JobPageHandler.log) == 2
+        assert body_path.stat().st_mtime_ns == body_mtime, "304 should refresh metadata only"
+        assert stale.get(f"{_JOB_BASE}/job/1").fetched_at > fetched_at, "304 should restart the TTL"
+
+    from resume_helper.parsers.job_parser import _get_session
+    assert _get_session() is _get_session(), "fetches should share one pooled session"
+
+
+check("job page HTTP cache serves fresh hits and revalidates with ETag", _http_cache_check)
+
+
+def _http_cache_eviction_check():
+    import os
+    from resume_helper.parsers.http_cache import HttpCache
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = HttpCache(Path(tmp), ttl=3600, max_bytes=10**9)
+        for n, url in enumerate(("a", "b", "c")):
+            cache.put(url, b"x" * 1000, "utf-8", None, None)
+            meta_path, _ = cache._paths(url)
+            os.utime(meta_path, (1000 + n, 1000 + n))
+        assert cache.get("a") is not None  # a is now the most recently used
+        cache._max_bytes = 2500
+        cache.prune()
+        assert cache.get("b") is None, "least recently used page should be evicted"
+        assert cache.get("a") is not None and cache.get("c") is not None
+        assert not list(Path(tmp).glob(f"{cache._paths('b')[0].stem}.*")), "evicted body left behind"
+
+check("job page HTTP cache evicts least-recently-used pages past max_bytes", _http_cache_eviction_check)
+
+
+def _http_cache_bad_charset_check():
+    from resume_helper.parsers.http_cache import CachedPage, resolve_encoding
+    assert resolve_encoding("ISO-8859-1") == "ISO-8859-1"
+    assert resolve_encoding("utf-8lol") == resolve_encoding("base64") == resolve_encoding(None) == "utf-8"
+    page = CachedPage("café".encode("utf-8"), "x-unknown-charset", None, None, 0.0)
+    assert page.text == "café"
+
+check("cached pages with an unknown charset decode as utf-8", _http_cache_bad_charset_check)
+
+
+def _fetch_bad_charset_check():
+    from resume_helper.parsers.http_cache import HttpCache
+    from resume_helper.parsers.job_parser import _scrape_url
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = HttpCache(Path(tmp), ttl=3600)
+        url = f"{_JOB_BASE}/badcharset/1"
+        assert _scrape_url(url, cache=cache) == "Data Scientist /badcharset/1\nBuild models."
+        assert cache.get(url).encoding == "utf-8"
+
+check("job pages with an unknown charset are fetched as utf-8", _fetch_bad_charset_check)
+
+
+def _concurrent_fetch_check():
+    import resume_helper.parsers.job_parser as jp
+    _JobPageHandler.log.clear()
+    _JobPageHandler.peak_in_flight = 0
+    saved = jp.FETCH_BACKOFF, jp._default_http_cache
+    jp.FETCH_BACKOFF, jp._default_http_cache = 0.01, lambda: None
+    try:
+        inputs = [f"{_JOB_BASE}/slow/{n}" for n in range(6)] + ["  raw posting text  ", f"{_JOB_BASE}/flaky/1"]
+        texts = jp.parse_job_inputs(inputs, max_workers=6, per_host=2)
+    finally:
+        jp.FETCH_BACKOFF, jp._default_http_cache = saved
+    assert texts[:6] == [f"Data Scientist /slow/{n}\nBuild models." for n in range(6)], texts
+    assert texts[6] == "raw posting text"
+    assert texts[7] == "Data Scientist /flaky/1\nBuild models.", "503 should be retried"
+    assert _JobPageHandler.peak_in_flight <= 2, f"per-host limit exceeded: {_JobPageHandler.peak_in_flight}"
+    assert sum(path == "/flaky/1" for path, _ in _JobPageHandler.log) == 2
+
+
+check("parse_job_inputs keeps order, limits per host, retries 503", _concurrent_fetch_check)
+
+
+def _fetch_errors_check():
+    import requests
+    import resume_helper.parsers.job_parser as jp
+    saved = jp._default_http_cache
+    jp._default_http_cache = lambda: None
+    try:
+        texts = jp.parse_job_inputs([f"{_JOB_BASE}/job/2", f"{_JOB_BASE}/missing"], return_exceptions=True)
+    finally:
+        jp._default_http_cache = saved
+    assert texts[0] == "Data Scientist /job/2\nBuild models."
+    assert isinstance(texts[1], requests.HTTPError), "404 is not retried and is returned in its slot"
+
+
+check("parse_job_inputs returns fetch errors in place", _fetch_errors_check)
+
+
+def _streaming_fetch_check():
+    from resume_helper.parsers.http_cache import HttpCache
+    import resume_helper.parsers.job_parser as jp
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = HttpCache(Path(tmp), ttl=3600)
+        url = f"{_JOB_BASE}/big/main"
+        assert jp._scrape_url(url, cache=cache) == "Data Scientist /big/main\nBuild models."
+        assert len(cache.get(url).body) < 2**19, "should stop reading once </main> closes"
+
+        saved = jp.HTTP_MAX_BYTES
+        jp.HTTP_MAX_BYTES = 4096
+        try:
+            url = f"{_JOB_BASE}/big/nomain"
+            with _contextlib.redirect_stderr(_io.StringIO()) as err:
+                text = jp._scrape_url(url, cache=cache)
+        finally:
+            jp.HTTP_MAX_BYTES = saved
+        assert text == "Data Scientist /big/nomain\nBuild models.", repr(text)
+        assert len(cache.get(url).body) == 4096
+        assert "larger than 4096 bytes" in err.getvalue()
+
+
+check("job pages stream: stop at </main>, cap oversized bodies", _streaming_fetch_check)
+
+
+def _stream_parity_check():
+    from resume_helper.parsers.job_parser import _html_to_text, _stream_text
+
+    class _Chunked:
+        def __init__(self, data: bytes):
+            self.data = data
+
+        def iter_content(self, size):
+            return (self.data[i:i + 7] for i in range(0, len(self.data), 7))
+
+    for html in _HTML_FIXTURES:
+        assert _stream_text(_Chunked(html.encode()), "utf-8", "u")[0] == _html_to_text(html), html[:80]
+
+
+_HTML_FIXTURES = [
+    # <main> wins; stripped chrome contributes only its surrounding text
+    "<html><body><nav>Menu</nav>Intro<main><h1>Role</h1>a<footer>x</footer>b<p>c</p></main></body></html>",
+    # id hint beats class hint; comments split strings
+    "<body><div class='job-card'>card</div><section id='JobContent'>Req<!-- c -->uirements</section></body>",
+    # class hint, whitespace runs collapsed
+    "<body><div class='x posting-description'>\n\n  One \n\n\n\n Two  </div></body>",
+    # template and ruby annotations are not body text
+    "<body><p>Data<template>hidden</template> Eng<ruby>漢<rt>kan</rt></ruby></p></body>",
+    # empty SPA shell: meta description fallback
+    "<html><head><meta name='description' content='  From meta  '></head><body><div id='root'></div></body></html>",
+    # no body at all, XML declaration, empty document
+    "<?xml version='1.0' encoding='utf-8'?><html><body><main>decl</main></body></html>",
+    "",
+]
+
+
+def _html_parity_check():
+    from benchmarks.synthetic import job_page_html
+    from resume_helper.parsers.job_parser import _html_to_text, _html_to_text_bs4
+    pages = _HTML_FIXTURES + [job_page_html(40_000), job_page_html(40_000, seed=1, with_main=False)]
+    for html in pages:
+        assert _html_to_text(html) == _html_to_text_bs4(html), html[:80]
+    assert _html_to_text(_HTML_FIXTURES[0]) == "Role\na\nb\nc"
+    assert _html_to_text(_HTML_FIXTURES[4]) == "From meta"
+
+
+check("lxml job-page extraction matches the BeautifulSoup reference", _html_parity_check)
+check("streamed parse matches whole-page extraction", _stream_parity_check)
+
+# ---------------------------------------------------------------------------
+# project ranking (top-K)
+# ---------------------------------------------------------------------------
+print("\n-- project ranking --")
+
+
+def _ranked_project(pid: str, title: str, skills: list, include: bool = False) -> dict:
+    return {
+        "id": pid, "title": title, "summary": f"{title} project.", "skills": skills,
+        "role_tags": ["data_engineer"], "impact": [], "keywords": [], "include_by_default": include,
+    }
+
+
+_RANK_PROJECTS = [
+    _ranked_project("p1", "Marketing Dashboard", ["Tableau", "Excel"]),
+    _ranked_project("p2", "Streaming Pipeline", ["Spark", "Kafka", "Airflow"]),
+    _ranked_project("p3", "Portfolio Website", ["HTML", "CSS"], include=True),
+    _ranked_project("p4", "Warehouse Migration", ["dbt", "Snowflake", "SQL"]),
+    _ranked_project("p5", "Churn Model", ["Python", "scikit-learn"]),
+]
+_RANK_JOB = "Data Engineer: build Spark and Kafka streaming pipelines, orchestrate with Airflow, model in dbt and SQL."
+
+
+def _rank_order_check():
+    from resume_helper.builder.project_ranker import rank_projects
+    ranked = [p["id"] for _, p in rank_projects(_RANK_PROJECTS, _RANK_JOB)]
+    assert ranked[:2] == ["p2", "p4"], ranked
+    assert rank_projects([], _RANK_JOB) == []
+
+
+def _top_k_select_check():
+    from resume_helper.builder.project_ranker import select_top_projects
+    with _contextlib.redirect_stderr(_io.StringIO()) as err:
+        selected = select_top_projects(_RANK_PROJECTS, _RANK_JOB, top_k=2)
+    # top 2 plus include_by_default, in projects.json order
+    assert [p["id"] for p in selected] == ["p2", "p3", "p4"], [p["id"] for p in selected]
+    log = err.getvalue()
+    assert "sending 3" in log and "Streaming Pipeline" in log and "drop" in log, log
+    assert select_top_projects(_RANK_PROJECTS, _RANK_JOB, top_k=0) is _RANK_PROJECTS
+    assert select_top_projects(_RANK_PROJECTS, _RANK_JOB, top_k=10) is _RANK_PROJECTS
+
+
+check("BM25 ranks projects by overlap with the posting", _rank_order_check)
+check("top-K keeps best matches plus include_by_default, logs scores", _top_k_select_check)
+
+# ---------------------------------------------------------------------------
+# token budget
+# ---------------------------------------------------------------------------
+print("\n-- token budget --")
+
+
+def _budget_projects() -> list:
+    projects = [dict(p) for p in _RANK_PROJECTS]
+    for p in projects:
+        p.update(notes="n " * 100, keywords=["kw"] * 50, description_long="detail " * 200)
+    return projects
+
+
+def _budget_trim_order_check():
+    from resume_helper.builder.prompt_builder import assemble_prompt, build_prompt, estimate_tokens
+    projects = _budget_projects()
+    unlimited = assemble_prompt("RESUME", _RANK_JOB, projects, "SYS")
+    assert unlimited.degraded == [] and unlimited.user_prompt == build_prompt("RESUME", _RANK_JOB, projects, "SYS")[1]
+    full = unlimited.tokens["total"]
+    assert full == estimate_tokens("SYS") + estimate_tokens(unlimited.user_prompt)
+    assert all(a is b for a, b in zip(unlimited.projects, projects)), "untrimmed projects should not be copied"
+
+    # Just under full size: notes go first and that is enough
+    plan = assemble_prompt("RESUME", _RANK_JOB, projects, "SYS", max_input_tokens=full - 10)
+    assert plan.degraded == ["dropped project notes"], plan.degraded
+    assert "Notes:" not in plan.user_prompt and "Keywords:" in plan.user_prompt
+
+    # Tighter than every field trimmed: the weakest projects go, include_by_default stays
+    bare = [{k: v for k, v in p.items() if k not in ("notes", "keywords", "description_long")} for p in projects]
+    budget = assemble_prompt("RESUME", _RANK_JOB, bare, "SYS").tokens["total"] - 30
+    plan = assemble_prompt("RESUME", _RANK_JOB, projects, "SYS", max_input_tokens=budget)
+    assert plan.degraded[:3] == ["dropped project notes", "dropped project keywords", "cut description_long to 1000 chars"]
+    assert plan.degraded[-1].endswith("lowest-ranked project(s)"), plan.degraded
+    kept = [p["id"] for p in plan.projects]
+    assert "p3" in kept and "p2" in kept and len(kept) < 5, kept
+    assert plan.tokens["total"] <= budget, plan.tokens
+    assert projects[0]["notes"], "caller's project dicts must not be modified"
+
+
+def _dry_run_check():
+    from resume_helper.builder.resume_builder import build_resume
+
+    class _NoCallLLM:
+        def complete_stream(self, *_args):
+            raise AssertionError("dry run must not call the LLM")
+
+        def get_model_name(self):
+            return "no-call"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = _tmp_user_paths(tmp)
+        ensure_user_dirs(paths)
+        with _contextlib.redirect_stderr(_io.StringIO()) as err:
+            result = build_resume(None, "Data Scientist\nModels.", None, None, "stub", None,
+                                  user_paths=paths, llm=_NoCallLLM(), dry_run=True)
+        assert result is None
+        log = err.getvalue()
+        for section in ("system prompt", "base resume", "job posting", "projects (", "total"):
+            assert section in log, log
+        assert not any(paths.output_dir_md.iterdir()), "dry run must not write output"
+
+
+check("token budget trims notes, keywords, details, then weakest projects", _budget_trim_order_check)
+check("--dry-run prints the token breakdown without calling the LLM", _dry_run_check)
+
+# ---------------------------------------------------------------------------
+# streaming completions
+# ---------------------------------------------------------------------------
+print("\n-- streaming completions --")
+
+
+class _ScriptedStreamLLM:
+    """Streams fixed chunks; records how many were pulled and whether the stream was closed."""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.pulled = 0
+        self.closed = False
+
+    def complete_stream(self, _sys, _usr, _prefix_chars=0):
+        try:
+            for chunk in self.chunks:
+                self.pulled += 1
+                yield chunk
+        finally:
+            self.closed = True
+
+    def complete(self, _sys, _usr):
+        return "".join(self.chunks)
+
+    def get_model_name(self):
+        return "scripted"
+
+
+def _stream_build_check():
+    from resume_helper.builder.resume_builder import build_resume
+    seen = []
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = _tmp_user_paths(tmp)
+        ensure_user_dirs(paths)
+        llm = _StubResumeLLM()
+        with _contextlib.redirect_stderr(_io.StringIO()):
+            md_path, _ = build_resume(None, "Data Scientist\nModels.", None, None, "stub", None,
+                                      user_paths=paths, llm=llm, on_chunk=seen.append)
+        assert len(seen) > 3, "on_chunk should see the resume piece by piece"
+        streamed = "".join(seen)
+        assert streamed.startswith("COMPANY: Acme\nROLE: Data Scientist\n"), streamed[:80]
+        assert streamed.rstrip("\n").endswith(_WELL_FORMED_RESUME.rstrip("\n")[-40:])
+        assert "Work Experience" in md_path.read_text()
+
+
+def _stream_sentinel_check():
+    from resume_helper.builder.resume_builder import build_resume
+    llm = _ScriptedStreamLLM(["  JOB_CON", "TENT_ERROR: posting is a", " login page\nCOMPANY: x", "never pulled"])
+    seen = []
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = _tmp_user_paths(tmp)
+        ensure_user_dirs(paths)
+        try:
+            with _contextlib.redirect_stderr(_io.StringIO()):
+                build_resume(None, "Sign in", None, None, "stub", None, user_paths=paths, llm=llm,
+                             on_chunk=seen.append)
+        except ValueError as exc:
+            assert str(exc).endswith("posting is a login page"), exc
+        else:
+            raise AssertionError("sentinel should raise ValueError")
+    assert llm.pulled == 3 and llm.closed, "stream should be aborted right after the reason line"
+    assert seen == [], "sentinel text must not reach on_chunk"
+
+
+def _stream_cache_check():
+    from resume_helper.llm.cache import CachedProvider
+    with tempfile.TemporaryDirectory() as tmp:
+        inner = _ScriptedStreamLLM(["Hel", "lo"])
+        cached = CachedProvider(inner, Path(tmp))
+        stream = cached.complete_stream("s", "u")
+        next(stream)
+        stream.close()
+        assert not list(Path(tmp).glob("*/*.json")), "abandoned stream must not be cached"
+        assert list(cached.complete_stream("s", "u")) == ["Hel", "lo"]
+        with _contextlib.redirect_stderr(_io.StringIO()):
+            assert list(cached.complete_stream("s", "u")) == ["Hello"], "hit comes back as one chunk"
+            assert cached.complete("s", "u") == "Hello", "stream and complete share entries"
+        assert inner.pulled == 3
+
+
+check("build_resume streams the completion to on_chunk", _stream_build_check)
+check("JOB_CONTENT_ERROR sentinel aborts the stream early", _stream_sentinel_check)
+check("CachedProvider caches finished streams only", _stream_cache_check)
+
+# ---------------------------------------------------------------------------
+# provider registry
+# ---------------------------------------------------------------------------
+print("\n-- provider registry --")
+
+
+def _registry_check():
+    from concurrent.futures import ThreadPoolExecutor
+    from resume_helper.llm import registry
+    try:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            got = list(pool.map(lambda _: registry.get_provider("claude", "sk-test-1"), range(16)))
+        assert all(p is got[0] for p in got), "concurrent lookups must share one client"
+        assert registry.get_provider("claude", "sk-test-2") is not got[0], "clients are per API key"
+        assert registry.get_provider("openai", "sk-test-1").get_model_name() != got[0].get_model_name()
+        try:
+            registry.get_provider("nope", "k")
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("unknown provider should raise ValueError")
+    finally:
+        registry.clear()
+
+
+check("provider registry shares one client per (provider, API key)", _registry_check)
+
+# ---------------------------------------------------------------------------
+# Provider prompt caching
+# ---------------------------------------------------------------------------
+print("\n-- provider prompt caching --")
+
+
+def _prompt_prefix_check():
+    from resume_helper.builder.prompt_builder import assemble_prompt
+    plans = [assemble_prompt("RESUME", job, _RANK_PROJECTS, "SYS") for job in ("Job one.", "A different job.")]
+    for plan in plans:
+        user = plan.user_prompt
+        assert user.index("BASE RESUME") < user.index("CANDIDATE PROJECTS") < user.index("JOB POSTING")
+        assert user[plan.prefix_chars:].startswith("JOB POSTING\n")
+    assert plans[0].user_prompt[:plans[0].prefix_chars] == plans[1].user_prompt[:plans[1].prefix_chars]
+
+check("job posting comes last, after a prefix shared across postings", _prompt_prefix_check)
+
+
+def _cache_report_check():
+    import io
+    import contextlib
+    from resume_helper.llm.base import report_cache_usage
+    err = io.StringIO()
+    with contextlib.redirect_stderr(err):
+        report_cache_usage("m", 12000, 9000)
+        report_cache_usage("m", 12000, 0, 11000)
+    lines = err.getvalue().splitlines()
+    assert lines[0] == "[llm] m: 12,000 input tokens — 9,000 cache hit, 3,000 miss", lines[0]
+    assert lines[1].endswith("0 cache hit, 1,000 miss, 11,000 written to cache"), lines[1]
+
+check("cache usage report splits hit, miss and cache writes", _cache_report_check)
+
+
+def _prefix_passthrough_check():
+    seen = []
+
+    class _PrefixLLM:
+        def complete_stream(self, _sys, _usr, prefix_chars=0):
+            seen.append(prefix_chars)
+            yield "x"
+
+        def get_model_name(self):
+            return "prefix-stub"
+
+    from resume_helper.llm.cache import CachedProvider
+    with tempfile.TemporaryDirectory() as d:
+        list(CachedProvider(_PrefixLLM(), Path(d)).complete_stream("s", "u", 7))
+    assert seen == [7], seen
+
+check("cached provider passes prefix_chars through to the provider", _prefix_passthrough_check)
+
+# ---------------------------------------------------------------------------
+# Background DOCX conversion
+# ---------------------------------------------------------------------------
+print("\n-- background DOCX conversion --")
+
+# Stands in for pandoc: copies the input to the -o path after a short delay
+_FAKE_PANDOC = """
+import shutil, sys, time
+time.sleep(0.2)
+args = sys.argv[1:]
+out = args[args.index("-o") + 1]
+shutil.copyfile(next(a for a in args if a.endswith(".md")), out)
+"""
+
+
+@_contextlib.contextmanager
+def _fake_pandoc_on_path(installed: bool = True):
+    import os
+    import resume_helper.output.md2docx as md2docx
+    with tempfile.TemporaryDirectory() as bin_dir:
+        if installed:
+            exe = Path(bin_dir) / "pandoc"
+            exe.write_text(f"#!{sys.executable}" + _FAKE_PANDOC)
+            exe.chmod(0o755)
+        old_path = os.environ.get("PATH", "")
+        os.environ["PATH"] = bin_dir if not installed else bin_dir + os.pathsep + old_path
+        md2docx._pandoc_executable.cache_clear()
+        try:
+            yield md2docx
+        finally:
+            os.environ["PATH"] = old_path
+            md2docx._pandoc_executable.cache_clear()
+
+
+def _background_docx_check():
+    import time
+    with _fake_pandoc_on_path() as md2docx, tempfile.TemporaryDirectory() as tmp:
+        md = Path(tmp) / "r.md"
+        md.write_text("# Resume\n")
+        start = time.perf_counter()
+        future = md2docx.submit_conversion(md, Path(tmp) / "r.docx")
+        assert time.perf_counter() - start < 0.1, "submit should not wait for pandoc"
+        assert md2docx.wait_for_docx(Path(tmp) / "r.docx") == Path(tmp) / "r.docx"
+        assert future.done() and (Path(tmp) / "r.docx").read_text() == "# Resume\n"
+
+check("DOCX conversion runs in the background and wait_for_docx collects it", _background_docx_check)
+
+
+def _docx_bulk_check():
+    import shutil
+    calls = []
+    real_which = shutil.which
+    with _fake_pandoc_on_path() as md2docx, tempfile.TemporaryDirectory() as tmp:
+        md_dir = Path(tmp) / "md"
+        md_dir.mkdir()
+        for name in ("a", "b", "c"):
+            (md_dir / f"{name}.md").write_text(name)
+        shutil.which = lambda *a, **kw: calls.append(a) or real_which(*a, **kw)
+        try:
+            results = md2docx.convert_directory(md_dir, Path(tmp) / "docx", max_workers=3, engine="auto")
+        finally:
+            shutil.which = real_which
+        assert [(md.name, docx.name if docx else None, err) for md, docx, err in results] == [
+            ("a.md", "a.docx", None), ("b.md", "b.docx", None), ("c.md", "c.docx", None),
+        ], results
+        assert len(calls) == 1, f"pandoc looked up {len(calls)} times"
+
+check("convert_directory converts a folder in parallel, looking pandoc up once", _docx_bulk_check)
+
+
+def _docx_missing_pandoc_check():
+    with _fake_pandoc_on_path(installed=False) as md2docx, tempfile.TemporaryDirectory() as tmp:
+        md = Path(tmp) / "r.md"
+        md.write_text("x")
+        md2docx.submit_conversion(md, Path(tmp) / "r.docx", engine="pandoc")
+        assert md2docx.wait_for_docx(Path(tmp) / "r.docx") is None
+        assert md2docx.resolve_engine("auto") == "native"
+        try:
+            md2docx.convert_directory(tmp, tmp, engine="pandoc")
+        except RuntimeError:
+            pass
+        else:
+            raise AssertionError("convert_directory should fail without pandoc")
+
+check("missing pandoc fails pandoc conversion softly; auto falls back to native", _docx_missing_pandoc_check)
+
+
+def _docx_renderer_crash_check():
+    import contextlib
+    import io
+    import resume_helper.output.docx_native as docx_native
+    import resume_helper.output.md2docx as md2docx
+    from resume_helper.builder.resume_builder import _report_docx
+
+    def _crash(*_args):
+        raise KeyError("word/document.xml")
+
+    real_render = docx_native.render_markdown_to_docx
+    docx_native.render_markdown_to_docx = _crash
+    was_inline = md2docx.run_conversions_inline(False)
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            md = Path(tmp) / "r.md"
+            md.write_text("x")
+            for inline in (False, True):
+                md2docx.run_conversions_inline(inline)
+                (Path(tmp) / "r.docx").write_text("from an earlier build")
+                future = md2docx.submit_conversion(md, Path(tmp) / "r.docx", engine="native")
+                future.exception()  # let the failure settle, so wait_for_docx has no future to block on
+                assert md2docx.wait_for_docx(Path(tmp) / "r.docx") is None, "stale DOCX reported as converted"
+                assert isinstance(future.exception(), RuntimeError), future.exception()
+                err = io.StringIO()
+                with contextlib.redirect_stderr(err):
+                    _report_docx(future)
+                assert "WARNING" in err.getvalue() and "skipping DOCX" in err.getvalue(), err.getvalue()
+            results = md2docx.convert_directory(tmp, Path(tmp) / "docx", engine="native")
+            assert results[0][1] is None and "word/document.xml" in results[0][2], results
+    finally:
+        docx_native.render_markdown_to_docx = real_render
+        md2docx.run_conversions_inline(was_inline)
+
+check("any renderer error fails DOCX conversion softly, pooled or inline, over a stale DOCX", _docx_renderer_crash_check)
+
+# ---------------------------------------------------------------------------
+# Native DOCX renderer
+# ---------------------------------------------------------------------------
+print("\n-- native DOCX renderer --")
+
+
+def _native_docx_body_check():
+    import re
+    from resume_helper.output.docx_native import markdown_to_body
+    body, links = markdown_to_body(
+        "# Jane Doe\n\n---\n\n## Skills\n\n**Lead:** did *things* & [more](https://x.io?a=1&b=2)\n"
+        "- first bullet\n  - nested `code`\n\nsnake_case stays _plain_ text\n"
+    )
+    styles = re.findall(r'w:pStyle w:val="(\w+)"', body)
+    assert styles == ["Heading1", "Heading2", "FirstParagraph", "ListBullet", "ListBullet", "BodyText"], styles
+    assert "o:hr=\"t\"" in body, "horizontal rule missing"
+    assert "<w:b/><w:bCs/></w:rPr><w:t xml:space=\"preserve\">Lead:</w:t>" in body
+    assert "<w:i/><w:iCs/></w:rPr><w:t xml:space=\"preserve\">things</w:t>" in body
+    assert "did " in body and "&amp;" in body
+    assert links == ["https://x.io?a=1&b=2"] and 'r:id="rIdLink1"' in body
+    assert "snake_case stays " in body and ">plain</w:t>" in body
+
+check("native renderer maps headings, bullets, rules and inline markup", _native_docx_body_check)
+
+
+def _native_docx_package_check():
+    import zipfile
+    from lxml import etree
+    from resume_helper.config import resolve_template
+    from resume_helper.output.docx_native import render_markdown_to_docx
+    _, reference = resolve_template(None)
+    with tempfile.TemporaryDirectory() as tmp:
+        md = Path(tmp) / "r.md"
+        md.write_text("# Name\n\nSee [site](https://example.org).\n")
+        render_markdown_to_docx(md, Path(tmp) / "r.docx", reference)
+        with zipfile.ZipFile(Path(tmp) / "r.docx") as out, zipfile.ZipFile(reference) as ref:
+            assert out.namelist()[0] == "[Content_Types].xml"
+            assert out.read("word/styles.xml") == ref.read("word/styles.xml"), "template styles not carried over"
+            for name in out.namelist():
+                if name.endswith((".xml", ".rels")):
+                    etree.fromstring(out.read(name))
+            rels = out.read("word/_rels/document.xml.rels").decode()
+            assert 'Target="https://example.org"' in rels and "example.com" not in rels
+            assert b"<w:pgMar" in out.read("word/document.xml"), "page setup not carried over"
+
+check("native renderer writes a well-formed package with the template's styles", _native_docx_package_check)
+
+
+def _native_docx_errors_check():
+    import resume_helper.config as config
+    from resume_helper.output.docx_native import render_markdown_to_docx
+
+    def _no_template(_name=None):
+        raise FileNotFoundError("Template not found: 'gone'")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        md = Path(tmp) / "r.md"
+        md.write_text("# Name\n")
+        (Path(tmp) / "file").write_text("not a directory")
+        real_resolve = config.resolve_template
+        cases = [(Path(tmp) / "file" / "r.docx", "Could not write"), (Path(tmp) / "r.docx", "No reference doc")]
+        for out, expected in cases:
+            if expected == "No reference doc":
+                config.resolve_template = _no_template
+            try:
+                render_markdown_to_docx(md, out)
+            except RuntimeError as exc:
+                assert expected in str(exc) and isinstance(exc.__cause__, OSError), exc
+            else:
+                raise AssertionError(f"{expected}: should have raised RuntimeError")
+            finally:
+                config.resolve_template = real_resolve
+        assert not list(Path(tmp).glob("*.tmp")), "temporary package left behind"
+
+check("native renderer wraps template and write errors in RuntimeError", _native_docx_errors_check)
+
+# ---------------------------------------------------------------------------
+# Build timings
+# ---------------------------------------------------------------------------
+print("\n-- build timings --")
+
+
+def _timing_disabled_check():
+    from resume_helper import timing
+    assert not timing.enabled()
+    assert timing.span("anything") is timing._NULL_SPAN, "span should be a shared no-op when off"
+    with timing.collect("off") as timings:
+        assert timings is None
+
+check("timings are a no-op unless turned on", _timing_disabled_check)
+
+
+def _timing_build_check():
+    from resume_helper import timing
+    from resume_helper.builder.resume_builder import build_resume
+    saved = dict(timing._settings)
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = _tmp_user_paths(tmp)
+        ensure_user_dirs(paths)
+        sink = Path(tmp) / "timings.jsonl"
+        timing.configure(print_breakdown=True, sink=sink)
+        err = _io.StringIO()
+        try:
+            with _contextlib.redirect_stderr(err):
+                for role in ("Data Scientist", "Data Engineer"):
+                    build_resume(None, f"{role}\nModels.", None, None, "stub", None,
+                                 user_paths=paths, llm=_StubResumeLLM())
+        finally:
+            timing._settings.update(saved)
+        records = [json.loads(line) for line in sink.read_text().splitlines()]
+        assert len(records) == 2 and all(r["ok"] and r["label"] == "build" for r in records), records
+        stages = list(records[0]["stages"])
+        for stage in ("load inputs", "load inputs/load projects", "rank projects", "assemble prompt", "llm", "format", "docx"):
+            assert stage in stages, f"{stage} missing from {stages}"
+        assert stages.index("load inputs") < stages.index("load inputs/load projects"), "outer stage first"
+        assert "Timings for build:" in err.getvalue()
+        summary = timing.summarize(sink)
+        assert summary["total"][0] == 2 and summary["llm"][1] <= summary["llm"][2]
+
+check("--timings records each build stage to the breakdown and JSONL log", _timing_build_check)
+
+# ---------------------------------------------------------------------------
+# Profiling
+# ---------------------------------------------------------------------------
+print("\n-- profiling --")
+
+
+def _stub_provider_check():
+    from resume_helper.builder.resume_builder import _extract_project_titles
+    from resume_helper.llm.registry import get_provider
+    from resume_helper.models import DuplicateMatch, ProjectRecord
+    stub = get_provider("stub")  # no API key needed
+    assert stub.get_model_name() == "stub"
+    records = stub.complete_structured("", "## Project Experience\n\n### Churn Model\n- Built it.\n", ProjectRecord)
+    assert [r.title for r in records] == _extract_project_titles("## Project Experience\n\n### Churn Model\n"), records
+    assert stub.complete_structured_one("", "", DuplicateMatch).matched_id == ""
+    assert stub.complete("", "coverage?") == "NONE"
+
+check("stub provider answers offline without an API key", _stub_provider_check)
+
+
+def _profile_build(mode, tmp):
+    from resume_helper.builder.resume_builder import build_resume
+    from resume_helper.profiling import profile
+    paths = _tmp_user_paths(tmp)
+    ensure_user_dirs(paths)
+    out_dir = Path(tmp) / "profiles"
+    with _contextlib.redirect_stderr(_io.StringIO()), _contextlib.redirect_stdout(_io.StringIO()):
+        with profile(mode, out_dir, "build"):
+            build_resume(None, "Data Scientist\nModels.", None, None, "stub", None,
+                         user_paths=paths, docx_engine="native")
+    return sorted(p.name for p in out_dir.iterdir()), out_dir
+
+
+def _profile_cpu_check():
+    with tempfile.TemporaryDirectory() as tmp:
+        names, out_dir = _profile_build("cpu", tmp)
+        assert [Path(n).suffix for n in names] == [".prof", ".txt"], names
+        report = (out_dir / names[1]).read_text()
+        assert "build_resume" in report and "cumulative" in report
+
+check("--profile cpu writes a cProfile dump and a text summary", _profile_cpu_check)
+
+
+def _profile_keeps_inline_check():
+    import resume_helper.output.md2docx as md2docx
+    was_inline = md2docx.run_conversions_inline(True)  # as RESUME_HELPER_DOCX_WORKERS=0 sets it
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            _profile_build("cpu", tmp)
+        assert md2docx._inline, "profiling must restore the configured inline conversion"
+    finally:
+        md2docx.run_conversions_inline(was_inline)
+
+check("--profile restores the inline DOCX conversion setting", _profile_keeps_inline_check)
+
+
+def _profile_mem_check():
+    import re
+    with tempfile.TemporaryDirectory() as tmp:
+        names, out_dir = _profile_build("mem", tmp)
+        assert len(names) == 1 and names[0].endswith("_mem.txt"), names
+        report = (out_dir / names[0]).read_text()
+        for stage in ("load projects", "llm", "docx"):
+            assert re.search(rf"^\s+{stage}\s+[\d.]+\s+[\d.]+\s+[\d.]+$", report, re.MULTILINE), report
+        assert "Largest allocations kept by build/llm:" in report
+
+check("--profile mem reports per-stage peaks and top allocations", _profile_mem_check)
+
+# ---------------------------------------------------------------------------
+# Hot-path benchmarks
+# ---------------------------------------------------------------------------
+print("\n-- hot-path benchmarks --")
+
+
+def _hot_paths_check():
+    from benchmarks import bench_hot_paths
+    current = bench_hot_paths.run([10], repeat=1)
+    assert list(current["results"]) == bench_hot_paths.CASES
+    assert all(r["10"]["best_s"] >= 0 for r in current["results"].values())
+    slower = {"results": {case: {"10": {"best_s": r["10"]["best_s"] * 2 + 0.01, "median_s": 0}}
+                          for case, r in current["results"].items()}}
+    assert bench_hot_paths.compare(current, current, 1.25, 0.001) == []
+    regressions = bench_hot_paths.compare(slower, current, 1.25, 0.001)
+    assert len(regressions) == len(bench_hot_paths.CASES), regressions
+
+check("hot-path benchmark runs offline and flags regressions against a baseline", _hot_paths_check)
+
+# ---------------------------------------------------------------------------
+# Record / replay provider
+# ---------------------------------------------------------------------------
+print("\n-- record / replay provider --")
+
+
+def _replay_roundtrip_check():
+    from resume_helper.llm.replay_provider import ReplayProvider
+    from resume_helper.llm.stub_provider import StubProvider
+    from resume_helper.models import DuplicateMatch, ProjectRecord
+    prompt = "BASE RESUME\n\nProject: Churn Model\nSummary: Cut churn.\n\nJOB POSTING\n-----------\nData Scientist\n"
+    resume = "Project Experience\n\nChurn Model\nForecast Engine\n"
+    with tempfile.TemporaryDirectory() as tmp, _contextlib.redirect_stderr(_io.StringIO()):
+        recorder = ReplayProvider(tmp, inner=StubProvider())
+        streamed = list(recorder.complete_stream("sys", prompt))
+        records = recorder.complete_structured("sys", resume, ProjectRecord)
+        match = recorder.complete_structured_one("sys", "dup?", DuplicateMatch)
+        assert recorder.get_model_name() == "stub"
+
+        replay = ReplayProvider(tmp)
+        assert replay.get_model_name() == "replay"
+        assert list(replay.complete_stream("sys", prompt)) == streamed, "chunk boundaries kept"
+        assert replay.complete("sys", prompt) == "".join(streamed)
+        assert replay.complete_structured("sys", resume, ProjectRecord) == records
+        assert replay.complete_structured_one("sys", "dup?", DuplicateMatch) == match
+        try:
+            replay.complete("sys", "never recorded")
+        except ValueError as exc:
+            assert "--record" in str(exc)
+        else:
+            raise AssertionError("unrecorded request should raise")
+
+check("replay provider serves back every recorded call kind", _replay_roundtrip_check)
+
+
+def _wrap_provider_check():
+    from resume_helper.llm.cache import CachedProvider
+    from resume_helper.llm.registry import wrap_provider
+    from resume_helper.llm.replay_provider import ReplayProvider
+    from resume_helper.llm.stub_provider import StubProvider
+    inner = StubProvider()
+    assert wrap_provider(inner) is inner
+    with tempfile.TemporaryDirectory() as tmp:
+        llm = wrap_provider(inner, Path(tmp), refresh=True, record=True)
+        assert isinstance(llm, CachedProvider) and llm._dir == Path(tmp) / "llm" and llm._refresh
+        assert isinstance(llm._inner, ReplayProvider) and llm._inner._inner is inner
+
+check("wrap_provider layers the response cache over the recorder", _wrap_provider_check)
+
+
+def _replay_latency_check():
+    import random
+    import time as _time
+    from resume_helper.llm.replay_provider import ReplayProvider, parse_latency
+    from resume_helper.llm.stub_provider import StubProvider
+    rng = random.Random(0)
+    assert parse_latency(None)(rng, 3.0) == 0.0
+    assert parse_latency("recorded")(rng, 3.0) == 3.0
+    assert parse_latency("fixed:0.25")(rng, 3.0) == 0.25
+    assert parse_latency("normal:1,0")(rng, 3.0) == 1.0
+    assert parse_latency("lognormal:2,0")(rng, 3.0) == 2.0
+    for bad in ("bogus", "fixed", "normal:1", "fixed:-1", "fixed:x"):
+        try:
+            parse_latency(bad)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"{bad!r} should be rejected")
+    with tempfile.TemporaryDirectory() as tmp, _contextlib.redirect_stderr(_io.StringIO()):
+        ReplayProvider(tmp, inner=StubProvider()).complete("sys", "JOB POSTING\n---\nRole\n")
+        replay = ReplayProvider(tmp, latency="fixed:0.05")
+        start = _time.perf_counter()
+        assert "".join(replay.complete_stream("sys", "JOB POSTING\n---\nRole\n")).startswith("COMPANY:")
+        assert _time.perf_counter() - start >= 0.05
+
+check("replay latency specs parse and delay replayed streams", _replay_latency_check)
+
+# ---------------------------------------------------------------------------
+# SQLite projects store
+# ---------------------------------------------------------------------------
+print("\n-- sqlite projects store --")
+
+
+def _sqlite_roundtrip_check():
+    from benchmarks.synthetic import write_projects_json
+    from resume_helper.data.projects_sqlite import export_json, import_json
+    with tempfile.TemporaryDirectory() as tmp:
+        src = write_projects_json(Path(tmp) / "projects.json", 40)
+        data = json.loads(src.read_text())
+        data["projects"][3]["enabled"] = False
+        data["projects"][5] = {k: v for k, v in data["projects"][5].items() if k not in ("notes", "keywords")}
+        src.write_text(json.dumps(data, indent=2, ensure_ascii=False) + "\n")
+        db = Path(tmp) / "projects.db"
+        assert import_json(src, db) == 40
+        assert export_json(db, Path(tmp) / "out.json") == 40
+        assert (Path(tmp) / "out.json").read_text() == src.read_text(), "JSON -> SQLite -> JSON not lossless"
+        assert load_projects(str(db)) == load_projects(str(src))
+        for tag in ROLE_TAGS[:3]:
+            assert load_projects(str(db), tag) == filter_by_role_tag(load_projects(str(src)), tag)
+
+check("sqlite store round-trips projects.json and loads the same projects", _sqlite_roundtrip_check)
+
+
+def _sqlite_merge_check():
+    from resume_helper.data.projects_db import merge_projects
+    from resume_helper.data.projects_sqlite import _connect, _get_next_id, import_json
+    from resume_helper.models import ProjectRecord
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Path(tmp) / "projects.db"
+        json_path = Path(tmp) / "projects.json"
+        json_path.write_text(json.dumps({"projects": [
+            dict(_ranked_project("proj_007", "Churn Model", ["python"]), role_tags=["data_scientist"]),
+        ]}))
+        import_json(json_path, db)
+        existing = load_projects(str(db))
+        existing[0]["summary"] = "merged summary"
+        new = [
+            ProjectRecord(id="", title="Forecast Engine", summary="f", skills=["sql"],
+                          role_tags=["data_engineer"], impact=[]),
+            {"title": "churn model", "summary": "dup", "role_tags": ["data_scientist"]},
+        ]
+        added, merged = merge_projects(existing, new, str(db))
+        assert added == 1 and [p["id"] for p in merged] == ["proj_007", "proj_008"], merged
+        reloaded = load_projects(str(db))
+        assert reloaded[0]["summary"] == "merged summary", "update not written"
+        assert [p["title"] for p in load_projects(str(db), "data_engineer")] == ["Forecast Engine"]
+        conn = _connect(db)
+        assert _get_next_id(conn) == 9
+        conn.close()
+        try:
+            merge_projects([], [{"id": "bad", "title": "No Tags", "organization": "x"}], str(db))
+        except ValueError:
+            assert len(load_projects(str(db))) == 2, "failed merge should roll back"
+        else:
+            raise AssertionError("invalid project should be rejected")
+
+check("sqlite merge updates changed rows, inserts new ones and allocates IDs", _sqlite_merge_check)
+
+# ---------------------------------------------------------------------------
+# Memoized projects loader
+# ---------------------------------------------------------------------------
+print("\n-- memoized projects loader --")
+
+
+def _projects_cache_check():
+    import os
+    from benchmarks.synthetic import write_projects_json
+    from resume_helper.data import projects_db
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_projects_json(Path(tmp) / "projects.json", 30)
+        calls = []
+        real = projects_db._validate_file
+        projects_db._validate_file = lambda p: calls.append(p) or real(p)
+        try:
+            first = load_projects(str(path))
+            first[0]["title"] = "Edited by caller"
+            second = load_projects(str(path))
+            assert len(calls) == 1, "unchanged file should not be re-validated"
+            assert second[0]["title"] != "Edited by caller" and second[0] is not first[0]
+            tagged = load_projects(str(path), "data_scientist")
+            assert tagged == filter_by_role_tag(second, "data_scientist") and len(calls) == 1
+
+            data = json.loads(path.read_text())
+            data["projects"] = data["projects"][:5]
+            path.write_text(json.dumps(data))
+            st = path.stat()
+            os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+            assert len(load_projects(str(path))) == 5 and len(calls) == 2, "changed file not reloaded"
+        finally:
+            projects_db._validate_file = real
+            projects_db.clear_cache()
+
+check("load_projects memoizes per (path, mtime, size) and returns copies", _projects_cache_check)
+
+# ---------------------------------------------------------------------------
+# Role-mask filtering
+# ---------------------------------------------------------------------------
+print("\n-- role-mask filtering --")
+
+
+def _role_mask_filter_check():
+    from benchmarks.synthetic import projects
+    from resume_helper.data.projects_db import ProjectIndex, filter_projects
+    from resume_helper.models import ROLE_TAG_BITS, role_tag_mask
+    assert role_tag_mask(["data_scientist", "data_engineer"]) == ROLE_TAG_BITS["data_scientist"] | ROLE_TAG_BITS["data_engineer"]
+    records = projects(300)
+    index = ProjectIndex(records)
+    queries = [
+        {"any_tags": ["ai_engineer", "data_analyst"]},
+        {"all_tags": ["data_scientist", "data_engineer"]},
+        {"any_skills": ["SPARK"], "all_skills": ["python"]},
+        {"any_tags": ["data_engineer"], "all_skills": ["sql"]},
+    ]
+    for query in queries:
+        expected = [
+            p for p in records
+            if (not query.get("any_tags") or set(query["any_tags"]) & set(p["role_tags"]))
+            and set(query.get("all_tags", ())) <= set(p["role_tags"])
+            and (not query.get("any_skills") or {s.lower() for s in query["any_skills"]} & set(p["skills"]))
+            and set(query.get("all_skills", ())) <= set(p["skills"])
+        ]
+        assert expected, f"query matches nothing: {query}"
+        assert filter_projects(records, **query) == expected, query
+        assert [records[i] for i in index.positions(**query)] == expected, query
+    try:
+        filter_projects(records, any_tags=["not_a_real_tag"])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("unknown tag should be rejected")
+
+check("role-mask index and scan agree on any/all tag and skill filters", _role_mask_filter_check)
+
+
+def _multi_role_load_check():
+    from benchmarks.synthetic import write_projects_json
+    from resume_helper.data.projects_sqlite import import_json
+    from resume_helper.builder.resume_builder import _resolve_output_path
+    with tempfile.TemporaryDirectory() as tmp:
+        src = write_projects_json(Path(tmp) / "projects.json", 60)
+        db = Path(tmp) / "projects.db"
+        import_json(src, db)
+        roles = ["data_scientist", "ai_engineer"]
+        for match_all in (False, True):
+            from_json = load_projects(str(src), roles, match_all)
+            assert from_json == load_projects(str(db), roles, match_all), f"backends differ (all={match_all})"
+            test = all if match_all else any
+            assert from_json == [p for p in load_projects(str(src)) if test(r in p["role_tags"] for r in roles)]
+        assert _resolve_output_path(None, roles, Path(tmp)).name.startswith("resume_data_scientist+ai_engineer_")
+
+check("load_projects filters on several roles (any / all) for JSON and SQLite", _multi_role_load_check)
+
+# ---------------------------------------------------------------------------
+# Project search
+# ---------------------------------------------------------------------------
+print("\n-- project search --")
+
+
+def _search_ranking_check():
+    from benchmarks.synthetic import projects
+    from resume_helper.data.projects_db import ProjectIndex
+    records = projects(400)
+    index = ProjectIndex(records)
+
+    def _has(p, term):
+        return any(term in s.lower().split() for s in [p["title"], *p["skills"], *p["keywords"]])
+
+    both = index.search("Spark airflow")
+    assert both and {p["id"] for _, p in both} == {p["id"] for p in records if _has(p, "spark") and _has(p, "airflow")}
+    assert [s for s, _ in both] == sorted((s for s, _ in both), reverse=True), "not ranked"
+    either = index.search("spark airflow", match_any=True)
+    assert len(either) == sum(_has(p, "spark") or _has(p, "airflow") for p in records)
+    assert index.search("spark airflow", limit=5) == both[:5], "limited search differs from the full ranking"
+    tagged = index.search("spark", any_tags=["data_engineer"])
+    assert tagged and all("data_engineer" in p["role_tags"] for _, p in tagged)
+    assert index.search("no_such_term spark") == []
+
+check("search_projects ranks all-term / any-term matches, with role and limit", _search_ranking_check)
+
+
+def _search_after_merge_check():
+    from benchmarks.synthetic import write_projects_json
+    from resume_helper.data import projects_db
+    from resume_helper.data.project_view import ProjectView
+    from resume_helper.data.projects_db import ProjectIndex, load_project_index, search_projects
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(write_projects_json(Path(tmp) / "projects.json", 50))
+        existing = load_projects(path)
+        assert search_projects(path, "zeppelin") == []
+        existing[3]["skills"] = ["Zeppelin"]
+        new = {"title": "Zeppelin notebooks", "summary": "", "skills": ["Zeppelin", "Spark"],
+               "role_tags": ["data_engineer"], "impact": []}
+        projects_db.merge_projects(existing, [new], path)
+        carried = load_project_index(path)
+        rebuilt = ProjectIndex([ProjectView.from_record(p) for p in projects_db._validate_file(Path(path).resolve())])
+        assert carried.projects == rebuilt.projects
+        assert carried.term_index()._postings == rebuilt.term_index()._postings, "index not updated incrementally"
+        hits = search_projects(path, "zeppelin")
+        assert {p["id"] for _, p in hits} == {existing[3]["id"], new["id"]}
+        assert hits[0][1]["id"] == new["id"], "title + skill match should rank first"
+
+check("merge_projects carries the search index over to the merged file", _search_after_merge_check)
+
+# ---------------------------------------------------------------------------
+# Compact project views
+# ---------------------------------------------------------------------------
+print("\n-- compact project views --")
+
+
+def _project_view_check():
+    from benchmarks.synthetic import projects, write_projects_json
+    from resume_helper.builder.prompt_builder import _format_project, build_prompt
+    from resume_helper.data.project_view import ProjectView
+    from resume_helper.data.projects_db import load_project_views
+    from resume_helper.models import ProjectRecord
+    records = [ProjectRecord.model_validate(p) for p in projects(20)]
+    views = [ProjectView.from_record(r) for r in records]
+    dicts = [r.model_dump() for r in records]
+    assert [v.to_dict() for v in views] == dicts
+    assert not hasattr(views[0], "__dict__") and isinstance(views[0]["skills"], tuple)
+    assert views[0].get("no_such_field", "x") == "x" and "skills" in views[0]
+    assert [_format_project(v) for v in views] == [_format_project(d) for d in dicts]
+    assert build_prompt(None, "job", views, "s") == build_prompt(None, "job", dicts, "s")
+    try:
+        views[0].title = "changed"
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError("ProjectView should be read-only")
+    with tempfile.TemporaryDirectory() as tmp:
+        a = write_projects_json(Path(tmp) / "a.json", 5)
+        b = write_projects_json(Path(tmp) / "b.json", 5, seed=0)
+        va, vb = load_project_views(str(a)), load_project_views(str(b))
+        assert va[0]["skills"][0] is vb[0]["skills"][0], "skills not shared across files"
+        assert load_project_views(str(a)) == va and load_project_views(str(a))[0] is va[0], "views are copied"
+        assert [v.to_dict() for v in va] == load_projects(str(a))
+
+check("ProjectView round-trips model_dump and feeds build_prompt unchanged", _project_view_check)
+
 # ---------------------------------------------------------------------------
 # Summary
 # ---------------------------------------------------------------------------